@@ -12,11 +12,15 @@ Visit <https://github.com/jwodder/ghrepo> for more information.
 """
 
 from __future__ import annotations
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from functools import cache
 from os import PathLike
 import re
-import subprocess
-from typing import NamedTuple
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+# `subprocess` and `threading` are imported inside the functions that use them
+# so that they don't slow down startup of programs that don't need them.
 
 __version__ = "0.8.0.dev1"
 __author__ = "John Thorvald Wodder II"
@@ -25,19 +29,31 @@ __license__ = "MIT"
 __url__ = "https://github.com/jwodder/ghrepo"
 
 __all__ = [
+    "CacheInfo",
     "DetachedHeadError",
     "GHRepo",
     "GH_REPO_RGX",
     "GH_USER_RGX",
     "NoSuchRemoteError",
     "NoUpstreamError",
+    "ParseCache",
+    "ParseResults",
+    "RepoContext",
+    "RepoURLs",
     "get_current_branch",
     "get_local_repo",
+    "get_repo_context",
     "is_git_repo",
+    "is_github_url",
+    "is_valid_owner",
+    "is_valid_repo_name",
+    "render_urls",
 ]
 
 AnyPath = str | bytes | PathLike[str] | PathLike[bytes]
 
+BytesLike = bytes | bytearray | memoryview
+
 #: Regular expression for a valid GitHub username or organization name.  As of
 #: 2017-07-23, trying to sign up to GitHub with an invalid username or create
 #: an organization with an invalid name gives the message "Username may only
@@ -49,34 +65,136 @@ AnyPath = str | bytes | PathLike[str] | PathLike[bytes]
 #: current name restrictions were put in place, and so this regex also needs to
 #: accept names that contain underscores, contain multiple consecutive hyphens,
 #: begin with a hyphen, and/or end with a hyphen.
-GH_USER_RGX = r"(?![Nn][Oo][Nn][Ee]($|[^-A-Za-z0-9]))[-_A-Za-z0-9]+"
+#:
+#: Usernames are at most 39 characters long.  Bounding the length also bounds
+#: the work done by the regex engine, so that matching takes the same time no
+#: matter how long the input is.
+GH_USER_RGX = r"(?![Nn][Oo][Nn][Ee]($|[^-A-Za-z0-9]))[-_A-Za-z0-9]{1,39}"
 
 #: Regular expression for a valid GitHub repository name.  Testing as of
 #: 2017-05-21 indicates that repository names can be composed of alphanumeric
 #: ASCII characters, hyphens, periods, and/or underscores, with the names ``.``
 #: and ``..`` being reserved and names ending with ``.git`` (case insensitive)
-#: forbidden.
+#: forbidden.  Repository names are at most 100 characters long.
 GH_REPO_RGX = (
-    r"(?:\.?[-A-Za-z0-9_][-A-Za-z0-9_.]*|\.\.[-A-Za-z0-9_.]+)(?<!\.[Gg][Ii][Tt])"
+    r"(?:[-A-Za-z0-9_][-A-Za-z0-9_.]{0,99}"
+    r"|\.[-A-Za-z0-9_][-A-Za-z0-9_.]{0,98}"
+    r"|\.\.[-A-Za-z0-9_.]{1,98})"
+    r"(?<!\.[Gg][Ii][Tt])"
 )
 
 #: Convenience regular expression for ``<owner>/<name>``, including named
 #: capturing groups
 OWNER_NAME = rf"(?P<owner>{GH_USER_RGX})/(?P<name>{GH_REPO_RGX})"
 
-OWNER_REPO_CRGX = re.compile(rf"(?:(?P<owner>{GH_USER_RGX})/)?(?P<name>{GH_REPO_RGX})")
-
-GITHUB_URL_CREGEXEN = [
-    re.compile(
-        r"(?:(?i:https?)://(?:(?:[A-Za-z0-9-._~!$&'()*+,;=:]|%[0-9a-fA-F]{2})*@)?)?"
-        rf"(?i:(?:www\.)?github\.com)/{OWNER_NAME}(?:\.git)?/?"
-    ),
-    re.compile(rf"(?i:https?://)?(?i:api\.github\.com)/repos/{OWNER_NAME}"),
-    re.compile(rf"(?i:git://github\.com)/{OWNER_NAME}(?:\.git)?"),
-    re.compile(rf"git@(?i:github\.com):{OWNER_NAME}(?:\.git)?"),
-    re.compile(rf"(?i:ssh://)git@(?i:github\.com)/{OWNER_NAME}(?:\.git)?"),
+#: Source for `OWNER_REPO_CRGX`
+OWNER_REPO_RGX = rf"(?:(?P<owner>{GH_USER_RGX})/)?(?P<name>{GH_REPO_RGX})"
+
+#: Sources for `GITHUB_URL_CREGEXEN`
+GITHUB_URL_RGXEN = [
+    # The userinfo is limited to 256 characters & escapes so that, like the
+    # owner & name, it cannot make the regex engine scan arbitrarily far.
+    r"(?:(?i:https?)://"
+    r"(?:(?:[A-Za-z0-9-._~!$&'()*+,;=:]|%[0-9a-fA-F]{2}){0,256}@)?)?"
+    rf"(?i:(?:www\.)?github\.com)/{OWNER_NAME}(?:\.git)?/?",
+    rf"(?i:https?://)?(?i:api\.github\.com)/repos/{OWNER_NAME}",
+    rf"(?i:git://github\.com)/{OWNER_NAME}(?:\.git)?",
+    rf"git@(?i:github\.com):{OWNER_NAME}(?:\.git)?",
+    rf"(?i:ssh://)git@(?i:github\.com)/{OWNER_NAME}(?:\.git)?",
 ]
 
+# No string matched by `OWNER_REPO_RGX` is longer than this (a 39-character
+# owner, a slash, and a 100-character name), and no URL matched by
+# `GITHUB_URL_RGXEN` is longer than `_MAX_URL_LENGTH` (the longest being 937
+# characters, nearly all of them userinfo), so longer inputs can be rejected
+# without running the regexes.
+_MAX_SPEC_LENGTH = 140
+_MAX_URL_LENGTH = 1024
+
+# Compiling the regexes takes a few milliseconds, which is significant for
+# short-lived processes like the `ghrepo` command (which may not need them at
+# all), so they are only compiled on first use, by the cached functions below.
+# `OWNER_REPO_CRGX` and `GITHUB_URL_CREGEXEN` are provided via the module
+# `__getattr__()` further down.
+if TYPE_CHECKING:
+    OWNER_REPO_CRGX: re.Pattern[str]
+    GITHUB_URL_CREGEXEN: list[re.Pattern[str]]
+
+
+@cache
+def _owner_repo_crgx() -> re.Pattern[str]:
+    """Return the compiled `OWNER_REPO_RGX`"""
+    return re.compile(OWNER_REPO_RGX)
+
+
+@cache
+def _url_cregexen() -> list[re.Pattern[str]]:
+    """Return the compiled `GITHUB_URL_RGXEN`"""
+    return [re.compile(rgx) for rgx in GITHUB_URL_RGXEN]
+
+
+def _url_regex() -> str:
+    """
+    Return a regex that combines `GITHUB_URL_RGXEN` into one alternation, with
+    each form's owner & name groups numbered (``owner0``, ``name0``,
+    ``owner1``, etc.) so that they can be told apart
+    """
+    return "|".join(
+        src.replace(
+            OWNER_NAME,
+            rf"(?P<owner{i}>{GH_USER_RGX})/(?P<name{i}>{GH_REPO_RGX})",
+        )
+        for i, src in enumerate(GITHUB_URL_RGXEN)
+    )
+
+
+# `GHRepo.parse_url()` and the other URL parsing functions match their input
+# against the combined regex with a single `fullmatch()` call instead of
+# trying each pattern in `GITHUB_URL_CREGEXEN` in turn.  The name group is the
+# last group in each form, so the ``lastgroup`` of a match identifies the form
+# that matched; this maps it to the names of that form's owner & name groups.
+_URL_GROUPS: dict[str | None, tuple[str, str]] = {
+    f"name{i}": (f"owner{i}", f"name{i}") for i in range(len(GITHUB_URL_RGXEN))
+}
+
+
+@cache
+def _url_crgx() -> re.Pattern[str]:
+    """Return the compiled combined URL regex"""
+    return re.compile(_url_regex())
+
+
+@cache
+def _url_bytes_crgx() -> re.Pattern[bytes]:
+    """Return the compiled `bytes` version of the combined URL regex"""
+    return re.compile(_url_regex().encode("ascii"))
+
+
+@cache
+def _str_cregex(rgx: str) -> re.Pattern[str]:
+    """Return the compiled version of the regex source ``rgx``"""
+    return re.compile(rgx)
+
+
+@cache
+def _bytes_cregex(rgx: str) -> re.Pattern[bytes]:
+    """Return the compiled `bytes` version of the regex source ``rgx``"""
+    return re.compile(rgx.encode("ascii"))
+
+
+def __getattr__(name: str) -> Any:
+    if name == "OWNER_REPO_CRGX":
+        return _owner_repo_crgx()
+    elif name == "GITHUB_URL_CREGEXEN":
+        return _url_cregexen()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _casefold_key(owner: str, name: str) -> str:
+    """Return the `GHRepo.casefold_key` for the given owner & name"""
+    return f"{owner}/{name}".lower()
+
 
 class GHRepo(NamedTuple):
     """
@@ -120,6 +238,44 @@ class GHRepo(NamedTuple):
         """The URL for cloning the repository over SSH"""
         return f"git@github.com:{self.owner}/{self.name}.git"
 
+    @property
+    def casefold_key(self) -> str:
+        """
+        .. versionadded:: 0.8.0
+
+        A lowercased ``{owner}/{name}`` string that is the same for all
+        `GHRepo` instances that refer to the same repository.  GitHub owner &
+        repository names are case-insensitive, so ``GHRepo("Foo", "Bar")`` and
+        ``GHRepo("foo", "bar")`` are unequal but have the same key.
+        """
+        return _casefold_key(self.owner, self.name)
+
+    def urls(self) -> RepoURLs:
+        """
+        .. versionadded:: 0.8.0
+
+        Compute the repository's fullname and all of its URLs at once and
+        return them as a `RepoURLs` instance.  The URL properties of `GHRepo`
+        rebuild their strings on every access, so code that uses several URLs
+        of a repository or uses them repeatedly should call this method once
+        and read the fields of the result instead.  To do this for many
+        repositories at once, use `render_urls()`.
+        """
+        owner, name = self
+        return tuple.__new__(
+            RepoURLs,
+            (
+                owner,
+                name,
+                f"{owner}/{name}",
+                f"https://api.github.com/repos/{owner}/{name}",
+                f"https://github.com/{owner}/{name}.git",
+                f"git://github.com/{owner}/{name}.git",
+                f"https://github.com/{owner}/{name}",
+                f"git@github.com:{owner}/{name}.git",
+            ),
+        )
+
     @classmethod
     def parse(
         cls,
@@ -134,7 +290,11 @@ class GHRepo(NamedTuple):
         repository name are also accepted, and the resulting `GHRepo` instances
         will have their ``owner`` set to the given value.
         """
-        m = OWNER_REPO_CRGX.fullmatch(spec)
+        m = (
+            _owner_repo_crgx().fullmatch(spec)
+            if len(spec) <= _MAX_SPEC_LENGTH
+            else None
+        )
         if m:
             owner = m["owner"]
             if owner is None:
@@ -166,12 +326,381 @@ class GHRepo(NamedTuple):
 
         All other formats produce a `ValueError`.
         """
-        for crgx in GITHUB_URL_CREGEXEN:
-            m = crgx.fullmatch(url)
+        pair = _match_url(url)
+        if pair is None:
+            raise ValueError(f"Invalid GitHub URL: {_shorten(url)}")
+        return tuple.__new__(cls, pair)
+
+    @classmethod
+    def parse_bytes(
+        cls,
+        spec: BytesLike,
+        default_owner: str | Callable[[], str] | None = None,
+    ) -> GHRepo:
+        """
+        .. versionadded:: 0.8.0
+
+        Like `parse()`, but for a repository specifier given as a `bytes`,
+        `bytearray`, or `memoryview`.  The input is matched by `bytes` versions
+        of the regexes, and only the owner & name are decoded, so the whole
+        input is never decoded or copied.
+        """
+        m = (
+            _bytes_cregex(OWNER_REPO_RGX).fullmatch(spec)
+            if len(spec) <= _MAX_SPEC_LENGTH
+            else None
+        )
+        if m:
+            owner_bytes = m["owner"]
+            if owner_bytes is None:
+                if default_owner is None:
+                    raise ValueError(f"No owner given in {_shorten(spec)}")
+                elif callable(default_owner):
+                    owner = default_owner()
+                else:
+                    owner = default_owner
+            else:
+                owner = owner_bytes.decode("ascii")
+            return cls(owner=owner, name=m["name"].decode("ascii"))
+        else:
+            return cls.parse_url_bytes(spec)
+
+    @classmethod
+    def parse_url_bytes(cls, url: BytesLike) -> GHRepo:
+        """
+        .. versionadded:: 0.8.0
+
+        Like `parse_url()`, but for a URL given as a `bytes`, `bytearray`, or
+        `memoryview`.  The input is matched by `bytes` versions of the regexes,
+        and only the owner & name are decoded, so the whole input is never
+        decoded or copied.
+        """
+        m = _url_bytes_crgx().fullmatch(url) if len(url) <= _MAX_URL_LENGTH else None
+        if m:
+            owner, name = m.group(*_URL_GROUPS[m.lastgroup])
+            return tuple.__new__(cls, (owner.decode("ascii"), name.decode("ascii")))
+        raise ValueError(f"Invalid GitHub URL: {_shorten(url)}")
+
+    @classmethod
+    def parse_many(
+        cls,
+        specs: Iterable[str],
+        default_owner: str | Callable[[], str] | None = None,
+    ) -> ParseResults:
+        """
+        .. versionadded:: 0.8.0
+
+        Parse each GitHub repository specifier in ``specs`` as with `parse()`
+        and return a `ParseResults` instance.  Specifiers that cannot be parsed
+        are recorded in the ``failures`` list rather than raising an error.
+
+        If ``default_owner`` is a callable, it is called at most once, the
+        first time a specifier without an owner is encountered.
+        """
+        repos: list[GHRepo] = []
+        failures: list[tuple[int, str]] = []
+        add = repos.append
+        fail = failures.append
+        new = tuple.__new__
+        spec_match = _owner_repo_crgx().fullmatch
+        url_match = _url_crgx().fullmatch
+        url_groups = _URL_GROUPS
+        for i, spec in enumerate(specs):
+            n = len(spec)
+            if n > _MAX_URL_LENGTH:
+                fail((i, spec))
+                continue
+            m = spec_match(spec) if n <= _MAX_SPEC_LENGTH else None
+            if m:
+                owner, name = m.group("owner", "name")
+                if owner is None:
+                    if default_owner is None:
+                        fail((i, spec))
+                        continue
+                    elif callable(default_owner):
+                        default_owner = default_owner()
+                    owner = default_owner
+                add(new(cls, (owner, name)))
+                continue
+            m = url_match(spec)
             if m:
-                return cls(owner=m["owner"], name=m["name"])
+                add(new(cls, m.group(*url_groups[m.lastgroup])))
+            else:
+                fail((i, spec))
+        return ParseResults(repos, failures)
+
+    @classmethod
+    def parse_url_many(cls, urls: Iterable[str]) -> ParseResults:
+        """
+        .. versionadded:: 0.8.0
+
+        Parse each GitHub repository URL in ``urls`` as with `parse_url()` and
+        return a `ParseResults` instance.  URLs that cannot be parsed are
+        recorded in the ``failures`` list rather than raising an error.
+        """
+        repos: list[GHRepo] = []
+        failures: list[tuple[int, str]] = []
+        add = repos.append
+        fail = failures.append
+        new = tuple.__new__
+        url_match = _url_crgx().fullmatch
+        url_groups = _URL_GROUPS
+        for i, url in enumerate(urls):
+            m = url_match(url) if len(url) <= _MAX_URL_LENGTH else None
+            if m:
+                add(new(cls, m.group(*url_groups[m.lastgroup])))
+            else:
+                fail((i, url))
+        return ParseResults(repos, failures)
+
+
+class ParseResults(NamedTuple):
+    """
+    .. versionadded:: 0.8.0
+
+    The results of parsing a batch of repository specifiers or URLs with
+    `GHRepo.parse_many()` or `GHRepo.parse_url_many()`
+    """
+
+    #: The successfully-parsed repositories, in input order
+    repos: list[GHRepo]
+
+    #: ``(index, input)`` pairs for each input that could not be parsed, in
+    #: input order
+    failures: list[tuple[int, str]]
+
+
+class RepoURLs(NamedTuple):
+    """
+    .. versionadded:: 0.8.0
+
+    A repository's owner, name, fullname, and URLs, as returned by
+    `GHRepo.urls()` and `render_urls()`.  The fields are in the same order as
+    the keys of the object output by ``ghrepo --json``, so ``_asdict()``
+    produces the same object.
+    """
+
+    owner: str
+    name: str
+    #: The repository's ``{owner}/{name}`` fullname
+    fullname: str
+    #: Same as `GHRepo.api_url`
+    api_url: str
+    #: Same as `GHRepo.clone_url`
+    clone_url: str
+    #: Same as `GHRepo.git_url`
+    git_url: str
+    #: Same as `GHRepo.html_url`
+    html_url: str
+    #: Same as `GHRepo.ssh_url`
+    ssh_url: str
+
+
+def render_urls(repos: Iterable[GHRepo]) -> list[RepoURLs]:
+    """
+    .. versionadded:: 0.8.0
+
+    Return a `RepoURLs` instance for each repository in ``repos``, in order.
+    This is equivalent to ``[r.urls() for r in repos]``, but it builds all of
+    the results in a single comprehension without a method call per
+    repository, which makes it faster for large batches.
+    """
+    new = tuple.__new__
+    return [
+        new(
+            RepoURLs,
+            (
+                owner,
+                name,
+                f"{owner}/{name}",
+                f"https://api.github.com/repos/{owner}/{name}",
+                f"https://github.com/{owner}/{name}.git",
+                f"git://github.com/{owner}/{name}.git",
+                f"https://github.com/{owner}/{name}",
+                f"git@github.com:{owner}/{name}.git",
+            ),
+        )
+        for owner, name in repos
+    ]
+
+
+class CacheInfo(NamedTuple):
+    """
+    .. versionadded:: 0.8.0
+
+    Statistics about a `ParseCache`, as returned by `ParseCache.cache_info()`
+    """
+
+    #: The number of lookups that were answered from the cache
+    hits: int
+    #: The number of lookups that had to run the regexes
+    misses: int
+    #: The number of entries discarded to keep the cache within ``maxsize``
+    evictions: int
+    #: The maximum number of entries the cache will hold
+    maxsize: int
+    #: The number of entries currently in the cache
+    currsize: int
+
+
+class ParseCache:
+    """
+    .. versionadded:: 0.8.0
+
+    A bounded, thread-safe, least-recently-used cache of the results of
+    `GHRepo.parse()` and `GHRepo.parse_url()`.  The cache holds at most
+    ``maxsize`` entries; once full, the least-recently-used entry is discarded
+    to make room for each new one.
+
+    Inputs that fail to parse are cached as well, so that repeatedly looking up
+    the same invalid string raises the same `ValueError` without rerunning any
+    regexes.  The ``default_owner`` argument to `parse()` is not part of the
+    cache key; it is applied to the cached result on every lookup.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        #: The maximum number of entries the cache will hold
+        self.maxsize: int = maxsize
+        # Keys are ``(is_url, input)`` pairs.  Values are a `GHRepo` for a
+        # fully-parsed input, a `str` for a specifier consisting of just a
+        # repository name, or `None` for an invalid input.
+        self._entries: OrderedDict[tuple[bool, str], GHRepo | str | None] = (
+            OrderedDict()
+        )
+        from threading import Lock
+
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def parse(
+        self,
+        spec: str,
+        default_owner: str | Callable[[], str] | None = None,
+    ) -> GHRepo:
+        """
+        Parse a GitHub repository specifier as with `GHRepo.parse()`, consulting
+        & updating the cache
+        """
+        key = (False, spec)
+        r = self._get(key)
+        if isinstance(r, _Missing):
+            m = (
+                _owner_repo_crgx().fullmatch(spec)
+                if len(spec) <= _MAX_SPEC_LENGTH
+                else None
+            )
+            if m:
+                owner = m["owner"]
+                r = m["name"] if owner is None else GHRepo(owner, m["name"])
+            else:
+                pair = _match_url(spec)
+                r = None if pair is None else tuple.__new__(GHRepo, pair)
+            self._put(key, r)
+        if r is None:
+            raise ValueError(f"Invalid GitHub URL: {_shorten(spec)}")
+        elif isinstance(r, GHRepo):
+            return r
+        elif default_owner is None:
+            raise ValueError(f"No owner given in {spec!r}")
+        elif callable(default_owner):
+            return GHRepo(default_owner(), r)
         else:
-            raise ValueError(f"Invalid GitHub URL: {url!r}")
+            return GHRepo(default_owner, r)
+
+    def parse_url(self, url: str) -> GHRepo:
+        """
+        Parse a GitHub repository URL as with `GHRepo.parse_url()`, consulting
+        & updating the cache
+        """
+        key = (True, url)
+        r = self._get(key)
+        if isinstance(r, _Missing):
+            pair = _match_url(url)
+            r = None if pair is None else tuple.__new__(GHRepo, pair)
+            self._put(key, r)
+        if r is None:
+            raise ValueError(f"Invalid GitHub URL: {_shorten(url)}")
+        assert isinstance(r, GHRepo)
+        return r
+
+    def cache_info(self) -> CacheInfo:
+        """Return a `CacheInfo` describing the cache's current statistics"""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """Remove all entries from the cache and reset its statistics"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def _get(self, key: tuple[bool, str]) -> GHRepo | str | None | _Missing:
+        with self._lock:
+            try:
+                r = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return r
+
+    def _put(self, key: tuple[bool, str], value: GHRepo | str | None) -> None:
+        with self._lock:
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+
+class _Missing:
+    pass
+
+
+_MISSING = _Missing()
+
+
+def _match_url(url: str) -> tuple[str, str] | None:
+    """
+    Match ``url`` against the URL forms in `GITHUB_URL_RGXEN`, returning the
+    repository's owner & name or `None` if it does not match
+    """
+    if len(url) > _MAX_URL_LENGTH:
+        return None
+    m = _url_crgx().fullmatch(url)
+    if m is None:
+        return None
+    owner, name = _URL_GROUPS[m.lastgroup]
+    return (m[owner], m[name])
+
+
+def _shorten(s: str | BytesLike) -> str:
+    """
+    Return the `repr()` of ``s`` for use in an error message, truncated if
+    ``s`` is too long to be a URL so that reporting an oversized input doesn't
+    cost time proportional to its length.  Byte strings are shown as `bytes`.
+    """
+    n = len(s)
+    if isinstance(s, str):
+        unit = "characters"
+    else:
+        unit = "bytes"
+        s = bytes(s[:100] if n > _MAX_URL_LENGTH else s)
+    if n > _MAX_URL_LENGTH:
+        return f"{s[:100]!r}... ({n} {unit})"
+    return repr(s)
 
 
 def get_local_repo(dirpath: AnyPath | None = None, remote: str = "origin") -> GHRepo:
@@ -183,6 +712,8 @@ def get_local_repo(dirpath: AnyPath | None = None, remote: str = "origin") -> GH
     a different Git error occurs, such as the given path not being in a Git
     repository.
     """
+    import subprocess
+
     try:
         url = readgit("remote", "get-url", "--", remote, dirpath=dirpath)
     except subprocess.CalledProcessError as e:
@@ -206,6 +737,8 @@ def get_branch_upstream(branch: str, dirpath: AnyPath | None = None) -> GHRepo:
     exist).  Raises `subprocess.CalledProcessError` if a different Git error
     occurs, such as the given path not being in a Git repository.
     """
+    import subprocess
+
     try:
         upstream = readgit(
             "config", "--get", "--", f"branch.{branch}.remote", dirpath=dirpath
@@ -218,6 +751,130 @@ def get_branch_upstream(branch: str, dirpath: AnyPath | None = None) -> GHRepo:
     return get_local_repo(dirpath, remote=upstream)
 
 
+class RepoContext(NamedTuple):
+    """
+    .. versionadded:: 0.8.0
+
+    Information about a local Git repository's current branch & remotes, as
+    returned by `get_repo_context()`
+    """
+
+    #: The current branch, or `None` if the repository is in a detached
+    #: ``HEAD`` state
+    branch: str | None
+    #: The name of the current branch's upstream remote, or `None` if the
+    #: repository is in a detached ``HEAD`` state or the branch does not have
+    #: an upstream remote configured
+    upstream_remote: str | None
+    #: A mapping from the names of the repository's remotes to their URLs
+    remote_urls: dict[str, str]
+    #: A mapping from the names of the repository's remotes to the GitHub
+    #: repositories for their URLs; remotes whose URLs are not GitHub URLs are
+    #: omitted
+    remote_repos: dict[str, GHRepo]
+
+    @property
+    def upstream(self) -> GHRepo | None:
+        """
+        The GitHub repository for the current branch's upstream remote, or
+        `None` if there is no upstream remote or it is not a GitHub repository
+        """
+        if self.upstream_remote is None:
+            return None
+        return self.remote_repos.get(self.upstream_remote)
+
+
+def get_repo_context(dirpath: AnyPath | None = None) -> RepoContext:
+    """
+    .. versionadded:: 0.8.0
+
+    Determine the current branch, the branch's upstream remote, and the URLs &
+    GitHub repositories for all remotes of the Git repository located at or
+    containing the directory ``dirpath`` (default: the current directory),
+    running only a single ``git config`` command.  This is cheaper than calling
+    `get_current_branch()`, `get_branch_upstream()`, and `get_local_repo()`
+    separately, which run three ``git`` commands between them.
+
+    The current branch is determined by reading the repository's ``HEAD`` file
+    directly; for repository layouts that `ghrepo.gitdir` does not support,
+    an additional ``git symbolic-ref`` command is run.  As with
+    `get_local_repo()`, only remotes configured in the repository's own
+    configuration are included, and ``url.<base>.insteadOf`` rewrites are
+    applied to their URLs.  Remotes without a configured URL are omitted.
+
+    Requires Git 2.26 or higher.  Raises `subprocess.CalledProcessError` if a
+    Git error occurs, such as the given path not being in a Git repository.
+    """
+    import subprocess
+
+    # `ghrepo.gitdir` imports from this module, so it can't be imported at the
+    # top level.
+    from .gitdir import ConfigEntry, GitConfig, rewrite_url
+
+    branch: str | None
+    try:
+        branch = get_current_branch(dirpath)
+    except DetachedHeadError:
+        branch = None
+    try:
+        output = subprocess.run(
+            [
+                "git",
+                "config",
+                "-z",
+                "--show-scope",
+                "--get-regexp",
+                r"^(remote|branch|url)\.",
+            ],
+            cwd=dirpath,
+            stdout=subprocess.PIPE,
+            text=True,
+            check=True,
+        ).stdout
+    except subprocess.CalledProcessError as e:
+        if e.returncode == 1:
+            # No matching variables
+            output = ""
+        else:
+            raise  # pragma: no cover
+    cfg = GitConfig()
+    fields = output.split("\0")
+    # Each entry is output as "{scope}\0{key}\n{value}\0" (or
+    # "{scope}\0{key}\0" for a variable set without a value), so the output
+    # (minus the trailing NUL) consists of alternating scopes & variables.
+    for scope, var in zip(fields[0:-1:2], fields[1::2]):
+        key, nl, value = var.partition("\n")
+        cfg.entries.append(ConfigEntry(key, value if nl else None, scope))
+    remotes: dict[str, list[str | None]] = {}
+    for entry in cfg.entries:
+        key = entry.key
+        if entry.scope in ("local", "worktree") and key.startswith("remote."):
+            remotes.setdefault(key[len("remote.") : key.rindex(".")], [])
+    for entry in cfg.entries:
+        key = entry.key
+        if key.startswith("remote.") and key.endswith(".url"):
+            name = key[len("remote.") : -len(".url")]
+            if name in remotes:
+                remotes[name].append(entry.value)
+    remote_urls: dict[str, str] = {}
+    remote_repos: dict[str, GHRepo] = {}
+    for name, urls in remotes.items():
+        if not urls or not urls[0]:
+            continue
+        remote_urls[name] = url = rewrite_url(urls[0], cfg)
+        if (pair := _match_url(url)) is not None:
+            remote_repos[name] = tuple.__new__(GHRepo, pair)
+    upstream: str | None = None
+    if branch is not None:
+        upstream = cfg.get(f"branch.{branch}.remote")
+    return RepoContext(
+        branch=branch,
+        upstream_remote=upstream,
+        remote_urls=remote_urls,
+        remote_repos=remote_repos,
+    )
+
+
 def get_current_branch(dirpath: AnyPath | None = None) -> str:
     """
     Get the current branch for the Git repository located at or containing the
@@ -225,7 +882,31 @@ def get_current_branch(dirpath: AnyPath | None = None) -> str:
     `DetachedHeadError` if the repository is in a detached ``HEAD`` state.
     Raises `subprocess.CalledProcessError` if a different Git error occurs,
     such as the given path not being in a Git repository.
+
+    .. versionchanged:: 0.8.0
+
+        The branch is now determined by reading the repository's ``HEAD`` file
+        directly (including in linked worktrees & submodules) rather than by
+        running ``git``, which is only done for repository layouts that
+        `ghrepo.gitdir` does not support.  As a consequence, the full name of
+        the branch is now always returned, even if it is ambiguous with the
+        name of a tag or other ref.
     """
+    # `ghrepo.gitdir` imports from this module, so it can't be imported at the
+    # top level.
+    from .gitdir import Unsupported, find_git_dir, read_head_branch
+
+    try:
+        gitdir = find_git_dir(dirpath)
+        if gitdir is not None:
+            branch = read_head_branch(gitdir)
+            if branch is None:
+                raise DetachedHeadError()
+            return branch
+    except (Unsupported, OSError, UnicodeDecodeError):
+        pass
+    import subprocess
+
     try:
         return readgit("symbolic-ref", "--short", "-q", "HEAD", dirpath=dirpath)
     except subprocess.CalledProcessError as e:
@@ -240,6 +921,8 @@ def is_git_repo(dirpath: AnyPath | None = None) -> bool:
     Tests whether the given directory (default: the current directory) is
     either a Git repository or contained in one
     """
+    import subprocess
+
     r = subprocess.run(
         ["git", "rev-parse", "--git-dir"],
         cwd=dirpath,
@@ -249,7 +932,54 @@ def is_git_repo(dirpath: AnyPath | None = None) -> bool:
     return bool(r.returncode == 0)
 
 
+def is_valid_owner(owner: str) -> bool:
+    """
+    .. versionadded:: 0.8.0
+
+    Test whether ``owner`` is a valid GitHub username or organization name, as
+    matched by `GH_USER_RGX`.  Unlike parsing, this never constructs a `GHRepo`
+    or raises an exception.
+    """
+    return len(owner) <= 39 and _str_cregex(GH_USER_RGX).fullmatch(owner) is not None
+
+
+def is_valid_repo_name(name: str) -> bool:
+    """
+    .. versionadded:: 0.8.0
+
+    Test whether ``name`` is a valid GitHub repository name, as matched by
+    `GH_REPO_RGX`.  Unlike parsing, this never constructs a `GHRepo` or raises
+    an exception.
+    """
+    return len(name) <= 100 and _str_cregex(GH_REPO_RGX).fullmatch(name) is not None
+
+
+def is_github_url(url: str) -> bool:
+    """
+    .. versionadded:: 0.8.0
+
+    Test whether ``url`` is a GitHub repository URL accepted by
+    `GHRepo.parse_url()`.  Unlike `GHRepo.parse_url()`, this never constructs
+    a `GHRepo` or raises & catches a `ValueError` for invalid URLs.
+    """
+    return _match_url(url) is not None
+
+
+#: If set, `readgit()` runs Git commands by calling this instead of starting
+#: ``git`` itself; see `ghrepo.instrument.Instrumentation.install()`
+_readgit_hook: Callable[..., str] | None = None
+
+
 def readgit(*args: str, dirpath: AnyPath | None) -> str:
+    if _readgit_hook is not None:
+        return _readgit_hook(*args, dirpath=dirpath)
+    return _spawn_readgit(*args, dirpath=dirpath)
+
+
+def _spawn_readgit(*args: str, dirpath: AnyPath | None) -> str:
+    """Run ``git`` in a new process, as `readgit()` does when no hook is set"""
+    import subprocess
+
     return subprocess.run(
         ["git", *args],
         cwd=dirpath,
@@ -1,27 +1,123 @@
 from __future__ import annotations
-import argparse
-import json
-import subprocess
+from collections.abc import Iterable, Iterator
+from itertools import chain, islice
+import os
 import sys
-from . import NoSuchRemoteError, __version__, get_local_repo
+from typing import IO, TYPE_CHECKING
+from . import (
+    GHRepo,
+    NoSuchRemoteError,
+    RepoURLs,
+    __version__,
+    get_local_repo,
+    is_valid_owner,
+)
+
+# `argparse`, `json`, and `subprocess` are only imported when needed so that
+# the common case of ``ghrepo [dirpath]`` starts up as quickly as possible.
+if TYPE_CHECKING:
+    import argparse
+    from .extract import RepoMatch
+
+#: The number of input lines processed at a time by ``ghrepo parse``
+PARSE_CHUNK_SIZE = 8192
 
 
 def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    # Subcommand names take precedence over directories of the same name,
+    # which can be given as ``./NAME`` or ``-- NAME`` instead.
+    if argv[:1] == ["parse"]:
+        return parse_main(argv[1:])
+    elif argv[:1] == ["scan"]:
+        return scan_main(argv[1:])
+    elif argv[:1] == ["extract"]:
+        return extract_main(argv[1:])
+    elif not argv or (len(argv) == 1 and not argv[0].startswith("-")):
+        # Fast path for invocations without any options, which don't need the
+        # overhead of building an argument parser
+        return show_repo(argv[0] if argv else None)
+    elif argv == ["-V"] or argv == ["--version"]:
+        # Likewise, print the same output as argparse's "version" action
+        # without building the parser
+        print(f"{os.path.basename(sys.argv[0])} {__version__}")
+        return 0
+    import argparse
+
     parser = argparse.ArgumentParser(description="Show current GitHub repository")
-    parser.add_argument("-J", "--json", action="store_true", help="Output JSON")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Use & update the on-disk cache of local repositories' remotes",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=None,
+        help="Number of directories to resolve at once in batch mode",
+    )
+    parser.add_argument(
+        "-J",
+        "--json",
+        action="store_true",
+        help="Output JSON (JSON Lines in batch mode)",
+    )
     parser.add_argument(
         "-r",
         "--remote",
         default="origin",
         help="Parse the GitHub URL from the given remote [default: origin]",
     )
+    parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Also read directory paths from standard input, one per line",
+    )
     parser.add_argument(
         "-V", "--version", action="version", version=f"%(prog)s {__version__}"
     )
-    parser.add_argument("dirpath", nargs="?")
+    parser.add_argument("dirpath", nargs="*")
     args = parser.parse_args(argv)
+    if args.stdin or len(args.dirpath) > 1:
+        dirpaths: Iterable[str] = args.dirpath
+        if args.stdin:
+            dirpaths = chain(dirpaths, iter_stdin_paths())
+        return show_repos(
+            dirpaths,
+            remote=args.remote,
+            use_json=args.json,
+            use_cache=args.cache,
+            jobs=args.jobs,
+        )
+    return show_repo(
+        args.dirpath[0] if args.dirpath else None,
+        remote=args.remote,
+        use_json=args.json,
+        use_cache=args.cache,
+    )
+
+
+def show_repo(
+    dirpath: str | None,
+    remote: str = "origin",
+    use_json: bool = False,
+    use_cache: bool = False,
+) -> int:
+    """
+    Print the GitHub repository for the given remote of the local repository
+    at ``dirpath`` and return the command's exit status
+    """
+    import subprocess
+
     try:
-        r = get_local_repo(args.dirpath, remote=args.remote)
+        if use_cache:
+            from .diskcache import LocalRepoCache
+
+            r = LocalRepoCache().get_local_repo(dirpath, remote=remote)
+        else:
+            r = get_local_repo(dirpath, remote=remote)
     except subprocess.CalledProcessError as e:
         return e.returncode
     except NoSuchRemoteError:
@@ -29,26 +125,396 @@ def main(argv: list[str] | None = None) -> int:
     except ValueError as e:
         print(f"ghrepo: {e}", file=sys.stderr)
         return 1
-    if args.json:
-        print(
-            json.dumps(
-                {
-                    "owner": r.owner,
-                    "name": r.name,
-                    "fullname": str(r),
-                    "api_url": r.api_url,
-                    "clone_url": r.clone_url,
-                    "git_url": r.git_url,
-                    "html_url": r.html_url,
-                    "ssh_url": r.ssh_url,
-                },
-                indent=4,
-            )
-        )
+    if use_json:
+        import json
+
+        print(json.dumps(r.urls()._asdict(), indent=4))
     else:
         print(r)
     return 0
 
 
+def show_repos(
+    dirpaths: Iterable[str],
+    remote: str = "origin",
+    use_json: bool = False,
+    use_cache: bool = False,
+    jobs: int | None = None,
+) -> int:
+    """
+    Print the GitHub repository for the given remote of each local repository
+    in ``dirpaths``, resolving them concurrently, and return the command's
+    exit status: 0 if every repository was resolved, 2 if none were, and 1
+    otherwise
+    """
+    import json
+    from .scan import resolve_repos
+
+    cache = None
+    if use_cache:
+        from .diskcache import LocalRepoCache
+
+        cache = LocalRepoCache()
+    successes = failures = 0
+    for r in resolve_repos(dirpaths, remote=remote, max_workers=jobs, cache=cache):
+        if r.repo is not None:
+            successes += 1
+        else:
+            failures += 1
+        if use_json:
+            rec: dict[str, str | None] = {"path": str(r.path)}
+            if r.repo is not None:
+                rec.update(r.repo.urls()._asdict())
+                rec["error"] = None
+            else:
+                rec.update(dict.fromkeys(RepoURLs._fields))
+                rec["error"] = str(r.error)
+            print(json.dumps(rec), flush=True)
+        elif r.repo is not None:
+            print(f"{r.path}\t{r.repo}", flush=True)
+        else:
+            print(f"ghrepo: {r.path}: {r.error}", file=sys.stderr, flush=True)
+    if failures == 0:
+        return 0
+    elif successes == 0:
+        return 2
+    else:
+        return 1
+
+
+def iter_stdin_paths() -> Iterator[str]:
+    """Yield the nonempty lines of standard input, without line endings"""
+    for line in sys.stdin:
+        path = line.rstrip("\r\n")
+        if path:
+            yield path
+
+
+def parse_main(argv: list[str]) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="ghrepo parse",
+        description=(
+            "Parse GitHub repository specifiers or URLs read line by line from"
+            " files or standard input"
+        ),
+    )
+    parser.add_argument(
+        "-d",
+        "--default-owner",
+        help="Owner to use for lines that consist of just a repository name",
+    )
+    parser.add_argument(
+        "-F",
+        "--format",
+        choices=["text", "jsonl", "csv"],
+        default="text",
+        help="Output format [default: text]",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=None,
+        help="Parse in parallel in the given number of processes",
+    )
+    parser.add_argument(
+        "--invalid",
+        choices=["report", "skip"],
+        default="report",
+        help=(
+            "Whether to report invalid lines on stderr (and exit nonzero) or"
+            " silently skip them [default: report]"
+        ),
+    )
+    parser.add_argument(
+        "-u", "--url", action="store_true", help="Only accept GitHub URLs"
+    )
+    parser.add_argument(
+        "infile",
+        nargs="*",
+        default=["-"],
+        help="Files to read from; '-' means standard input [default: -]",
+    )
+    args = parser.parse_args(argv)
+    if args.default_owner is not None and not is_valid_owner(args.default_owner):
+        parser.error(f"invalid default owner: {args.default_owner!r}")
+    out = sys.stdout
+    if args.format == "csv":
+        out.write("owner,name\n")
+    ok = True
+    for path in args.infile:
+        try:
+            if args.jobs is not None:
+                ok = parse_parallel(path, out, args) and ok
+            elif path == "-":
+                ok = parse_stream(sys.stdin, "<stdin>", out, args) and ok
+            else:
+                with open(path, encoding="utf-8") as fp:
+                    ok = parse_stream(fp, path, out, args) and ok
+        except OSError as e:
+            out.flush()
+            report_os_error(path, e)
+            ok = False
+    out.flush()
+    return 0 if ok else 1
+
+
+def positive_int(s: str) -> int:
+    """An argparse type for integers greater than zero"""
+    try:
+        n = int(s)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise ValueError(s)
+    return n
+
+
+def parse_stream(
+    fp: IO[str], filename: str, out: IO[str], args: argparse.Namespace
+) -> bool:
+    """
+    Parse each line of ``fp`` and write the results to ``out``,
+    processing `PARSE_CHUNK_SIZE` lines at a time.  Returns `False` if any
+    invalid lines were reported.
+    """
+    ok = True
+    # Owners & repository names (including the default owner, which
+    # `parse_main()` validates) never contain characters that need escaping in
+    # JSON or quoting in CSV, so records can be formatted directly.
+    if args.format == "jsonl":
+        fmt = '{{"owner": "{0}", "name": "{1}"}}'.format
+    elif args.format == "csv":
+        fmt = "{0},{1}".format
+    else:
+        fmt = "{0}/{1}".format
+    for lineno0, chunk in iter_chunks(fp, PARSE_CHUNK_SIZE):
+        if args.url:
+            results = GHRepo.parse_url_many(chunk)
+        else:
+            results = GHRepo.parse_many(chunk, default_owner=args.default_owner)
+        if results.repos:
+            out.write("\n".join([fmt(*r) for r in results.repos]))
+            out.write("\n")
+        if args.invalid == "report":
+            ok = report_failures(filename, lineno0, results.failures) and ok
+    return ok
+
+
+def parse_parallel(path: str, out: IO[str], args: argparse.Namespace) -> bool:
+    """
+    Parse each line of the file at ``path`` (or standard input, if ``path`` is
+    ``"-"``) in ``args.jobs`` worker processes and write the results to
+    ``out``.  Returns `False` if any invalid lines were reported.
+    """
+    from .parallel import parse_file_parallel
+    from .parallel import parse_parallel as parse_iter_parallel
+
+    ok = True
+    if path == "-":
+        filename = "<stdin>"
+        chunks = parse_iter_parallel(
+            (ln.strip() for ln in sys.stdin),
+            url_only=args.url,
+            default_owner=args.default_owner,
+            max_workers=args.jobs,
+            chunk_size=PARSE_CHUNK_SIZE,
+        )
+    else:
+        filename = path
+        chunks = parse_file_parallel(
+            path,
+            url_only=args.url,
+            default_owner=args.default_owner,
+            max_workers=args.jobs,
+        )
+    lineno0 = 1
+    for chunk in chunks:
+        if chunk.packed:
+            # The fullnames can be converted to the other formats with plain
+            # string replacements, as owners & names never contain slashes,
+            # commas, or quotation marks.
+            if args.format == "jsonl":
+                block = (
+                    '{"owner": "'
+                    + chunk.packed.replace("/", '", "name": "').replace(
+                        "\n", '"}\n{"owner": "'
+                    )
+                    + '"}'
+                )
+            elif args.format == "csv":
+                block = chunk.packed.replace("/", ",")
+            else:
+                block = chunk.packed
+            out.write(block)
+            out.write("\n")
+        if args.invalid == "report":
+            ok = report_failures(filename, lineno0, chunk.failures) and ok
+        lineno0 += chunk.size
+    return ok
+
+
+def report_os_error(path: str, e: OSError) -> None:
+    """Report an error reading the input file at ``path`` on stderr"""
+    print(f"ghrepo: {path}: {e.strerror or e}", file=sys.stderr)
+
+
+def report_failures(
+    filename: str, lineno0: int, failures: list[tuple[int, str]]
+) -> bool:
+    """
+    Report each non-blank line in ``failures`` (as ``(index, line)`` pairs
+    relative to line number ``lineno0``) on stderr.  Returns `False` if any
+    lines were reported.
+    """
+    ok = True
+    for i, spec in failures:
+        if not spec:
+            # Blank lines are ignored.
+            continue
+        ok = False
+        print(
+            f"ghrepo: {filename}:{lineno0 + i}: Invalid repository: {spec!r}",
+            file=sys.stderr,
+        )
+    return ok
+
+
+def iter_chunks(lines: Iterable[str], size: int) -> Iterator[tuple[int, list[str]]]:
+    """
+    Yield lists of at most ``size`` stripped lines from ``lines``, each paired
+    with the 1-based line number of its first entry
+    """
+    lineno = 1
+    it = iter(lines)
+    while True:
+        chunk = [ln.strip() for ln in islice(it, size)]
+        if not chunk:
+            return
+        yield (lineno, chunk)
+        lineno += len(chunk)
+
+
+def scan_main(argv: list[str]) -> int:
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(
+        prog="ghrepo scan",
+        description=(
+            "Show the GitHub repository for each Git repository under a"
+            " directory tree"
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=None,
+        help="Number of repositories to resolve at once",
+    )
+    parser.add_argument("-J", "--json", action="store_true", help="Output JSON Lines")
+    parser.add_argument(
+        "--nested",
+        action="store_true",
+        help="Also look for repositories inside other repositories",
+    )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Use a process pool instead of a thread pool",
+    )
+    parser.add_argument(
+        "-r",
+        "--remote",
+        default="origin",
+        help="Parse the GitHub URL from the given remote [default: origin]",
+    )
+    parser.add_argument("root", nargs="?", default=".")
+    args = parser.parse_args(argv)
+    from .scan import scan_repos
+
+    ok = True
+    for r in scan_repos(
+        args.root,
+        remote=args.remote,
+        max_workers=args.jobs,
+        use_processes=args.processes,
+        nested=args.nested,
+    ):
+        if r.error is not None:
+            ok = False
+        if args.json:
+            rec: dict[str, str | None] = {"path": str(r.path)}
+            if r.repo is not None:
+                rec.update(owner=r.repo.owner, name=r.repo.name, error=None)
+            else:
+                rec.update(owner=None, name=None, error=str(r.error))
+            print(json.dumps(rec), flush=True)
+        elif r.repo is not None:
+            print(f"{r.path}\t{r.repo}", flush=True)
+        else:
+            print(f"ghrepo: {r.path}: {r.error}", file=sys.stderr, flush=True)
+    return 0 if ok else 1
+
+
+def extract_main(argv: list[str]) -> int:
+    import argparse
+    from collections import Counter
+    import stat
+    from .extract import find_repos_in_file, find_repos_in_stream
+
+    parser = argparse.ArgumentParser(
+        prog="ghrepo extract",
+        description="Extract GitHub repository URLs from files or standard input",
+    )
+    parser.add_argument(
+        "-c",
+        "--count",
+        action="store_true",
+        help="Output the number of occurrences of each repository",
+    )
+    parser.add_argument(
+        "infile",
+        nargs="*",
+        default=["-"],
+        help="Files to read from; '-' means standard input [default: -]",
+    )
+    args = parser.parse_args(argv)
+    counts: Counter[GHRepo] = Counter()
+    ok = True
+    for path in args.infile:
+        try:
+            if path == "-":
+                matches = find_repos_in_stream(sys.stdin)
+            elif stat.S_ISREG(os.stat(path).st_mode):
+                matches = find_repos_in_file(path)
+            else:
+                # Pipes & the like can't be memory-mapped.
+                matches = iter_stream_repos(path)
+            for m in matches:
+                counts[m.repo] += 1
+        except OSError as e:
+            report_os_error(path, e)
+            ok = False
+    if args.count:
+        lines = [f"{n}\t{r}" for r, n in counts.most_common()]
+    else:
+        lines = [str(r) for r in counts]
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+    return 0 if ok else 1
+
+
+def iter_stream_repos(path: str) -> Iterator[RepoMatch]:
+    """Open the non-regular file at ``path`` and scan it as a text stream"""
+    from .extract import find_repos_in_stream
+
+    with open(path, encoding="utf-8", errors="surrogateescape") as fp:
+        yield from find_repos_in_stream(fp)
+
+
 if __name__ == "__main__":
     sys.exit(main())  # pragma: no cover
@@ -0,0 +1,150 @@
+"""
+.. versionadded:: 0.8.0
+
+asyncio-native versions of the Git inspection functions
+
+The coroutines in this module behave the same as the functions of the same
+names in the top-level `ghrepo` module, but they run ``git`` with
+`asyncio.create_subprocess_exec()` instead of blocking on `subprocess.run()`.
+Each one accepts an optional ``limiter`` (such as an `asyncio.Semaphore`) that
+is held while ``git`` is running, so that many lookups can be started at once
+without exhausting the process's file descriptors.
+"""
+
+from __future__ import annotations
+import asyncio
+from contextlib import AbstractAsyncContextManager, nullcontext
+import locale
+import subprocess
+from . import (
+    AnyPath,
+    DetachedHeadError,
+    GHRepo,
+    NoSuchRemoteError,
+    NoUpstreamError,
+)
+
+__all__ = [
+    "get_branch_upstream",
+    "get_current_branch",
+    "get_local_repo",
+    "is_git_repo",
+]
+
+Limiter = AbstractAsyncContextManager[object]
+
+
+async def get_local_repo(
+    dirpath: AnyPath | None = None,
+    remote: str = "origin",
+    limiter: Limiter | None = None,
+) -> GHRepo:
+    """
+    Determine the GitHub repository for the Git repository located at or
+    containing the directory ``dirpath`` (default: the current directory) by
+    parsing the URL for the specified remote.  Raises `NoSuchRemoteError` if
+    the given remote does not exist.  Raises `subprocess.CalledProcessError` if
+    a different Git error occurs, such as the given path not being in a Git
+    repository.
+    """
+    try:
+        url = await readgit(
+            "remote", "get-url", "--", remote, dirpath=dirpath, limiter=limiter
+        )
+    except subprocess.CalledProcessError as e:
+        if e.returncode == 2:
+            raise NoSuchRemoteError(remote)
+        else:
+            raise
+    return GHRepo.parse_url(url)
+
+
+async def get_branch_upstream(
+    branch: str,
+    dirpath: AnyPath | None = None,
+    limiter: Limiter | None = None,
+) -> GHRepo:
+    """
+    Determine the GitHub repository for the upstream remote of the given branch
+    in the Git repository located at or containing the directory ``dirpath``
+    (default: the current directory).
+
+    Raises `NoUpstreamError` if the given branch does not have an upstream
+    remote configured (This includes the situation in which the branch does not
+    exist).  Raises `subprocess.CalledProcessError` if a different Git error
+    occurs, such as the given path not being in a Git repository.
+    """
+    try:
+        upstream = await readgit(
+            "config",
+            "--get",
+            "--",
+            f"branch.{branch}.remote",
+            dirpath=dirpath,
+            limiter=limiter,
+        )
+    except subprocess.CalledProcessError as e:
+        if e.returncode == 1:
+            raise NoUpstreamError(branch)
+        else:
+            raise  # pragma: no cover
+    return await get_local_repo(dirpath, remote=upstream, limiter=limiter)
+
+
+async def get_current_branch(
+    dirpath: AnyPath | None = None, limiter: Limiter | None = None
+) -> str:
+    """
+    Get the current branch for the Git repository located at or containing the
+    directory ``dirpath`` (default: the current directory).  Raises
+    `DetachedHeadError` if the repository is in a detached ``HEAD`` state.
+    Raises `subprocess.CalledProcessError` if a different Git error occurs,
+    such as the given path not being in a Git repository.
+    """
+    try:
+        return await readgit(
+            "symbolic-ref", "--short", "-q", "HEAD", dirpath=dirpath, limiter=limiter
+        )
+    except subprocess.CalledProcessError as e:
+        if e.returncode == 1:
+            raise DetachedHeadError()
+        else:
+            raise  # pragma: no cover
+
+
+async def is_git_repo(
+    dirpath: AnyPath | None = None, limiter: Limiter | None = None
+) -> bool:
+    """
+    Tests whether the given directory (default: the current directory) is
+    either a Git repository or contained in one
+    """
+    async with limiter if limiter is not None else nullcontext():
+        proc = await asyncio.create_subprocess_exec(
+            "git",
+            "rev-parse",
+            "--git-dir",
+            cwd=dirpath,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        returncode = await proc.wait()
+    return returncode == 0
+
+
+async def readgit(
+    *args: str, dirpath: AnyPath | None, limiter: Limiter | None = None
+) -> str:
+    async with limiter if limiter is not None else nullcontext():
+        proc = await asyncio.create_subprocess_exec(
+            "git", *args, cwd=dirpath, stdout=subprocess.PIPE
+        )
+        stdout, _ = await proc.communicate()
+    # Decode the same way as `subprocess.run(..., text=True)`:
+    output = stdout.decode(locale.getpreferredencoding(False))
+    if proc.returncode != 0:
+        assert proc.returncode is not None
+        raise subprocess.CalledProcessError(
+            proc.returncode, ["git", *args], output=output
+        )
+    return output.strip()
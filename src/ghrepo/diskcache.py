@@ -0,0 +1,194 @@
+"""
+.. versionadded:: 0.8.0
+
+A persistent on-disk cache of local repositories' GitHub repositories
+
+Tools like shell prompts that determine the GitHub repository for the same
+local repository over and over can use `LocalRepoCache` to skip both running
+``git`` and parsing the repository's configuration on repeat lookups.  Each
+cache entry records the modification time, inode, and size of every file that
+the result depended on (the repository's ``HEAD`` and all configuration files
+read, including included files, plus those that would have been read had they
+existed); an entry is only used if all of those files are unchanged.
+
+Entries are written atomically, so any number of processes can share a cache
+directory.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+from . import AnyPath, GHRepo
+from . import get_local_repo as git_get_local_repo
+from .gitdir import (
+    GitDir,
+    Unsupported,
+    config_paths,
+    find_git_dir,
+    read_config,
+    remote_url_from_config,
+)
+
+__all__ = ["LocalRepoCache", "default_cache_dir"]
+
+#: Results that depend on files modified less than this many seconds ago are
+#: not cached, as a later modification within the filesystem's timestamp
+#: granularity might go unnoticed
+RACY_WINDOW = 2.0
+
+#: Version of the cache entry format; bumping this invalidates old entries
+ENTRY_VERSION = 1
+
+Stamp = tuple[int, int, int] | None
+
+
+def default_cache_dir() -> Path:
+    """
+    Return the default cache directory: :file:`$XDG_CACHE_HOME/ghrepo`, or
+    :file:`~/.cache/ghrepo` if :envvar:`XDG_CACHE_HOME` is not set
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(base, "ghrepo")
+
+
+class LocalRepoCache:
+    """
+    A persistent cache of the results of `ghrepo.get_local_repo()`, stored as
+    one small JSON file per repository & remote in ``directory`` (default:
+    `default_cache_dir()`)
+    """
+
+    def __init__(self, directory: AnyPath | None = None) -> None:
+        #: The directory in which cache entries are stored
+        self.directory: Path = (
+            Path(os.fsdecode(directory))
+            if directory is not None
+            else default_cache_dir()
+        )
+
+    def get_local_repo(
+        self, dirpath: AnyPath | None = None, remote: str = "origin"
+    ) -> GHRepo:
+        """
+        Determine the GitHub repository for the Git repository located at or
+        containing the directory ``dirpath`` (default: the current directory)
+        by parsing the URL for the specified remote, using a cached result if
+        one exists and is still valid.
+
+        If the repository cannot be handled by `ghrepo.gitdir`, this falls back
+        to calling `ghrepo.get_local_repo()`, and the result is not cached.
+        Raises the same exceptions as `ghrepo.get_local_repo()`.
+        """
+        try:
+            gitdir = find_git_dir(dirpath)
+        except (Unsupported, OSError):
+            gitdir = None
+        if gitdir is None:
+            return git_get_local_repo(dirpath, remote=remote)
+        try:
+            entry_path = self.entry_path(gitdir, remote)
+        except Unsupported:
+            return git_get_local_repo(dirpath, remote=remote)
+        repo = self.load(entry_path)
+        if repo is not None:
+            return repo
+        try:
+            cfg = read_config(gitdir)
+            url = remote_url_from_config(gitdir, cfg, remote)
+        except (Unsupported, OSError, UnicodeDecodeError):
+            return git_get_local_repo(dirpath, remote=remote)
+        repo = GHRepo.parse_url(url)
+        deps = [
+            gitdir.path / "HEAD",
+            gitdir.common_dir / "remotes" / remote,
+            gitdir.common_dir / "branches" / remote,
+            *cfg.files,
+            *cfg.missing_files,
+        ]
+        self.store(entry_path, repo, deps)
+        return repo
+
+    def clear(self) -> None:
+        """Delete all entries from the cache"""
+        try:
+            with os.scandir(self.directory) as it:
+                for e in it:
+                    if e.name.endswith(".json"):
+                        try:
+                            os.unlink(e.path)
+                        except FileNotFoundError:
+                            pass
+        except FileNotFoundError:
+            pass
+
+    def entry_path(self, gitdir: GitDir, remote: str) -> Path:
+        # The set of configuration files that Git reads depends on environment
+        # variables like $HOME, so include those paths in the key.
+        key = "\0".join(
+            [
+                str(gitdir.path),
+                remote,
+                *(f"{scope}:{p}" for p, scope in config_paths(gitdir)),
+            ]
+        )
+        digest = hashlib.sha256(key.encode("utf-8", "surrogateescape")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def load(self, entry_path: Path) -> GHRepo | None:
+        try:
+            with entry_path.open(encoding="utf-8") as fp:
+                data = json.load(fp)
+            if data["version"] != ENTRY_VERSION:
+                return None
+            for path, stamp in data["stamps"]:
+                if get_stamp(path) != (tuple(stamp) if stamp is not None else None):
+                    return None
+            return GHRepo(data["owner"], data["name"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def store(self, entry_path: Path, repo: GHRepo, deps: list[Path]) -> None:
+        stamps = [(str(p), get_stamp(p)) for p in deps]
+        now = time.time_ns()
+        if any(
+            st is not None and now - st[0] < RACY_WINDOW * 1_000_000_000
+            for _, st in stamps
+        ):
+            return
+        data = {
+            "version": ENTRY_VERSION,
+            "owner": repo.owner,
+            "name": repo.name,
+            "stamps": stamps,
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                    json.dump(data, fp)
+                os.replace(tmp, entry_path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            # Failing to write the cache shouldn't break the lookup.
+            pass
+
+
+def get_stamp(path: AnyPath) -> Stamp:
+    """
+    Return a ``(mtime_ns, inode, size)`` triple for ``path``, or `None` if it
+    does not exist
+    """
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return (st.st_mtime_ns, st.st_ino, st.st_size)
@@ -0,0 +1,305 @@
+"""
+.. versionadded:: 0.8.0
+
+Find the GitHub repository URLs in free text
+
+`find_repos()` and `find_repos_in_stream()` scan text for the URL forms
+accepted by `GHRepo.parse_url()` and yield each repository found along with
+its location.  `find_repos_in_file()` does the same for a memory-mapped file,
+searching its bytes directly, for bulk extraction from large logs.  Bare
+``{owner}/{name}`` strings are not extracted, as they are indistinguishable
+from ordinary words containing slashes.
+
+A URL is only recognized if it is not immediately preceded by a character that
+could continue a hostname or path (a letter, digit, hyphen, underscore,
+period, ``@``, ``/``, or ``%``), and the repository name ends at the first
+character that cannot be part of one.  Periods at the end of a repository name
+are taken to be punctuation rather than part of the name, so the URL in "See
+https://github.com/jwodder/ghrepo." is parsed as ``jwodder/ghrepo``.  Anything
+after the repository name (such as ``/issues/1``) is ignored.
+"""
+
+from __future__ import annotations
+from collections import Counter
+from collections.abc import Iterator
+import mmap
+import os
+import re
+from typing import IO, NamedTuple
+from . import GH_REPO_RGX, GH_USER_RGX, GITHUB_URL_RGXEN, OWNER_NAME, AnyPath, GHRepo
+
+__all__ = [
+    "RepoMatch",
+    "count_repos_in_file",
+    "find_repos",
+    "find_repos_in_file",
+    "find_repos_in_stream",
+]
+
+#: The default number of characters read at a time by `find_repos_in_stream()`
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+#: The default number of bytes of a file scanned at a time by
+#: `find_repos_in_file()`.  Windows small enough to stay in the CPU cache
+#: between being lowercased and searched are scanned about twice as fast as
+#: larger ones.
+DEFAULT_WINDOW_SIZE = 1 << 16
+
+#: If `find_repos_in_stream()` reads this many characters without encountering
+#: any that cannot occur in a URL, it stops waiting for the end of the URL;
+#: references in such a run of characters that cross a chunk boundary may be
+#: missed or truncated.
+MAX_RUN = 1 << 16
+
+#: The characters that can occur in the URLs recognized by this module
+URL_CHARS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+    "-._~!$&'()*+,;=:%@/"
+)
+
+
+def url_in_text_regex(extra_word_chars: str = "") -> str:
+    """
+    Return a regex that combines the URL forms of `GITHUB_URL_RGXEN` into one
+    alternation, with each form's owner & name groups numbered so that they
+    can be told apart, plus assertions for the boundaries of URLs in text.
+    ``extra_word_chars`` is a character class fragment of additional
+    characters to treat as word characters in the boundary assertions.
+    """
+    return (
+        rf"(?<![-\w{extra_word_chars}.@/%])(?:"
+        + "|".join(
+            src.replace(
+                OWNER_NAME,
+                rf"(?P<owner{i}>{GH_USER_RGX})/(?P<name{i}>{GH_REPO_RGX}(?<!\.))",
+            )
+            for i, src in enumerate(GITHUB_URL_RGXEN)
+        )
+        + rf")(?![-\w{extra_word_chars}]|\.[-\w{extra_word_chars}])"
+    )
+
+
+URL_IN_TEXT_CRGX = re.compile(url_in_text_regex())
+
+# In bytes patterns, ``\w`` only matches ASCII characters, so treat all
+# non-ASCII bytes as word characters in order to approximate `str` matching
+# of UTF-8 text.
+URL_IN_BYTES_CRGX = re.compile(url_in_text_regex(r"\x80-\xff").encode("ascii"))
+
+# Matches a (possibly empty) run of `URL_CHARS`
+URL_RUN_CRGX = re.compile(r"[-A-Za-z0-9._~!$&'()*+,;=:%@/]*")
+URL_RUN_BYTES_CRGX = re.compile(URL_RUN_CRGX.pattern.encode("ascii"))
+
+#: `URL_CHARS` as a set of byte values
+URL_BYTES = frozenset("".join(URL_CHARS).encode("ascii"))
+
+# A `bytes.translate()` table that maps every byte not in `URL_BYTES` to NUL,
+# for finding the start of a run of URL characters with `bytes.rfind()`
+NON_URL_TO_NUL = bytes(b if b in URL_BYTES else 0 for b in range(256))
+
+# The number of bytes before an occurrence of "github.com" that are checked in
+# one go for the start of the URL; longer runs are walked byte by byte
+LOOKBACK = 64
+
+# Every recognized URL contains this string (case-insensitively)
+HOST = "github.com"
+HOST_BYTES = b"github.com"
+
+
+class RepoMatch(NamedTuple):
+    """A GitHub repository URL found in text by `find_repos()`"""
+
+    #: The repository that the URL refers to
+    repo: GHRepo
+    #: The index of the first character of the URL
+    start: int
+    #: The index just past the last character of the URL
+    end: int
+
+
+def find_repos(text: str) -> Iterator[RepoMatch]:
+    """
+    Scan ``text`` for GitHub repository URLs and yield a `RepoMatch` for each
+    one, in order of occurrence
+    """
+    return scan_text(text, 0, len(text), 0)
+
+
+def find_repos_in_stream(
+    fp: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[RepoMatch]:
+    """
+    Scan the text read from the file-like object ``fp`` for GitHub repository
+    URLs and yield a `RepoMatch` for each one, in order of occurrence.  The
+    ``start`` and ``end`` of each match are character offsets from the point
+    in ``fp`` at which reading began.
+
+    The text is read ``chunk_size`` characters at a time, and the end of each
+    chunk is held back until a character that cannot occur in a URL is read,
+    so that URLs that cross chunk boundaries are still found.
+    """
+    buf = ""
+    # Offset in the stream of ``buf[0]``
+    base = 0
+    # Index in ``buf`` at which to start searching
+    pos = 0
+    while chunk := fp.read(chunk_size):
+        buf += chunk
+        # Find the last character in the buffer that cannot be part of a URL;
+        # matches before it cannot be affected by data read later.
+        # (The part of the buffer before the new chunk is already known not to
+        # contain any such characters after ``pos``.)
+        stop = max(pos, len(buf) - len(chunk))
+        limit = len(buf) - 1
+        while limit >= stop and buf[limit] in URL_CHARS:
+            limit -= 1
+        if limit < stop:
+            if len(buf) - pos < MAX_RUN:
+                continue
+            limit = len(buf) - 1
+        yield from scan_text(buf, pos, limit + 1, base)
+        # Keep the character at ``limit`` so that lookbehinds can see it.
+        buf = buf[limit:]
+        base += limit
+        pos = 1
+    yield from scan_text(buf, pos, len(buf), base)
+
+
+def find_repos_in_file(
+    path: AnyPath, window_size: int = DEFAULT_WINDOW_SIZE
+) -> Iterator[RepoMatch]:
+    """
+    Scan the file at ``path`` for GitHub repository URLs and yield a
+    `RepoMatch` for each one, in order of occurrence.  The ``start`` and
+    ``end`` of each match are byte offsets into the file.
+
+    The file is memory-mapped and searched as bytes, without decoding it or
+    splitting it into lines; it must therefore be a regular file rather than,
+    say, a pipe.  The file is processed ``window_size`` bytes at a time (each
+    window being extended to the end of any URL that crosses its end), and the
+    only memory used beyond the mapping is a copy of the current window plus a
+    lowercased copy of that for locating occurrences of "github.com".
+
+    Matching is the same as for `find_repos()` on the file's text decoded as
+    UTF-8, except that all non-ASCII characters are treated as letters when
+    checking the boundaries of URLs.
+    """
+    with open(path, "rb") as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            # Empty files can't be mapped.
+            return
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if (advice := getattr(mmap, "MADV_SEQUENTIAL", None)) is not None:
+                mm.madvise(advice)
+            size = len(mm)
+            run_end = URL_RUN_BYTES_CRGX.match
+            start = 0
+            while start < size:
+                end = min(start + window_size, size)
+                if end < size:
+                    run = run_end(mm, end)
+                    assert run is not None
+                    end = run.end()
+                # Python has no way to lowercase bytes into an existing buffer,
+                # so this copies the window twice, but copying a window that
+                # fits in the CPU cache is cheap next to lowercasing it, and
+                # searching the mapping with a case-insensitive regex instead
+                # is several times slower.
+                yield from scan_bytes(mm, mm[start:end].lower(), start, end)
+                start = end
+
+
+def count_repos_in_file(
+    path: AnyPath, window_size: int = DEFAULT_WINDOW_SIZE
+) -> Counter[GHRepo]:
+    """
+    Scan the file at ``path`` for GitHub repository URLs with
+    `find_repos_in_file()` and return a `collections.Counter` of the number of
+    times each repository occurs.  The repositories are ordered by first
+    occurrence, so the counter's keys also form a deduplicated list.
+    """
+    return Counter(m.repo for m in find_repos_in_file(path, window_size))
+
+
+def scan_text(text: str, pos: int, endpos: int, base: int) -> Iterator[RepoMatch]:
+    """
+    Yield the matches in ``text[pos:endpos]``, with offsets increased by
+    ``base``.  ``text[endpos - 1]`` must not be part of a URL unless
+    ``endpos`` is the end of the input.
+    """
+    # Rather than running `URL_IN_TEXT_CRGX` over all of the text, find each
+    # occurrence of "github.com" and only run the regex over the run of URL
+    # characters containing it.
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Some non-ASCII characters have lowercase forms of a different
+        # length, which would throw off the offsets.
+        lowered = "".join(c if c.isascii() else "\0" for c in text).lower()
+    find = lowered.find
+    search = URL_IN_TEXT_CRGX.search
+    run_end = URL_RUN_CRGX.match
+    new = tuple.__new__
+    hit = find(HOST, pos, endpos)
+    while hit != -1:
+        start = hit
+        while start > pos and text[start - 1] in URL_CHARS:
+            start -= 1
+        run = run_end(text, hit, endpos)
+        assert run is not None
+        end = run.end()
+        m = search(text, start, min(end + 1, endpos))
+        if m is None:
+            pos = end
+        else:
+            name_group = m.lastgroup
+            assert name_group is not None
+            repo = new(GHRepo, (m["owner" + name_group[4:]], m[name_group]))
+            yield RepoMatch(repo, m.start() + base, m.end() + base)
+            pos = m.end()
+        hit = find(HOST, max(pos, hit + 1), endpos)
+
+
+def scan_bytes(
+    data: mmap.mmap | bytes, lowered: bytes, pos: int, endpos: int
+) -> Iterator[RepoMatch]:
+    """
+    Yield the matches in ``data[pos:endpos]``, where ``lowered`` is
+    ``data[pos:endpos].lower()``.  ``data[endpos]``, if it exists, must not be
+    part of a URL.
+    """
+    base = pos
+    size = len(data)
+    find = lowered.find
+    search = URL_IN_BYTES_CRGX.search
+    run_end = URL_RUN_BYTES_CRGX.match
+    new = tuple.__new__
+    hit = find(HOST_BYTES)
+    while hit != -1:
+        lo = max(hit - LOOKBACK, pos - base)
+        k = lowered[lo:hit].translate(NON_URL_TO_NUL).rfind(0)
+        hit += base
+        if k != -1:
+            start = lo + base + k + 1
+        else:
+            start = lo + base
+            while start > pos and data[start - 1] in URL_BYTES:
+                start -= 1
+        run = run_end(data, hit, endpos)
+        assert run is not None
+        end = run.end()
+        m = search(data, start, min(end + 1, size))
+        if m is None:
+            pos = end
+        else:
+            name_group = m.lastgroup
+            assert name_group is not None
+            repo = new(
+                GHRepo,
+                (
+                    m["owner" + name_group[4:]].decode("ascii"),
+                    m[name_group].decode("ascii"),
+                ),
+            )
+            yield RepoMatch(repo, m.start(), m.end())
+            pos = m.end()
+        hit = find(HOST_BYTES, max(pos, hit + 1) - base)
@@ -0,0 +1,695 @@
+"""
+.. versionadded:: 0.8.0
+
+Pure-Python inspection of local Git repositories
+
+The functions in this module locate a repository's Git directory and read its
+configuration files directly rather than running ``git``, which avoids the
+cost of spawning a subprocess.  Whenever the repository's layout or the
+environment contains something that this module cannot be sure of interpreting
+the same way Git would, the functions fall back to running ``git`` just like
+the functions of the same name in the top-level `ghrepo` module.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from functools import cache
+import os
+from pathlib import Path
+import re
+import subprocess
+from typing import NamedTuple
+from . import AnyPath, GHRepo, NoSuchRemoteError, readgit
+
+__all__ = [
+    "ConfigEntry",
+    "GitConfig",
+    "GitDir",
+    "ResolvedURL",
+    "find_git_dir",
+    "get_local_repo",
+    "get_remote_url",
+    "read_config",
+]
+
+#: Value of `ResolvedURL.source` when the URL was determined by reading the
+#: repository's files directly
+SOURCE_CONFIG = "config"
+
+#: Value of `ResolvedURL.source` when the URL was determined by running ``git``
+SOURCE_GIT = "git"
+
+#: Git's limit on how deeply config files can include one another
+MAX_INCLUDE_DEPTH = 10
+
+#: Environment variables that alter how Git finds a repository or reads its
+#: configuration in ways this module does not emulate.  If any of them are
+#: set, the functions in this module fall back to running ``git``.
+UNSUPPORTED_ENV_VARS = (
+    "GIT_CEILING_DIRECTORIES",
+    "GIT_COMMON_DIR",
+    "GIT_CONFIG",
+    "GIT_CONFIG_COUNT",
+    "GIT_CONFIG_PARAMETERS",
+    "GIT_DISCOVERY_ACROSS_FILESYSTEM",
+    "GIT_WORK_TREE",
+)
+
+
+class Unsupported(Exception):
+    """
+    Raised internally when a repository or its configuration uses a feature
+    that this module cannot be sure of interpreting the same way Git would
+    """
+
+
+class GitDir(NamedTuple):
+    """A located Git directory"""
+
+    #: The repository's Git directory (For a linked worktree, this is the
+    #: worktree-specific directory inside the main repository's Git directory)
+    path: Path
+    #: The directory containing the files shared by all of a repository's
+    #: worktrees, including ``config``; for repositories without linked
+    #: worktrees, this is the same as ``path``
+    common_dir: Path
+
+
+class ResolvedURL(NamedTuple):
+    """The URL of a remote along with how it was determined"""
+
+    #: The remote's URL, after applying any ``url.<base>.insteadOf`` rewrites
+    url: str
+    #: `SOURCE_CONFIG` if the URL was read from the repository's configuration
+    #: files directly, `SOURCE_GIT` if ``git`` had to be run
+    source: str
+
+
+class ConfigEntry(NamedTuple):
+    """A single variable setting in a Git configuration"""
+
+    #: The variable's name, normalized to have lowercase section & variable
+    #: names; subsection names are left as-is
+    key: str
+    #: The variable's value; `None` indicates a variable set without an ``=``
+    #: (a boolean "true")
+    value: str | None
+    #: The scope of the file that the setting was read from: ``"system"``,
+    #: ``"global"``, ``"local"``, or ``"worktree"``
+    scope: str
+
+
+@dataclass
+class GitConfig:
+    """
+    The configuration for a Git repository, as a list of `ConfigEntry`
+    instances in the order that Git reads them
+    """
+
+    entries: list[ConfigEntry] = field(default_factory=list)
+    #: The paths of all configuration files that were read (including
+    #: files that were included)
+    files: list[Path] = field(default_factory=list)
+    #: The paths of configuration files (including included files) that Git
+    #: would have read but which did not exist
+    missing_files: list[Path] = field(default_factory=list)
+
+    def get_all(self, key: str) -> list[str | None]:
+        """Return all values for the given key, in the order set"""
+        key = normalize_key(key)
+        return [e.value for e in self.entries if e.key == key]
+
+    def get(self, key: str) -> str | None:
+        """
+        Return the last value set for the given key, or `None` if it is not set
+        """
+        values = self.get_all(key)
+        return values[-1] if values else None
+
+    def get_bool(self, key: str) -> bool:
+        """
+        Return the last value set for the given key interpreted as a boolean,
+        or `False` if it is not set
+        """
+        values = self.get_all(key)
+        if not values or values[-1] is None:
+            return bool(values)
+        v = values[-1].lower()
+        if v in ("true", "yes", "on", "1"):
+            return True
+        elif v in ("false", "no", "off", "0", ""):
+            return False
+        else:
+            raise Unsupported(f"Non-boolean value for {key}: {values[-1]!r}")
+
+    def has_subsection(
+        self, section: str, subsection: str, scopes: tuple[str, ...] | None = None
+    ) -> bool:
+        """
+        Test whether any keys are set in the given section & subsection,
+        optionally only considering entries from the given scopes
+        """
+        prefix = f"{section.lower()}.{subsection}."
+        return any(
+            e.key.startswith(prefix)
+            and "." not in e.key[len(prefix) :]
+            and (scopes is None or e.scope in scopes)
+            for e in self.entries
+        )
+
+
+def normalize_key(key: str) -> str:
+    section, _, rest = key.partition(".")
+    subsection, _, name = rest.rpartition(".")
+    if subsection:
+        return f"{section.lower()}.{subsection}.{name.lower()}"
+    else:
+        return f"{section.lower()}.{name.lower()}"
+
+
+def find_git_dir(dirpath: AnyPath | None = None) -> GitDir | None:
+    """
+    Locate the Git directory for the repository located at or containing the
+    directory ``dirpath`` (default: the current directory), following the same
+    discovery rules as Git, including honoring :envvar:`GIT_DIR` and following
+    the ``.git`` files used by linked worktrees & submodules.  Returns `None`
+    if no repository is found.
+
+    Raises `Unsupported` if the environment or repository layout is one that
+    this function does not emulate.
+    """
+    check_environment()
+    start = Path(os.fsdecode(dirpath)) if dirpath is not None else Path()
+    start = Path(os.path.abspath(start))
+    if (gd := os.environ.get("GIT_DIR")) is not None:
+        path = start / gd
+        if not is_git_directory(path):
+            return None
+        return make_git_dir(path)
+    d = start
+    try:
+        dev = d.stat().st_dev
+    except OSError:
+        return None
+    while True:
+        dotgit = d / ".git"
+        if dotgit.is_file():
+            path = read_gitfile(dotgit)
+            if not is_git_directory(path):
+                raise Unsupported(f"{dotgit} does not point to a Git directory")
+            check_ownership(d)
+            return make_git_dir(path)
+        elif is_git_directory(dotgit):
+            check_ownership(d)
+            return make_git_dir(dotgit)
+        elif is_git_directory(d):
+            # Bare repository
+            check_ownership(d)
+            return make_git_dir(d)
+        parent = d.parent
+        if parent == d:
+            return None
+        if parent.stat().st_dev != dev:
+            raise Unsupported("Git directory search would cross filesystems")
+        d = parent
+
+
+def check_environment() -> None:
+    for var in UNSUPPORTED_ENV_VARS:
+        if var in os.environ:
+            raise Unsupported(f"${var} is set")
+
+
+def check_ownership(path: Path) -> None:
+    # Git refuses to operate on repositories owned by other users unless
+    # they're listed in safe.directory; leave that determination to Git.
+    geteuid = getattr(os, "geteuid", None)
+    if geteuid is None or path.stat().st_uid != geteuid():
+        raise Unsupported(f"Cannot verify ownership of {path}")
+
+
+def read_gitfile(path: Path) -> Path:
+    text = path.read_text(encoding="utf-8")
+    if not text.startswith("gitdir: "):
+        raise Unsupported(f"Invalid gitfile format: {path}")
+    return path.parent / text[len("gitdir: ") :].strip()
+
+
+def is_git_directory(path: Path) -> bool:
+    if not (path / "HEAD").is_file():
+        return False
+    if (path / "commondir").is_file():
+        return True
+    return (path / "objects").is_dir() and (path / "refs").is_dir()
+
+
+def make_git_dir(path: Path) -> GitDir:
+    path = Path(os.path.abspath(path))
+    common = path
+    commondir_file = path / "commondir"
+    if commondir_file.is_file():
+        common = Path(
+            os.path.abspath(path / commondir_file.read_text(encoding="utf-8").strip())
+        )
+    return GitDir(path=path, common_dir=common)
+
+
+def config_paths(gitdir: GitDir | None) -> list[tuple[Path, str]]:
+    """
+    Return the paths of the system, global, and (if ``gitdir`` is not `None`)
+    local configuration files, in the order in which Git reads them, each
+    paired with its scope
+
+    Raises `Unsupported` if the path of the system configuration file is
+    needed but cannot be determined.
+    """
+    paths: list[tuple[Path, str]] = []
+    if not env_bool("GIT_CONFIG_NOSYSTEM"):
+        if (system := os.environ.get("GIT_CONFIG_SYSTEM")) is not None:
+            paths.append((Path(system), "system"))
+        else:
+            paths.append((system_config_path(), "system"))
+    if (cfg := os.environ.get("GIT_CONFIG_GLOBAL")) is not None:
+        if cfg:
+            paths.append((Path(cfg), "global"))
+    else:
+        if xdg := os.environ.get("XDG_CONFIG_HOME"):
+            paths.append((Path(xdg, "git", "config"), "global"))
+        elif home := os.environ.get("HOME"):
+            paths.append((Path(home, ".config", "git", "config"), "global"))
+        if home := os.environ.get("HOME"):
+            paths.append((Path(home, ".gitconfig"), "global"))
+    if gitdir is not None:
+        paths.append((gitdir.common_dir / "config", "local"))
+    return paths
+
+
+@cache
+def system_config_path() -> Path:
+    """
+    Return the path of the system configuration file that Git reads when
+    :envvar:`GIT_CONFIG_SYSTEM` is not set.  The path is fixed when Git is
+    built (``$(prefix)/etc/gitconfig``, which is ``/etc/gitconfig`` for most
+    Linux distributions' packages but not for, e.g., Homebrew or Git for
+    Windows), so it is asked of ``git`` once per process.
+
+    Raises `Unsupported` if ``git`` cannot be run.
+    """
+    # ``git config --edit`` passes the path of the file to edit to the editor
+    # without reading or creating the file, so an "editor" of ``echo`` prints
+    # it.
+    env = {k: v for k, v in os.environ.items() if k != "GIT_CONFIG_SYSTEM"}
+    env["GIT_EDITOR"] = "echo"
+    try:
+        r = subprocess.run(
+            ["git", "config", "--system", "--edit"],
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise Unsupported(f"Could not determine system config path: {e}")
+    path = r.stdout.rstrip("\r\n")
+    if not path:
+        raise Unsupported("Could not determine system config path")
+    return Path(path)
+
+
+def env_bool(var: str) -> bool:
+    return os.environ.get(var, "").lower() in ("1", "true", "yes", "on")
+
+
+def read_config(gitdir: GitDir) -> GitConfig:
+    """
+    Read the full configuration (system, global, local, and worktree) for the
+    given Git directory, processing ``include`` and ``includeIf`` directives
+
+    Raises `Unsupported` if the configuration uses a feature that this function
+    does not emulate or is malformed.
+    """
+    cfg = GitConfig()
+    for p, scope in config_paths(gitdir):
+        read_config_file(p, scope, cfg, gitdir, depth=0)
+    if cfg.get_bool("extensions.worktreeConfig"):
+        read_config_file(
+            gitdir.path / "config.worktree", "worktree", cfg, gitdir, depth=0
+        )
+    return cfg
+
+
+def read_config_file(
+    path: Path, scope: str, cfg: GitConfig, gitdir: GitDir, depth: int
+) -> None:
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        cfg.missing_files.append(path)
+        return
+    except (OSError, UnicodeDecodeError) as e:
+        raise Unsupported(f"Could not read {path}: {e}")
+    cfg.files.append(path)
+    for key, value in parse_config(text):
+        cfg.entries.append(ConfigEntry(key, value, scope))
+        if key == "include.path" or (
+            key.startswith("includeif.") and key.endswith(".path")
+        ):
+            if value is None:
+                raise Unsupported(f"Include without path in {path}")
+            if key != "include.path" and not include_condition(
+                key[len("includeif.") : -len(".path")], path, gitdir
+            ):
+                continue
+            if depth + 1 > MAX_INCLUDE_DEPTH:
+                raise Unsupported("Config includes nested too deeply")
+            inc = Path(os.path.expanduser(value))
+            if not inc.is_absolute():
+                inc = path.parent / inc
+            read_config_file(inc, scope, cfg, gitdir, depth + 1)
+
+
+def include_condition(cond: str, path: Path, gitdir: GitDir) -> bool:
+    if cond.startswith(("gitdir:", "gitdir/i:")):
+        icase = cond.startswith("gitdir/i:")
+        pattern = cond.partition(":")[2]
+        if pattern.startswith("~/"):
+            pattern = os.path.expanduser(pattern)
+        elif pattern.startswith("./"):
+            pattern = str(path.parent / pattern[2:])
+        elif not pattern.startswith("/"):
+            pattern = "**/" + pattern
+        if pattern.endswith("/"):
+            pattern += "**"
+        rgx = wildmatch_regex(pattern, icase)
+        for p in {str(gitdir.path), os.path.realpath(gitdir.path)}:
+            if rgx.fullmatch(p.replace(os.sep, "/")):
+                return True
+        return False
+    elif cond.startswith("onbranch:"):
+        pattern = cond[len("onbranch:") :]
+        if pattern.endswith("/"):
+            pattern += "**"
+        branch = read_head_branch(gitdir)
+        return branch is not None and bool(
+            wildmatch_regex(pattern, False).fullmatch(branch)
+        )
+    else:
+        # Includes the "hasconfig:" conditions, which depend on the
+        # configuration as a whole
+        raise Unsupported(f"Unsupported includeIf condition: {cond!r}")
+
+
+def read_head_branch(gitdir: GitDir) -> str | None:
+    """
+    Return the name of the branch that the given Git directory's ``HEAD``
+    points to, or `None` if ``HEAD`` is detached.  Raises `Unsupported` if
+    ``HEAD`` has any other form.
+    """
+    head_file = gitdir.path / "HEAD"
+    if head_file.is_symlink():
+        # Very old versions of Git made HEAD a symlink to the branch's ref
+        raise Unsupported("HEAD is a symlink")
+    head = head_file.read_text(encoding="utf-8").strip()
+    if head.startswith("ref: refs/heads/"):
+        branch = head[len("ref: refs/heads/") :]
+        if branch == ".invalid":
+            # Repositories using the reftable backend store ``HEAD`` in the
+            # reftable and leave this placeholder in the file.
+            raise Unsupported("HEAD is not stored in a file")
+        return branch
+    elif OBJECT_ID_RGX.fullmatch(head):
+        return None
+    else:
+        raise Unsupported(f"Unrecognized HEAD contents: {head!r}")
+
+
+OBJECT_ID_RGX = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+
+
+def wildmatch_regex(pattern: str, icase: bool) -> re.Pattern[str]:
+    """
+    Convert a Git wildmatch pattern, as used by ``includeIf`` conditions, to a
+    compiled regular expression in which wildcards do not match slashes
+    """
+    parts: list[str] = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i) and (i == 0 or pattern[i - 1] == "/"):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif c == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif c == "?":
+            parts.append("[^/]")
+            i += 1
+        elif c == "[" and (j := pattern.find("]", i + 2)) != -1:
+            body = pattern[i + 1 : j]
+            if body.startswith(("!", "^")):
+                body = "^" + body[1:]
+            parts.append("[" + body.replace("\\", "\\\\") + "]")
+            i = j + 1
+        elif c == "\\" and i + 1 < n:
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(c))
+            i += 1
+    return re.compile("".join(parts), re.I if icase else 0)
+
+
+SECTION_NAME_RGX = re.compile(r"[-A-Za-z0-9.]+")
+VARIABLE_NAME_RGX = re.compile(r"[A-Za-z][-A-Za-z0-9]*")
+VALUE_ESCAPES = {"n": "\n", "t": "\t", "b": "\b", "\\": "\\", '"': '"'}
+
+
+def parse_config(text: str) -> list[tuple[str, str | None]]:
+    """
+    Parse the contents of a Git configuration file into a list of ``(key,
+    value)`` pairs, with keys normalized as in `GitConfig`.  Raises
+    `Unsupported` if the text is malformed.
+    """
+    entries: list[tuple[str, str | None]] = []
+    section: str | None = None
+    i = 0
+    n = len(text)
+    if text.startswith("\ufeff"):
+        i = 1
+    while i < n:
+        c = text[i]
+        if c in " \t\r\n":
+            i += 1
+        elif c in "#;":
+            j = text.find("\n", i)
+            i = n if j == -1 else j + 1
+        elif c == "[":
+            section, i = parse_section_header(text, i + 1)
+        elif m := VARIABLE_NAME_RGX.match(text, i):
+            if section is None:
+                raise Unsupported("Variable outside of section")
+            name = m[0].lower()
+            i = m.end()
+            while i < n and text[i] in " \t":
+                i += 1
+            value: str | None
+            if i < n and text[i] == "=":
+                value, i = parse_value(text, i + 1)
+            elif i >= n or text[i] in "\r\n#;":
+                value = None
+            else:
+                raise Unsupported(f"Invalid config line for {name!r}")
+            entries.append((f"{section}.{name}", value))
+        else:
+            raise Unsupported(f"Unexpected character in config: {c!r}")
+    return entries
+
+
+def parse_section_header(text: str, i: int) -> tuple[str, int]:
+    m = SECTION_NAME_RGX.match(text, i)
+    if m is None:
+        raise Unsupported("Invalid section header")
+    name = m[0]
+    i = m.end()
+    if text.startswith("]", i):
+        # Old-style "[section.subsection]" headers are case-insensitive
+        return (name.lower(), i + 1)
+    if "." in name or not text.startswith((" ", "\t"), i):
+        raise Unsupported("Invalid section header")
+    while text.startswith((" ", "\t"), i):
+        i += 1
+    if not text.startswith('"', i):
+        raise Unsupported("Invalid section header")
+    i += 1
+    sub: list[str] = []
+    while True:
+        if i >= len(text) or text[i] == "\n":
+            raise Unsupported("Unterminated subsection name")
+        c = text[i]
+        if c == '"':
+            break
+        elif c == "\\" and i + 1 < len(text) and text[i + 1] != "\n":
+            sub.append(text[i + 1])
+            i += 2
+        else:
+            sub.append(c)
+            i += 1
+    if not text.startswith('"]', i):
+        raise Unsupported("Invalid section header")
+    return (f"{name.lower()}.{''.join(sub)}", i + 2)
+
+
+def parse_value(text: str, i: int) -> tuple[str, int]:
+    """
+    Parse a configuration value starting at index ``i`` (just after the
+    ``=``), returning the value and the index just past its end
+    """
+    n = len(text)
+    out: list[str] = []
+    # Unquoted whitespace is only kept if something other than whitespace or
+    # a comment follows it on the same logical line.
+    pending_ws: list[str] = []
+    quoted = False
+    while i < n and text[i] in " \t":
+        i += 1
+    while i < n:
+        c = text[i]
+        if c == "\n":
+            if quoted:
+                raise Unsupported("Unterminated quoted value")
+            break
+        elif c == "\\":
+            if i + 1 >= n:
+                raise Unsupported("Trailing backslash in value")
+            nxt = text[i + 1]
+            if nxt == "\n":
+                i += 2
+                continue
+            elif nxt == "\r" and text.startswith("\n", i + 2):
+                i += 3
+                continue
+            elif nxt in VALUE_ESCAPES:
+                out.extend(pending_ws)
+                pending_ws.clear()
+                out.append(VALUE_ESCAPES[nxt])
+                i += 2
+                continue
+            else:
+                raise Unsupported(f"Invalid escape sequence in value: \\{nxt}")
+        elif c == '"':
+            quoted = not quoted
+            out.extend(pending_ws)
+            pending_ws.clear()
+        elif quoted:
+            out.append(c)
+        elif c in "#;":
+            j = text.find("\n", i)
+            i = n if j == -1 else j
+            break
+        elif c in " \t":
+            pending_ws.append(c)
+        elif c == "\r" and text.startswith("\n", i + 1):
+            pass
+        else:
+            out.extend(pending_ws)
+            pending_ws.clear()
+            out.append(c)
+        i += 1
+    if quoted:
+        raise Unsupported("Unterminated quoted value")
+    return ("".join(out), i)
+
+
+def rewrite_url(url: str, cfg: GitConfig) -> str:
+    """Apply the longest matching ``url.<base>.insteadOf`` rewrite to ``url``"""
+    best: tuple[int, str] | None = None
+    for key, value, _ in cfg.entries:
+        if key.startswith("url.") and key.endswith(".insteadof"):
+            if value is None:
+                raise Unsupported("insteadOf without a value")
+            if url.startswith(value) and (best is None or len(value) > best[0]):
+                best = (len(value), key[len("url.") : -len(".insteadof")])
+    if best is None:
+        return url
+    return best[1] + url[best[0] :]
+
+
+def read_remote_url(dirpath: AnyPath | None, remote: str) -> str:
+    """
+    Determine the URL for the given remote without running ``git``.  Raises
+    `NoSuchRemoteError` if Git would report that the remote does not exist, or
+    `Unsupported` if the answer cannot be determined with certainty.
+    """
+    gitdir = find_git_dir(dirpath)
+    if gitdir is None:
+        raise Unsupported("Git directory not found")
+    return remote_url_from_config(gitdir, read_config(gitdir), remote)
+
+
+def remote_url_from_config(gitdir: GitDir, cfg: GitConfig, remote: str) -> str:
+    """
+    Determine the URL for the given remote from the configuration ``cfg`` for
+    the Git directory ``gitdir``.  Raises `NoSuchRemoteError` if Git would
+    report that the remote does not exist, or `Unsupported` if the answer
+    cannot be determined with certainty.
+    """
+    if (gitdir.common_dir / "remotes" / remote).exists() or (
+        gitdir.common_dir / "branches" / remote
+    ).exists():
+        raise Unsupported(f"Remote {remote!r} is defined in a legacy remote file")
+    # `git remote get-url` only acknowledges remotes that are configured in the
+    # repository's own configuration, though the URLs for such remotes may
+    # also be set in the global or system configuration.
+    if not cfg.has_subsection("remote", remote, scopes=("local", "worktree")):
+        raise NoSuchRemoteError(remote)
+    urls = cfg.get_all(f"remote.{remote}.url")
+    if not urls:
+        raise Unsupported(f"Remote {remote!r} is configured without a URL")
+    if any(not u for u in urls):
+        # Empty values reset the list of URLs in newer versions of Git.
+        raise Unsupported(f"Empty URL configured for remote {remote!r}")
+    url = urls[0]
+    assert url is not None
+    return rewrite_url(url, cfg)
+
+
+def get_remote_url(
+    dirpath: AnyPath | None = None, remote: str = "origin"
+) -> ResolvedURL:
+    """
+    Determine the URL for the given remote of the Git repository located at or
+    containing the directory ``dirpath`` (default: the current directory), as
+    would be reported by ``git remote get-url``.  The repository's
+    configuration files are read directly if possible; otherwise, ``git`` is
+    run.  The returned `ResolvedURL` reports which method was used.
+
+    Raises `NoSuchRemoteError` if the given remote does not exist.  Raises
+    `subprocess.CalledProcessError` if ``git`` had to be run and a different
+    Git error occurred.
+    """
+    try:
+        return ResolvedURL(read_remote_url(dirpath, remote), SOURCE_CONFIG)
+    except (Unsupported, OSError, UnicodeDecodeError):
+        pass
+    try:
+        url = readgit("remote", "get-url", "--", remote, dirpath=dirpath)
+    except subprocess.CalledProcessError as e:
+        if e.returncode == 2:
+            raise NoSuchRemoteError(remote)
+        else:
+            raise
+    return ResolvedURL(url, SOURCE_GIT)
+
+
+def get_local_repo(dirpath: AnyPath | None = None, remote: str = "origin") -> GHRepo:
+    """
+    Like `ghrepo.get_local_repo()`, but reads the repository's configuration
+    files directly when possible instead of running ``git``
+    """
+    return GHRepo.parse_url(get_remote_url(dirpath, remote).url)
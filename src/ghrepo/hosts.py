@@ -0,0 +1,215 @@
+"""
+.. versionadded:: 0.8.0
+
+Parse repository URLs for GitHub Enterprise hosts alongside github.com
+
+`HostParser` recognizes the same URL forms as `GHRepo.parse_url()` for any
+number of configured hosts, including each host's REST API URLs.
+Rather than trying a regex per host, it matches every URL against a single
+regex in which the hostname is a generic pattern and then looks the captured
+hostname up in a `dict`, so matching takes the same time no matter how many
+hosts are configured.  Repositories are returned as `HostedRepo` instances,
+whose URL properties point to the host that the URL was for.
+"""
+
+from __future__ import annotations
+from collections.abc import Iterable
+import re
+from typing import NamedTuple
+from . import GH_REPO_RGX, GH_USER_RGX, OWNER_NAME, GHRepo, _shorten
+
+__all__ = ["GITHUB", "GitHubHost", "HostParser", "HostedRepo"]
+
+#: The default path of the REST API on GitHub Enterprise Server hosts
+DEFAULT_API_PATH = "/api/v3"
+
+#: Regex for a hostname, bounded in length like the other components of the
+#: URL regexes
+HOST_RGX = r"[-A-Za-z0-9.]{1,253}"
+
+#: The URL forms recognized by `HostParser`, corresponding to the forms in
+#: `GITHUB_URL_RGXEN`: web & HTTPS clone URLs, REST API URLs (with an
+#: arbitrary API path before ``/repos``), ``git://`` URLs, scp-style SSH
+#: locations, and ``ssh://`` URLs.  ``{host}`` and ``{path}`` are replaced by
+#: numbered groups for the hostname & API path.
+HOSTED_URL_FORMS = [
+    r"(?:(?i:https?)://"
+    r"(?:(?:[A-Za-z0-9-._~!$&'()*+,;=:]|%[0-9a-fA-F]{2}){0,256}@)?)?"
+    rf"{{host}}/{OWNER_NAME}(?:\.git)?/?",
+    rf"(?:(?i:https?)://)?{{host}}{{path}}/repos/{OWNER_NAME}",
+    rf"(?i:git://){{host}}/{OWNER_NAME}(?:\.git)?",
+    rf"git@{{host}}:{OWNER_NAME}(?:\.git)?",
+    rf"(?i:ssh://)git@{{host}}/{OWNER_NAME}(?:\.git)?",
+]
+
+# Index of the REST API form in `HOSTED_URL_FORMS`
+API_FORM = 1
+
+#: URLs longer than this cannot match `HOSTED_URL_CRGX` and are rejected
+#: without running it
+MAX_URL_LENGTH = 2048
+
+
+def hosted_url_regex() -> str:
+    """
+    Return a regex that combines `HOSTED_URL_FORMS` into one alternation, with
+    each form's groups numbered so that they can be told apart
+    """
+    return "|".join(
+        src.replace(
+            OWNER_NAME,
+            rf"(?P<owner{i}>{GH_USER_RGX})/(?P<name{i}>{GH_REPO_RGX})",
+        )
+        .replace("{host}", f"(?P<host{i}>{HOST_RGX})")
+        .replace("{path}", rf"(?P<path{i}>(?:/[-A-Za-z0-9._~]{{1,64}}){{0,4}}?)")
+        for i, src in enumerate(HOSTED_URL_FORMS)
+    )
+
+
+HOSTED_URL_CRGX = re.compile(hosted_url_regex())
+
+
+class GitHubHost(NamedTuple):
+    """A GitHub or GitHub Enterprise Server host"""
+
+    #: The hostname of the host's web interface, in lowercase
+    hostname: str
+    #: The base URL of the host's REST API, without a trailing slash
+    api_url: str
+
+    @classmethod
+    def enterprise(cls, hostname: str, api_path: str = DEFAULT_API_PATH) -> GitHubHost:
+        """
+        Construct a `GitHubHost` for a GitHub Enterprise Server instance, which
+        serves its REST API at ``api_path`` on the same host
+        """
+        return cls(hostname.lower(), f"https://{hostname.lower()}{api_path}")
+
+
+#: The `GitHubHost` for github.com
+GITHUB = GitHubHost("github.com", "https://api.github.com")
+
+
+class HostedRepo(NamedTuple):
+    """A `GHRepo` together with the `GitHubHost` on which it lives"""
+
+    host: GitHubHost
+    repo: GHRepo
+
+    def __str__(self) -> str:
+        return str(self.repo)
+
+    @property
+    def owner(self) -> str:
+        """The repository's owner"""
+        return self.repo.owner
+
+    @property
+    def name(self) -> str:
+        """The repository's base name"""
+        return self.repo.name
+
+    @property
+    def api_url(self) -> str:
+        """The base URL for accessing the repository via the host's REST API"""
+        return f"{self.host.api_url}/repos/{self.repo.owner}/{self.repo.name}"
+
+    @property
+    def clone_url(self) -> str:
+        """The URL for cloning the repository over HTTPS"""
+        return f"https://{self.host.hostname}/{self.repo.owner}/{self.repo.name}.git"
+
+    @property
+    def git_url(self) -> str:
+        """The URL for cloning the repository via the native Git protocol"""
+        return f"git://{self.host.hostname}/{self.repo.owner}/{self.repo.name}.git"
+
+    @property
+    def html_url(self) -> str:
+        """The URL for the repository's web interface"""
+        return f"https://{self.host.hostname}/{self.repo.owner}/{self.repo.name}"
+
+    @property
+    def ssh_url(self) -> str:
+        """The URL for cloning the repository over SSH"""
+        return f"git@{self.host.hostname}:{self.repo.owner}/{self.repo.name}.git"
+
+
+class HostParser:
+    """
+    A parser for repository URLs on a set of GitHub and/or GitHub Enterprise
+    Server hosts.  ``hosts`` may contain `GitHubHost` instances and hostname
+    strings; a string is converted to `GITHUB` if it is ``"github.com"`` and
+    to a GitHub Enterprise Server host with its API at `DEFAULT_API_PATH`
+    otherwise.
+    """
+
+    def __init__(self, hosts: Iterable[GitHubHost | str] = (GITHUB,)) -> None:
+        self._hosts: list[GitHubHost] = []
+        # Mapping from lowercased hostnames (as they appear in web, Git, and
+        # SSH URLs) to hosts:
+        self._by_hostname: dict[str, GitHubHost] = {}
+        # Mapping from ``(lowercased hostname, path)`` pairs for the base REST
+        # API URLs to hosts:
+        self._by_api_base: dict[tuple[str, str], GitHubHost] = {}
+        for h in hosts:
+            self.add_host(h)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._hosts!r})"
+
+    @property
+    def hosts(self) -> list[GitHubHost]:
+        """The configured hosts, in the order in which they were added"""
+        return list(self._hosts)
+
+    def add_host(self, host: GitHubHost | str) -> GitHubHost:
+        """
+        Add a host to the parser and return it as a `GitHubHost`.  Raises
+        `ValueError` if the hostname or API URL is invalid.
+        """
+        if isinstance(host, str):
+            if host.lower() == GITHUB.hostname:
+                host = GITHUB
+            else:
+                host = GitHubHost.enterprise(host)
+        if not re.fullmatch(HOST_RGX, host.hostname):
+            raise ValueError(f"Invalid hostname: {host.hostname!r}")
+        scheme, sep, rest = host.api_url.partition("://")
+        api_host, _, api_path = rest.rstrip("/").partition("/")
+        if (
+            not sep
+            or scheme.lower() not in ("http", "https")
+            or not re.fullmatch(HOST_RGX, api_host)
+        ):
+            raise ValueError(f"Invalid API URL: {host.api_url!r}")
+        self._hosts.append(host)
+        self._by_hostname[host.hostname.lower()] = host
+        if host == GITHUB:
+            self._by_hostname["www.github.com"] = host
+        self._by_api_base[(api_host.lower(), f"/{api_path}" if api_path else "")] = host
+        return host
+
+    def parse_url(self, url: str) -> HostedRepo:
+        """
+        Parse a repository URL for one of the configured hosts.  The URL forms
+        accepted by `GHRepo.parse_url()` are recognized, with ``github.com``
+        replaced by the host's hostname, and with API URLs taking the form
+        ``[http[s]://]{api_url host & path}/repos/{owner}/{name}``.  All other
+        URLs, including those for hosts that have not been added, produce a
+        `ValueError`.
+        """
+        m = HOSTED_URL_CRGX.fullmatch(url) if len(url) <= MAX_URL_LENGTH else None
+        if m is not None:
+            group = m.lastgroup
+            assert group is not None
+            i = group[4:]
+            hostname = m["host" + i].lower()
+            if int(i) == API_FORM:
+                host = self._by_api_base.get((hostname, m["path" + i]))
+            else:
+                host = self._by_hostname.get(hostname)
+            if host is not None:
+                repo = tuple.__new__(GHRepo, (m["owner" + i], m[group]))
+                return HostedRepo(host, repo)
+        raise ValueError(f"Invalid GitHub URL: {_shorten(url)}")
@@ -0,0 +1,254 @@
+"""
+.. versionadded:: 0.8.0
+
+Opt-in instrumentation of ghrepo's parsing and Git functions
+
+An `Instrumentation` instance counts the calls to, failures of, and time spent
+in ghrepo's hot paths while it is installed:
+
+- ``GHRepo.parse``, ``GHRepo.parse_url``, ``GHRepo.parse_many``,
+  ``GHRepo.parse_url_many``, ``GHRepo.parse_bytes``, and
+  ``GHRepo.parse_url_bytes``: each call of the method
+- ``url_form/{form}``: each match of a URL against the URL regexes, keyed by
+  the form that matched (``web``, ``api``, ``git``, ``scp``, or ``ssh``, in
+  the order of `ghrepo.GITHUB_URL_RGXEN`), or ``url_form/none`` for URLs that
+  did not match any form, which are counted as failures.  This covers
+  `GHRepo.parse_url()`, `GHRepo.parse()` when given a URL, `ghrepo.ParseCache`
+  misses, `ghrepo.is_github_url()`, and `ghrepo.get_repo_context()`; the batch
+  parsing methods inline their URL matching and are only measured as a whole.
+- ``git/{subcommand}``: each ``git`` command run by `ghrepo.get_local_repo()`,
+  `ghrepo.get_branch_upstream()`, and `ghrepo.get_current_branch()` (and the
+  functions in `ghrepo.gitdir` that fall back to them), keyed by its
+  subcommand
+- ``is_git_repo`` and ``get_repo_context``: each call of the function through
+  the `ghrepo` module
+
+A call counts as a failure if it raises an exception.  Nested measurements are
+recorded independently, so the time for ``GHRepo.parse`` includes that of any
+``GHRepo.parse_url`` and ``url_form/*`` calls it makes.
+
+Instrumentation is installed by replacing the measured functions with timing
+wrappers and removed by putting the originals back, so it costs nothing at all
+while not installed.  Because functions are replaced on the `ghrepo` module
+and the `GHRepo` class, calls to `is_git_repo()` or `get_repo_context()`
+through a reference obtained with ``from ghrepo import ...`` before
+installation are not measured.  ``git`` commands are measured via a hook in
+`ghrepo.readgit()`.
+"""
+
+from __future__ import annotations
+from collections.abc import Callable
+import threading
+import time
+from types import TracebackType
+from typing import Any, NamedTuple
+import ghrepo
+from . import GHRepo
+
+__all__ = ["CallStats", "Instrumentation"]
+
+#: Names of the URL forms in `ghrepo.GITHUB_URL_RGXEN`, in order
+URL_FORM_NAMES = ["web", "api", "git", "scp", "ssh"]
+
+#: The `GHRepo` classmethods measured by `Instrumentation`
+PARSE_METHODS = [
+    "parse",
+    "parse_url",
+    "parse_many",
+    "parse_url_many",
+    "parse_bytes",
+    "parse_url_bytes",
+]
+
+#: The `ghrepo` functions measured as a whole by `Instrumentation`
+GIT_FUNCTIONS = ["is_git_repo", "get_repo_context"]
+
+#: A function called with the name of a measurement, the time it took in
+#: seconds, and whether it succeeded
+Callback = Callable[[str, float, bool], None]
+
+
+class CallStats(NamedTuple):
+    """Accumulated statistics for one measured function or URL form"""
+
+    #: The number of calls or matched URLs
+    calls: int
+    #: The number of calls that raised an exception (or, for
+    #: ``url_form/none``, the number of URLs that did not match)
+    failures: int
+    #: The total time spent in the calls, in seconds
+    total_time: float
+
+
+class Instrumentation:
+    """
+    A collector of call statistics for ghrepo's parsing and Git functions.
+    Statistics are only collected while the instance is installed, either via
+    `install()` & `uninstall()` or by using the instance as a context manager.
+    If ``callback`` is given, it is additionally called after every
+    measurement, which allows forwarding individual timings to a metrics
+    system.
+
+    Only one `Instrumentation` can be installed at a time.
+    """
+
+    def __init__(self, callback: Callback | None = None) -> None:
+        self.callback = callback
+        self._lock = threading.Lock()
+        # Mapping from names to ``[calls, failures, total_time]`` lists:
+        self._stats: dict[str, list[Any]] = {}
+        # Original functions, saved while installed:
+        self._saved: dict[str, Any] | None = None
+
+    def __enter__(self) -> Instrumentation:
+        self.install()
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: TracebackType | None,
+    ) -> None:
+        self.uninstall()
+
+    @property
+    def installed(self) -> bool:
+        """Whether the instrumentation is currently installed"""
+        return self._saved is not None
+
+    def install(self) -> None:
+        """
+        Start measuring calls.  Raises `RuntimeError` if this or another
+        `Instrumentation` is already installed.
+        """
+        if isinstance(ghrepo._match_url, InstrumentedMatcher):
+            raise RuntimeError("An Instrumentation is already installed")
+        saved: dict[str, Any] = {
+            "_match_url": ghrepo._match_url,
+            "_readgit_hook": ghrepo._readgit_hook,
+        }
+        for name in PARSE_METHODS:
+            method = GHRepo.__dict__[name]
+            saved[f"GHRepo.{name}"] = method
+            setattr(
+                GHRepo, name, classmethod(self.wrap(f"GHRepo.{name}", method.__func__))
+            )
+        for name in GIT_FUNCTIONS:
+            func = saved[name] = getattr(ghrepo, name)
+            setattr(ghrepo, name, self.wrap(name, func))
+        ghrepo._match_url = InstrumentedMatcher(self.record)
+        inner = ghrepo._readgit_hook or ghrepo._spawn_readgit
+        ghrepo._readgit_hook = self.wrap_readgit(inner)
+        self._saved = saved
+
+    def uninstall(self) -> None:
+        """Stop measuring calls.  Collected statistics are kept."""
+        saved = self._saved
+        if saved is None:
+            return
+        for name in PARSE_METHODS:
+            setattr(GHRepo, name, saved[f"GHRepo.{name}"])
+        for name in GIT_FUNCTIONS:
+            setattr(ghrepo, name, saved[name])
+        ghrepo._match_url = saved["_match_url"]
+        ghrepo._readgit_hook = saved["_readgit_hook"]
+        self._saved = None
+
+    def snapshot(self) -> dict[str, CallStats]:
+        """
+        Return a copy of the statistics collected so far, keyed by measurement
+        name.  Names with no calls are omitted.
+        """
+        with self._lock:
+            return {
+                name: CallStats(calls, failures, total)
+                for name, (calls, failures, total) in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        """Discard all statistics collected so far"""
+        with self._lock:
+            self._stats.clear()
+
+    def record(self, name: str, elapsed: float, ok: bool) -> None:
+        """Add a single measurement to the statistics"""
+        with self._lock:
+            try:
+                stats = self._stats[name]
+            except KeyError:
+                stats = self._stats[name] = [0, 0, 0.0]
+            stats[0] += 1
+            if not ok:
+                stats[1] += 1
+            stats[2] += elapsed
+        if self.callback is not None:
+            self.callback(name, elapsed, ok)
+
+    def wrap(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Return a wrapper around ``func`` that records each call under ``name``
+        """
+        record = self.record
+        perf_counter = time.perf_counter
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter()
+            try:
+                r = func(*args, **kwargs)
+            except BaseException:
+                record(name, perf_counter() - start, False)
+                raise
+            record(name, perf_counter() - start, True)
+            return r
+
+        wrapper.__wrapped__ = func  # type: ignore[attr-defined]
+        return wrapper
+
+    def wrap_readgit(self, inner: Callable[..., str]) -> Callable[..., str]:
+        """
+        Return a `ghrepo.readgit()` hook that runs ``git`` via ``inner`` and
+        records each command under ``git/{subcommand}``
+        """
+        record = self.record
+        perf_counter = time.perf_counter
+
+        def readgit(*args: str, dirpath: ghrepo.AnyPath | None) -> str:
+            name = f"git/{args[0]}" if args else "git"
+            start = perf_counter()
+            try:
+                r = inner(*args, dirpath=dirpath)
+            except BaseException:
+                record(name, perf_counter() - start, False)
+                raise
+            record(name, perf_counter() - start, True)
+            return r
+
+        return readgit
+
+
+class InstrumentedMatcher:
+    """
+    Replacement for ``ghrepo._match_url()`` that records the time taken by
+    each match under the name of the URL form that matched
+    """
+
+    def __init__(self, record: Callback) -> None:
+        self.record = record
+        self.names: dict[str | None, str] = {
+            f"name{i}": f"url_form/{name}" for i, name in enumerate(URL_FORM_NAMES)
+        }
+
+    def __call__(self, url: str) -> tuple[str, str] | None:
+        if len(url) > ghrepo._MAX_URL_LENGTH:
+            return None
+        perf_counter = time.perf_counter
+        start = perf_counter()
+        m = ghrepo._url_crgx().fullmatch(url)
+        elapsed = perf_counter() - start
+        if m is None:
+            self.record("url_form/none", elapsed, False)
+            return None
+        self.record(self.names[m.lastgroup], elapsed, True)
+        owner, name = ghrepo._URL_GROUPS[m.lastgroup]
+        return (m[owner], m[name])
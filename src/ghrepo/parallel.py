@@ -0,0 +1,214 @@
+"""
+.. versionadded:: 0.8.0
+
+Parse large batches of repository specifiers or URLs in a pool of processes
+
+`GHRepo.parse_many()` is bound to a single core, so for very large inputs this
+module splits the input into chunks and parses them in parallel with a
+`~concurrent.futures.ProcessPoolExecutor`.  `parse_parallel()` takes any
+iterable of strings, while `parse_file_parallel()` splits a file into byte
+ranges that the worker processes read themselves, so that the parent process
+never has to touch the input.
+
+To keep the cost of passing results between processes down, each chunk's
+repositories are sent back as a single string of newline-separated
+``{owner}/{name}`` fullnames rather than as a list of pickled `GHRepo`
+instances; see `ParsedChunk`.
+"""
+
+from __future__ import annotations
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+import os
+from typing import Any, NamedTuple
+from . import AnyPath, GHRepo, ParseResults, is_valid_owner
+
+__all__ = ["ParsedChunk", "parse_file_parallel", "parse_parallel"]
+
+#: The default number of inputs per chunk for `parse_parallel()`
+DEFAULT_CHUNK_SIZE = 8192
+
+#: The default number of bytes per shard for `parse_file_parallel()`
+DEFAULT_SHARD_SIZE = 1 << 22
+
+
+class ParsedChunk(NamedTuple):
+    """The results of parsing one chunk of input in a worker process"""
+
+    #: The position of the chunk in the input, counting from zero
+    seq: int
+    #: The number of inputs in the chunk
+    size: int
+    #: The successfully-parsed repositories as newline-separated
+    #: ``{owner}/{name}`` strings, in input order; use `repos()` to convert
+    #: them to `GHRepo` instances
+    packed: str
+    #: ``(index, input)`` pairs for each input that could not be parsed, in
+    #: input order, where ``index`` is relative to the start of the chunk
+    failures: list[tuple[int, str]]
+
+    def repos(self) -> list[GHRepo]:
+        """Return the successfully-parsed repositories as `GHRepo` instances"""
+        if not self.packed:
+            return []
+        new = tuple.__new__
+        return [new(GHRepo, s.split("/")) for s in self.packed.split("\n")]
+
+
+def parse_parallel(
+    specs: Iterable[str],
+    url_only: bool = False,
+    default_owner: str | None = None,
+    max_workers: int | None = None,
+    ordered: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[ParsedChunk]:
+    """
+    Parse the repository specifiers in ``specs`` with `GHRepo.parse_many()`
+    (or the URLs with `GHRepo.parse_url_many()`, if ``url_only`` is true) in
+    a pool of ``max_workers`` processes (default: the number of CPUs),
+    ``chunk_size`` inputs at a time, and yield a `ParsedChunk` for each chunk.
+
+    If ``ordered`` is true, chunks are yielded in input order; otherwise, they
+    are yielded as soon as they are parsed.  ``specs`` is consumed lazily,
+    with at most twice as many chunks in flight as there are workers.
+
+    Raises `ValueError` if ``default_owner`` is not a valid GitHub owner name
+    or ``max_workers`` is less than 1.
+    """
+    check_args(default_owner, max_workers)
+    it = iter(specs)
+    jobs = (
+        (parse_chunk, seq, chunk, url_only, default_owner)
+        for seq, chunk in enumerate(iter(lambda: list(islice(it, chunk_size)), []))
+    )
+    return run_jobs(jobs, max_workers, ordered)
+
+
+def parse_file_parallel(
+    path: AnyPath,
+    url_only: bool = False,
+    default_owner: str | None = None,
+    max_workers: int | None = None,
+    ordered: bool = True,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> Iterator[ParsedChunk]:
+    """
+    Parse each line of the UTF-8 text file at ``path`` (with leading &
+    trailing whitespace stripped) like `parse_parallel()`.  The file is split
+    into shards of about ``shard_size`` bytes that end at line boundaries, and
+    each worker process reads & decodes its own shard, so that the input is
+    never passed between processes.  Each `ParsedChunk` corresponds to a
+    shard, and its ``size`` is the number of lines in the shard.
+
+    Raises `ValueError` if ``default_owner`` is not a valid GitHub owner name
+    or ``max_workers`` is less than 1.
+    """
+    check_args(default_owner, max_workers)
+    jobs = (
+        (parse_shard, seq, os.fsdecode(path), start, end, url_only, default_owner)
+        for seq, (start, end) in enumerate(shard_file(path, shard_size))
+    )
+    return run_jobs(jobs, max_workers, ordered)
+
+
+def check_args(default_owner: str | None, max_workers: int | None) -> None:
+    """
+    Check the arguments shared by `parse_parallel()` and
+    `parse_file_parallel()` before any work is started
+    """
+    # Repositories are packed as ``{owner}/{name}`` strings (see
+    # `ParsedChunk`), so an owner containing a slash would corrupt them.
+    if default_owner is not None and not is_valid_owner(default_owner):
+        raise ValueError(f"Invalid default owner: {default_owner!r}")
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, not {max_workers}")
+
+
+def shard_file(path: AnyPath, shard_size: int) -> Iterator[tuple[int, int]]:
+    """
+    Yield ``(start, end)`` byte ranges of about ``shard_size`` bytes that
+    together cover the file at ``path``, each ending just after a newline (or
+    at the end of the file)
+    """
+    with open(path, "rb") as fp:
+        size = os.fstat(fp.fileno()).st_size
+        start = 0
+        while start < size:
+            fp.seek(min(start + shard_size, size) - 1)
+            # Read to the end of the line containing the last byte of the
+            # shard:
+            end = fp.tell() + len(fp.readline())
+            yield (start, end)
+            start = end
+
+
+def run_jobs(
+    jobs: Iterator[tuple[Any, ...]], max_workers: int | None, ordered: bool
+) -> Iterator[ParsedChunk]:
+    """
+    Run each ``(func, *args)`` job in a process pool and yield the results,
+    in submission order if ``ordered`` is true
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    # Limit the number of queued jobs so that memory use stays bounded when
+    # the input is read faster than it is parsed:
+    max_pending = 2 * max_workers
+    with ProcessPoolExecutor(max_workers) as executor:
+        if ordered:
+            queue: deque[Future[ParsedChunk]] = deque()
+            for func, *args in jobs:
+                queue.append(executor.submit(func, *args))
+                if len(queue) >= max_pending:
+                    yield queue.popleft().result()
+            while queue:
+                yield queue.popleft().result()
+        else:
+            pending: set[Future[ParsedChunk]] = set()
+            for func, *args in jobs:
+                pending.add(executor.submit(func, *args))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        yield fut.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    yield fut.result()
+
+
+def parse_chunk(
+    seq: int, specs: list[str], url_only: bool, default_owner: str | None
+) -> ParsedChunk:
+    if url_only:
+        results = GHRepo.parse_url_many(specs)
+    else:
+        results = GHRepo.parse_many(specs, default_owner=default_owner)
+    return pack(seq, len(specs), results)
+
+
+def parse_shard(
+    seq: int,
+    path: str,
+    start: int,
+    end: int,
+    url_only: bool,
+    default_owner: str | None,
+) -> ParsedChunk:
+    with open(path, "rb") as fp:
+        fp.seek(start)
+        text = fp.read(end - start).decode("utf-8")
+    # Split lines the same way as a file opened in text mode with universal
+    # newlines:
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return parse_chunk(seq, [ln.strip() for ln in lines], url_only, default_owner)
+
+
+def pack(seq: int, size: int, results: ParseResults) -> ParsedChunk:
+    packed = "\n".join([f"{owner}/{name}" for owner, name in results.repos])
+    return ParsedChunk(seq, size, packed, results.failures)
@@ -0,0 +1,267 @@
+"""
+.. versionadded:: 0.8.0
+
+A compact container for large collections of `GHRepo` values
+
+A `GHRepo` is a tuple holding its own owner & name strings, so a list of
+millions of them spends most of its memory on tuple headers and duplicate
+copies of the same owner names.  `GHRepoSet` instead stores each distinct
+owner & name string once, records every repository as a pair of integer IDs
+in two `array.array` columns, and indexes the rows with an open-addressing
+hash table of row numbers, bringing the per-repository cost down to a couple
+dozen bytes.  `GHRepo` instances are only created when the set is iterated
+over.
+
+`GHRepoIndex` is a set of `GHRepo` values that compares them
+case-insensitively, as GitHub does, for deduplicating & joining lists of
+repositories from different sources.
+"""
+
+from __future__ import annotations
+from array import array
+from collections.abc import Iterable, Iterator, Set
+import sys
+from typing import NamedTuple
+from . import GHRepo, _casefold_key
+
+__all__ = ["Footprint", "GHRepoIndex", "GHRepoSet"]
+
+#: The initial number of slots in a `GHRepoSet`'s hash table (must be a power
+#: of two)
+MIN_SLOTS = 8
+
+
+class Footprint(NamedTuple):
+    """
+    The approximate memory usage of a `GHRepoSet`, as returned by
+    `GHRepoSet.footprint()`
+    """
+
+    #: The number of bytes used by the `GHRepoSet`, including its strings
+    nbytes: int
+    #: The number of bytes that would be used by a `list` of the same
+    #: repositories as `GHRepo` instances, each with its own owner & name
+    #: strings
+    list_nbytes: int
+
+
+class GHRepoSet(Set[GHRepo]):
+    """
+    A set of `GHRepo` values stored in columnar form with interned owners &
+    names.  Repositories are kept in the order in which they were first added,
+    and adding a repository that is already present does nothing.
+    Repositories cannot be removed.
+
+    Like `GHRepo` equality, membership is case-sensitive.
+    """
+
+    def __init__(self, repos: Iterable[GHRepo] = ()) -> None:
+        self._owners: list[str] = []
+        self._owner_ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._name_ids: dict[str, int] = {}
+        # Column of owner IDs, one per row
+        self._owner_col = array("I")
+        # Column of name IDs, one per row
+        self._name_col = array("I")
+        # Hash table of row numbers plus one; zero marks an empty slot
+        self._slots = array("I", bytes(4 * MIN_SLOTS))
+        self.update(repos)
+
+    def __len__(self) -> int:
+        return len(self._owner_col)
+
+    def __contains__(self, repo: object) -> bool:
+        if not isinstance(repo, tuple) or len(repo) != 2:
+            return False
+        owner, name = repo
+        if not isinstance(owner, str) or not isinstance(name, str):
+            return False
+        oid = self._owner_ids.get(owner)
+        if oid is None:
+            return False
+        nid = self._name_ids.get(name)
+        if nid is None:
+            return False
+        return self._find(oid, nid) >= 0
+
+    def __iter__(self) -> Iterator[GHRepo]:
+        owners = self._owners
+        names = self._names
+        new = tuple.__new__
+        for oid, nid in zip(self._owner_col, self._name_col):
+            yield new(GHRepo, (owners[oid], names[nid]))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def add(self, repo: GHRepo) -> None:
+        """Add a repository to the set if it is not already present"""
+        self.update((repo,))
+
+    def update(self, repos: Iterable[GHRepo]) -> None:
+        """Add each of the given repositories to the set"""
+        owners = self._owners
+        owner_ids = self._owner_ids
+        names = self._names
+        name_ids = self._name_ids
+        owner_col = self._owner_col
+        name_col = self._name_col
+        slots = self._slots
+        mask = len(slots) - 1
+        # Grow the hash table once the load factor would exceed 2/3:
+        limit = 2 * len(slots) // 3
+        n = len(owner_col)
+        for owner, name in repos:
+            oid = owner_ids.get(owner)
+            if oid is None:
+                oid = owner_ids[owner] = len(owners)
+                owners.append(owner)
+            nid = name_ids.get(name)
+            if nid is None:
+                nid = name_ids[name] = len(names)
+                names.append(name)
+            i = hash((oid, nid)) & mask
+            while r := slots[i]:
+                if owner_col[r - 1] == oid and name_col[r - 1] == nid:
+                    break
+                i = (i + 1) & mask
+            else:
+                owner_col.append(oid)
+                name_col.append(nid)
+                n += 1
+                slots[i] = n
+                if n > limit:
+                    self._rehash(2 * len(slots))
+                    slots = self._slots
+                    mask = len(slots) - 1
+                    limit = 2 * len(slots) // 3
+
+    def owners(self) -> list[str]:
+        """Return a list of the distinct owners in the set"""
+        return list(self._owners)
+
+    def names_by_owner(self) -> dict[str, list[str]]:
+        """
+        Group the set's repositories by owner, returning a `dict` that maps
+        each owner to the names of its repositories, in insertion order.  The
+        strings are shared with the set rather than copied.
+        """
+        groups: list[list[str]] = [[] for _ in self._owners]
+        names = self._names
+        for oid, nid in zip(self._owner_col, self._name_col):
+            groups[oid].append(names[nid])
+        return dict(zip(self._owners, groups))
+
+    def footprint(self) -> Footprint:
+        """
+        Return the approximate memory usage of the set alongside that of a
+        `list` of the same repositories as `GHRepo` instances
+        """
+        getsizeof = sys.getsizeof
+        owner_sizes = [getsizeof(s) for s in self._owners]
+        name_sizes = [getsizeof(s) for s in self._names]
+        nbytes = (
+            getsizeof(self)
+            + sum(
+                getsizeof(obj)
+                for obj in (
+                    self._owners,
+                    self._owner_ids,
+                    self._names,
+                    self._name_ids,
+                    self._owner_col,
+                    self._name_col,
+                    self._slots,
+                )
+            )
+            + sum(owner_sizes)
+            + sum(name_sizes)
+        )
+        n = len(self)
+        list_nbytes = (
+            getsizeof([None] * n)
+            + n * getsizeof(GHRepo("", ""))
+            + sum(map(owner_sizes.__getitem__, self._owner_col))
+            + sum(map(name_sizes.__getitem__, self._name_col))
+        )
+        return Footprint(nbytes=nbytes, list_nbytes=list_nbytes)
+
+    def _find(self, oid: int, nid: int) -> int:
+        """
+        Return the row number of the repository with the given owner & name
+        IDs, or -1 if it is not present
+        """
+        slots = self._slots
+        mask = len(slots) - 1
+        i = hash((oid, nid)) & mask
+        owner_col = self._owner_col
+        name_col = self._name_col
+        while r := slots[i]:
+            if owner_col[r - 1] == oid and name_col[r - 1] == nid:
+                return r - 1
+            i = (i + 1) & mask
+        return -1
+
+    def _rehash(self, nslots: int) -> None:
+        slots = array("I", bytes(4 * nslots))
+        mask = nslots - 1
+        for r, key in enumerate(zip(self._owner_col, self._name_col), start=1):
+            i = hash(key) & mask
+            while slots[i]:
+                i = (i + 1) & mask
+            slots[i] = r
+        self._slots = slots
+
+
+class GHRepoIndex(Set[GHRepo]):
+    """
+    A set of `GHRepo` values in which repositories whose owners & names differ
+    only in case are considered the same, as they are on GitHub.  The first
+    spelling of each repository added to the index is the one that is kept and
+    returned by lookups.  Membership tests & lookups take constant time.
+    """
+
+    def __init__(self, repos: Iterable[GHRepo] = ()) -> None:
+        # Mapping from `GHRepo.casefold_key` values to the first-seen spelling
+        self._repos: dict[str, GHRepo] = {}
+        self.update(repos)
+
+    def __len__(self) -> int:
+        return len(self._repos)
+
+    def __contains__(self, repo: object) -> bool:
+        # Like `GHRepoSet`, accept any ``(owner, name)`` pair of strings, as
+        # `GHRepo` instances compare equal to them.
+        if not isinstance(repo, tuple) or len(repo) != 2:
+            return False
+        owner, name = repo
+        if not isinstance(owner, str) or not isinstance(name, str):
+            return False
+        return _casefold_key(owner, name) in self._repos
+
+    def __iter__(self) -> Iterator[GHRepo]:
+        return iter(self._repos.values())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def add(self, repo: GHRepo) -> GHRepo:
+        """
+        Add a repository to the index if no spelling of it is already present,
+        and return the spelling stored in the index
+        """
+        return self._repos.setdefault(repo.casefold_key, repo)
+
+    def update(self, repos: Iterable[GHRepo]) -> None:
+        """Add each of the given repositories to the index"""
+        setdefault = self._repos.setdefault
+        for r in repos:
+            setdefault(r.casefold_key, r)
+
+    def get(self, repo: GHRepo) -> GHRepo | None:
+        """
+        Return the spelling of ``repo`` stored in the index, or `None` if it is
+        not present
+        """
+        return self._repos.get(repo.casefold_key)
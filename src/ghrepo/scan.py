@@ -0,0 +1,179 @@
+"""
+.. versionadded:: 0.8.0
+
+Find the Git repositories under a directory tree (or take a list of them) and
+determine their GitHub repositories in parallel
+"""
+
+from __future__ import annotations
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+import os
+from pathlib import Path
+import subprocess
+from typing import TYPE_CHECKING, NamedTuple
+from . import AnyPath, GHRepo, NoSuchRemoteError
+from . import get_local_repo as git_get_local_repo
+from .gitdir import get_local_repo as gitdir_get_local_repo
+
+if TYPE_CHECKING:
+    from .diskcache import LocalRepoCache
+
+__all__ = ["ScanResult", "find_git_repos", "resolve_repos", "scan_repos"]
+
+
+class ScanResult(NamedTuple):
+    """The outcome of determining the GitHub repository for one local repository"""
+
+    #: The path to the local repository's working tree
+    path: Path
+    #: The GitHub repository, or `None` if it could not be determined
+    repo: GHRepo | None
+    #: The error that occurred while determining the GitHub repository, or
+    #: `None` if there was no error
+    error: Exception | None
+
+
+def find_git_repos(root: AnyPath, nested: bool = False) -> Iterator[Path]:
+    """
+    Walk the directory tree rooted at ``root`` (without following symlinks)
+    and yield the path to each Git working tree found, i.e., each directory
+    that contains a ``.git`` directory or a ``.git`` file (as used by linked
+    worktrees & submodules).  If ``nested`` is false, repositories inside of
+    other repositories' working trees are not searched for.  Directories that
+    cannot be read are skipped.
+    """
+    stack = [Path(os.fsdecode(root))]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs: list[Path] = []
+        is_repo = False
+        for e in entries:
+            if e.name == ".git":
+                is_repo = True
+            elif e.is_dir(follow_symlinks=False):
+                subdirs.append(Path(e.path))
+        if is_repo:
+            yield d
+            if not nested:
+                continue
+        stack.extend(reversed(subdirs))
+
+
+def scan_repos(
+    root: AnyPath,
+    remote: str = "origin",
+    max_workers: int | None = None,
+    use_processes: bool = False,
+    nested: bool = False,
+    use_git: bool = False,
+) -> Iterator[ScanResult]:
+    """
+    Find all Git repositories under ``root`` (see `find_git_repos()`) and
+    determine the GitHub repository for each one's ``remote`` remote using a
+    pool of at most ``max_workers`` threads (or processes, if
+    ``use_processes`` is true).  Results are yielded in the order that they
+    complete, and the directory tree is walked lazily, so results start
+    arriving before the walk is finished.
+
+    By default, remotes are resolved with `ghrepo.gitdir.get_local_repo()`,
+    which only runs ``git`` if it cannot read the repository's configuration
+    itself; if ``use_git`` is true, `ghrepo.get_local_repo()` is used instead.
+
+    Errors that occur while resolving an individual repository
+    (`NoSuchRemoteError`, `subprocess.CalledProcessError`, `ValueError` for
+    non-GitHub URLs, and `OSError`) are reported in the ``error`` field of the
+    corresponding `ScanResult` rather than raised.
+    """
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+    executor: Executor
+    if use_processes:
+        executor = ProcessPoolExecutor(max_workers)
+    else:
+        executor = ThreadPoolExecutor(max_workers)
+    # Limit the number of queued jobs so that memory use stays bounded when
+    # the walk outpaces resolution:
+    max_pending = 2 * max_workers
+    with executor:
+        pending: set[Future[ScanResult]] = set()
+        for path in find_git_repos(root, nested=nested):
+            pending.add(executor.submit(resolve, path, remote, use_git))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    yield fut.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                yield fut.result()
+
+
+def resolve_repos(
+    dirpaths: Iterable[AnyPath],
+    remote: str = "origin",
+    max_workers: int | None = None,
+    use_git: bool = False,
+    cache: LocalRepoCache | None = None,
+) -> Iterator[ScanResult]:
+    """
+    Determine the GitHub repository for the ``remote`` remote of each local
+    repository in ``dirpaths`` using a pool of at most ``max_workers`` threads,
+    yielding a `ScanResult` for each one in the same order as ``dirpaths``.
+    ``dirpaths`` is consumed lazily, so results start arriving before it is
+    exhausted.
+
+    Remotes are resolved as by `scan_repos()`, except that if ``cache`` is
+    given, they are looked up in & added to it with
+    `ghrepo.diskcache.LocalRepoCache.get_local_repo()`.
+    Errors that occur while resolving an individual repository are reported
+    in the ``error`` field of the corresponding `ScanResult` rather than
+    raised, the same as for `scan_repos()`.
+    """
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+    # Keep a bounded number of jobs in flight, and yield their results in
+    # submission order:
+    max_pending = 2 * max_workers
+    with ThreadPoolExecutor(max_workers) as executor:
+        pending: deque[Future[ScanResult]] = deque()
+        for p in dirpaths:
+            path = Path(os.fsdecode(p))
+            pending.append(executor.submit(resolve, path, remote, use_git, cache))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def resolve(
+    path: Path, remote: str, use_git: bool, cache: LocalRepoCache | None = None
+) -> ScanResult:
+    if cache is not None:
+        get_local_repo = cache.get_local_repo
+    elif use_git:
+        get_local_repo = git_get_local_repo
+    else:
+        get_local_repo = gitdir_get_local_repo
+    try:
+        return ScanResult(path, get_local_repo(path, remote=remote), None)
+    except (
+        NoSuchRemoteError,
+        subprocess.CalledProcessError,
+        ValueError,
+        OSError,
+    ) as e:
+        return ScanResult(path, None, e)
@@ -14,7 +14,7 @@ class TmpRepo(NamedTuple):
     upstreams: dict[str, GHRepo]
 
     def run(self, *args: str) -> None:
-        subprocess.run(["git", *args], check=True, cwd=self.path)
+        git(*args, cwd=self.path)
 
     def detach(self) -> None:
         (self.path / "file.txt").write_text("This is test text\n")
@@ -26,34 +26,76 @@ class TmpRepo(NamedTuple):
         self.run("checkout", "HEAD^")
 
 
-@pytest.fixture(scope="session")
-def tmp_repo(tmp_path_factory: pytest.TempPathFactory) -> TmpRepo:
+def git(*args: str, cwd: Path) -> str:
+    """
+    Run ``git`` in ``cwd`` with a committer identity configured and return its
+    stripped output
+    """
+    return subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=Test",
+            "-c",
+            "user.email=test@example.nil",
+            *args,
+        ],
+        cwd=cwd,
+        check=True,
+        stdout=subprocess.PIPE,
+        text=True,
+    ).stdout.strip()
+
+
+def make_repo(
+    path: Path, remotes: dict[str, str] | None = None, branch: str = "main"
+) -> Path:
+    """
+    Create a Git repository at ``path`` (creating any missing parent
+    directories) with the given initial branch and a remote for each
+    name-to-URL pair in ``remotes``, and return ``path``.  Skips the current
+    test if Git is not installed.
+    """
     if shutil.which("git") is None:
         pytest.skip("Git not installed")
-    tmp_path = tmp_path_factory.mktemp("tmp_repo")
+    path.mkdir(parents=True, exist_ok=True)
+    git("-c", f"init.defaultBranch={branch}", "init", "-q", cwd=path)
+    for name, url in (remotes or {}).items():
+        git("remote", "add", name, url, cwd=path)
+    return path
+
+
+@pytest.fixture
+def isolated_git_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """
+    Make Git (and `ghrepo.gitdir`) ignore the user's & system's configuration
+    and any Git environment variables by pointing :envvar:`HOME` at a new,
+    empty directory, which is returned
+    """
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    for var in ["GIT_DIR", "GIT_CONFIG_GLOBAL", "GIT_CONFIG_PARAMETERS"]:
+        monkeypatch.delenv(var, raising=False)
+    return home
+
+
+@pytest.fixture(scope="session")
+def tmp_repo(tmp_path_factory: pytest.TempPathFactory) -> TmpRepo:
     BRANCH = "trunk"
     REMOTES = {
         "origin": GHRepo("octocat", "repository"),
         "upstream": GHRepo("foobar", "repo"),
     }
-    subprocess.run(
-        ["git", "-c", f"init.defaultBranch={BRANCH}", "init"],
-        check=True,
-        cwd=str(tmp_path),
-    )
-    subprocess.run(
-        ["git", "remote", "add", "origin", REMOTES["origin"].ssh_url],
-        check=True,
-        cwd=str(tmp_path),
-    )
-    subprocess.run(
-        ["git", "remote", "add", "upstream", REMOTES["upstream"].clone_url],
-        check=True,
-        cwd=str(tmp_path),
-    )
-    subprocess.run(
-        ["git", "config", "branch.draft.remote", "upstream"],
-        check=True,
-        cwd=str(tmp_path),
+    path = make_repo(
+        tmp_path_factory.mktemp("tmp_repo"),
+        {
+            "origin": REMOTES["origin"].ssh_url,
+            "upstream": REMOTES["upstream"].clone_url,
+        },
+        branch=BRANCH,
     )
-    return TmpRepo(tmp_path, BRANCH, REMOTES, {"draft": REMOTES["upstream"]})
+    git("config", "branch.draft.remote", "upstream", cwd=path)
+    return TmpRepo(path, BRANCH, REMOTES, {"draft": REMOTES["upstream"]})
@@ -0,0 +1,92 @@
+from __future__ import annotations
+import asyncio
+from pathlib import Path
+import shutil
+import subprocess
+from conftest import TmpRepo, make_repo
+import pytest
+from ghrepo import DetachedHeadError, GHRepo, NoSuchRemoteError, NoUpstreamError
+from ghrepo.aio import (
+    get_branch_upstream,
+    get_current_branch,
+    get_local_repo,
+    is_git_repo,
+)
+
+
+def test_is_git_repo(monkeypatch: pytest.MonkeyPatch, tmp_repo: TmpRepo) -> None:
+    assert asyncio.run(is_git_repo(tmp_repo.path))
+    monkeypatch.chdir(tmp_repo.path)
+    assert asyncio.run(is_git_repo())
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="Git not installed")
+def test_is_not_git_repo(tmp_path: Path) -> None:
+    assert not asyncio.run(is_git_repo(tmp_path))
+
+
+def test_get_current_branch(monkeypatch: pytest.MonkeyPatch, tmp_repo: TmpRepo) -> None:
+    assert asyncio.run(get_current_branch(tmp_repo.path)) == tmp_repo.branch
+    monkeypatch.chdir(tmp_repo.path)
+    assert asyncio.run(get_current_branch()) == tmp_repo.branch
+
+
+def test_get_current_branch_detached(tmp_path: Path) -> None:
+    make_repo(tmp_path)
+    (tmp_path / ".git" / "HEAD").write_text(
+        "0123456789abcdef0123456789abcdef01234567\n"
+    )
+    with pytest.raises(DetachedHeadError):
+        asyncio.run(get_current_branch(tmp_path))
+
+
+def test_get_local_repo(tmp_repo: TmpRepo) -> None:
+    assert asyncio.run(get_local_repo(tmp_repo.path)) == tmp_repo.remotes["origin"]
+    assert (
+        asyncio.run(get_local_repo(tmp_repo.path, remote="upstream"))
+        == tmp_repo.remotes["upstream"]
+    )
+
+
+def test_get_local_repo_no_such_remote(tmp_repo: TmpRepo) -> None:
+    with pytest.raises(NoSuchRemoteError) as excinfo:
+        asyncio.run(get_local_repo(tmp_repo.path, "downstream"))
+    assert excinfo.value.remote == "downstream"
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="Git not installed")
+def test_get_local_repo_not_repo(tmp_path: Path) -> None:
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        asyncio.run(get_local_repo(tmp_path))
+    assert excinfo.value.returncode == 128
+    assert excinfo.value.cmd == ["git", "remote", "get-url", "--", "origin"]
+
+
+def test_get_branch_upstream(tmp_repo: TmpRepo) -> None:
+    assert (
+        asyncio.run(get_branch_upstream("draft", tmp_repo.path))
+        == tmp_repo.upstreams["draft"]
+    )
+    with pytest.raises(NoUpstreamError) as excinfo:
+        asyncio.run(get_branch_upstream("main", tmp_repo.path))
+    assert excinfo.value.branch == "main"
+
+
+def test_concurrent_with_limiter(tmp_repo: TmpRepo) -> None:
+    async def run() -> list[GHRepo]:
+        limiter = asyncio.Semaphore(4)
+        return await asyncio.gather(
+            *(
+                get_local_repo(tmp_repo.path, remote=remote, limiter=limiter)
+                for remote in ["origin", "upstream"] * 25
+            )
+        )
+
+    assert (
+        asyncio.run(run())
+        == [
+            tmp_repo.remotes["origin"],
+            tmp_repo.remotes["upstream"],
+        ]
+        * 25
+    )
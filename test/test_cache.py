@@ -0,0 +1,81 @@
+from __future__ import annotations
+import pytest
+from pytest_mock import MockerFixture
+from ghrepo import CacheInfo, GHRepo, ParseCache
+
+
+def test_parse_cache_hits() -> None:
+    cache = ParseCache()
+    assert cache.cache_info() == CacheInfo(0, 0, 0, 4096, 0)
+    for _ in range(3):
+        assert cache.parse("jwodder/ghrepo") == GHRepo("jwodder", "ghrepo")
+    assert cache.cache_info() == CacheInfo(2, 1, 0, 4096, 1)
+    for _ in range(2):
+        assert cache.parse_url("https://github.com/jwodder/ghrepo") == GHRepo(
+            "jwodder", "ghrepo"
+        )
+    assert cache.cache_info() == CacheInfo(3, 2, 0, 4096, 2)
+
+
+def test_parse_cache_skips_regexes(mocker: MockerFixture) -> None:
+    cache = ParseCache()
+    assert cache.parse("git@github.com:jwodder/ghrepo.git") == GHRepo(
+        "jwodder", "ghrepo"
+    )
+    spy = mocker.patch("ghrepo._match_url")
+    assert cache.parse("git@github.com:jwodder/ghrepo.git") == GHRepo(
+        "jwodder", "ghrepo"
+    )
+    spy.assert_not_called()
+
+
+@pytest.mark.parametrize("repeats", [1, 2])
+def test_parse_cache_negative(repeats: int) -> None:
+    cache = ParseCache()
+    for _ in range(repeats):
+        with pytest.raises(ValueError) as excinfo:
+            cache.parse("https://gitlab.com/jwodder/ghrepo")
+        assert str(excinfo.value) == (
+            "Invalid GitHub URL: 'https://gitlab.com/jwodder/ghrepo'"
+        )
+        with pytest.raises(ValueError) as excinfo:
+            cache.parse_url("jwodder/ghrepo")
+        assert str(excinfo.value) == "Invalid GitHub URL: 'jwodder/ghrepo'"
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2 * (repeats - 1), 2, 2)
+
+
+def test_parse_cache_default_owner() -> None:
+    cache = ParseCache()
+    with pytest.raises(ValueError) as excinfo:
+        cache.parse("ghrepo")
+    assert str(excinfo.value) == "No owner given in 'ghrepo'"
+    assert cache.parse("ghrepo", "jwodder") == GHRepo("jwodder", "ghrepo")
+    assert cache.parse("ghrepo", lambda: "octocat") == GHRepo("octocat", "ghrepo")
+    assert cache.cache_info().currsize == 1
+
+
+def test_parse_cache_eviction() -> None:
+    cache = ParseCache(maxsize=2)
+    cache.parse("jwodder/foo")
+    cache.parse("jwodder/bar")
+    cache.parse("jwodder/foo")
+    cache.parse("jwodder/baz")
+    assert cache.cache_info() == CacheInfo(1, 3, 1, 2, 2)
+    # "jwodder/bar" was the least recently used and should have been evicted:
+    cache.parse("jwodder/foo")
+    cache.parse("jwodder/bar")
+    assert cache.cache_info() == CacheInfo(2, 4, 2, 2, 2)
+
+
+def test_parse_cache_clear() -> None:
+    cache = ParseCache()
+    cache.parse("jwodder/foo")
+    cache.parse("jwodder/foo")
+    cache.clear()
+    assert cache.cache_info() == CacheInfo(0, 0, 0, 4096, 0)
+
+
+def test_parse_cache_bad_maxsize() -> None:
+    with pytest.raises(ValueError):
+        ParseCache(maxsize=0)
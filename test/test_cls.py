@@ -1,4 +1,4 @@
-from ghrepo import GHRepo
+from ghrepo import GHRepo, RepoURLs, render_urls
 
 
 def test_stringification() -> None:
@@ -34,3 +34,30 @@ def test_ssh_url() -> None:
     r = GHRepo("octocat", "repository")
     assert r.ssh_url == "git@github.com:octocat/repository.git"
     assert GHRepo.parse_url(r.ssh_url) == r
+
+
+def test_urls() -> None:
+    r = GHRepo("octocat", "repository")
+    urls = r.urls()
+    assert urls == RepoURLs(
+        owner="octocat",
+        name="repository",
+        fullname=str(r),
+        api_url=r.api_url,
+        clone_url=r.clone_url,
+        git_url=r.git_url,
+        html_url=r.html_url,
+        ssh_url=r.ssh_url,
+    )
+    assert type(urls) is RepoURLs
+
+
+def test_render_urls() -> None:
+    repos = [GHRepo(f"owner{i}", f"repo.{i}") for i in range(10)]
+    urls = render_urls(iter(repos))
+    assert urls == [r.urls() for r in repos]
+    assert all(type(u) is RepoURLs for u in urls)
+
+
+def test_render_urls_empty() -> None:
+    assert render_urls([]) == []
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import io
 import json
 from pathlib import Path
 import subprocess
@@ -6,6 +7,7 @@ import sys
 from conftest import TmpRepo
 import pytest
 from pytest_mock import MockerFixture
+from ghrepo import __version__
 from ghrepo.__main__ import main
 
 
@@ -145,3 +147,142 @@ def test_command_no_such_remote(
     out, err = capsys.readouterr()
     assert out == ""
     assert err == ""
+
+
+@pytest.mark.parametrize(
+    "argv,dirpath",
+    [
+        (["--", "parse"], "parse"),
+        (["./scan"], "./scan"),
+        (["--json", "--", "extract"], "extract"),
+    ],
+)
+def test_command_subcommand_named_dir(
+    argv: list[str], dirpath: str, mocker: MockerFixture
+) -> None:
+    m = mocker.patch(
+        "subprocess.run",
+        return_value=subprocess.CompletedProcess(
+            args=["git", "remote", "get-url", "--", "origin"],
+            returncode=0,
+            stdout="git@github.com:jwodder/daemail.git\n",
+            stderr=None,
+        ),
+    )
+    assert main(argv) == 0
+    m.assert_called_once_with(
+        ["git", "remote", "get-url", "--", "origin"],
+        cwd=dirpath,
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+
+
+@pytest.mark.parametrize("opt", ["-V", "--version"])
+def test_command_version(
+    opt: str, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(sys, "argv", ["/usr/bin/ghrepo", opt])
+    assert main() == 0
+    out, err = capsys.readouterr()
+    assert out == f"ghrepo {__version__}\n"
+    assert err == ""
+    # The output is the same as argparse's:
+    with pytest.raises(SystemExit) as excinfo:
+        main([opt, "--json"])
+    assert excinfo.value.code == 0
+    assert capsys.readouterr() == (out, err)
+
+
+def test_command_import_is_lazy() -> None:
+    # Importing the CLI should not import modules or compile regexes that the
+    # command might not need.
+    code = (
+        "import sys, ghrepo, ghrepo.__main__\n"
+        "mods = {'argparse', 'json', 'subprocess', 'threading'}\n"
+        "print(sorted(mods & sys.modules.keys()))\n"
+        "print(sorted(k for k in ('OWNER_REPO_CRGX', 'GITHUB_URL_CREGEXEN')"
+        " if k in vars(ghrepo)))\n"
+    )
+    r = subprocess.run(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE, text=True, check=True
+    )
+    assert r.stdout.splitlines() == ["[]", "[]"]
+
+
+def test_command_batch(
+    capsys: pytest.CaptureFixture[str], tmp_repo: TmpRepo, tmp_path: Path
+) -> None:
+    bad = tmp_path / "nonexistent"
+    assert main([str(tmp_repo.path), str(bad), str(tmp_repo.path)]) == 1
+    out, err = capsys.readouterr()
+    r = tmp_repo.remotes["origin"]
+    assert out == f"{tmp_repo.path}\t{r}\n" * 2
+    assert err.startswith(f"ghrepo: {bad}: ")
+    assert err.count("\n") == 1
+
+
+def test_command_batch_json(
+    capsys: pytest.CaptureFixture[str], tmp_repo: TmpRepo, tmp_path: Path
+) -> None:
+    bad = tmp_path / "nonexistent"
+    assert (
+        main(["--json", "-j", "2", "-r", "upstream", str(bad), str(tmp_repo.path)]) == 1
+    )
+    out, err = capsys.readouterr()
+    r = tmp_repo.remotes["upstream"]
+    recs = [json.loads(line) for line in out.splitlines()]
+    assert len(recs) == 2
+    assert recs[0]["path"] == str(bad)
+    assert recs[0]["error"] is not None
+    assert all(v is None for k, v in recs[0].items() if k not in ("path", "error"))
+    assert recs[1] == {
+        "path": str(tmp_repo.path),
+        "owner": r.owner,
+        "name": r.name,
+        "fullname": str(r),
+        "api_url": r.api_url,
+        "clone_url": r.clone_url,
+        "git_url": r.git_url,
+        "html_url": r.html_url,
+        "ssh_url": r.ssh_url,
+        "error": None,
+    }
+    assert err == ""
+    assert list(recs[0]) == list(recs[1])
+
+
+def test_command_batch_stdin(
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_repo: TmpRepo,
+) -> None:
+    monkeypatch.setattr(
+        sys, "stdin", io.StringIO(f"{tmp_repo.path}\n\n{tmp_repo.path}\r\n")
+    )
+    assert main(["--stdin", str(tmp_repo.path)]) == 0
+    out, err = capsys.readouterr()
+    assert out == f"{tmp_repo.path}\t{tmp_repo.remotes['origin']}\n" * 3
+    assert err == ""
+
+
+def test_command_batch_all_failed(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(sys, "stdin", io.StringIO(""))
+    assert main(["--stdin"]) == 0
+    assert main([str(tmp_path / "foo"), str(tmp_path / "bar")]) == 2
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert err.count("\n") == 2
+
+
+@pytest.mark.parametrize("jobs", ["0", "-3"])
+def test_command_batch_bad_jobs(
+    jobs: str, capsys: pytest.CaptureFixture[str], tmp_path: Path
+) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        main(["-j", jobs, str(tmp_path / "foo"), str(tmp_path / "bar")])
+    assert excinfo.value.code == 2
+    assert "argument -j/--jobs: invalid positive_int value" in capsys.readouterr().err
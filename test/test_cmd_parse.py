@@ -0,0 +1,145 @@
+from __future__ import annotations
+import io
+from pathlib import Path
+import sys
+import pytest
+from ghrepo import __main__
+from ghrepo.__main__ import main
+
+INPUT = (
+    "jwodder/ghrepo\n"
+    "\n"
+    "  https://github.com/octocat/Hello-World.git  \n"
+    "https://gitlab.com/jwodder/ghrepo\n"
+    "ghrepo\n"
+    "git@github.com:jwodder/daemail.git\n"
+)
+
+
+def feed(monkeypatch: pytest.MonkeyPatch, text: str) -> None:
+    monkeypatch.setattr(sys, "stdin", io.StringIO(text))
+
+
+def test_parse_text(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    feed(monkeypatch, INPUT)
+    assert main(["parse"]) == 1
+    out, err = capsys.readouterr()
+    assert out == "jwodder/ghrepo\noctocat/Hello-World\njwodder/daemail\n"
+    assert err == (
+        "ghrepo: <stdin>:4: Invalid repository:"
+        " 'https://gitlab.com/jwodder/ghrepo'\n"
+        "ghrepo: <stdin>:5: Invalid repository: 'ghrepo'\n"
+    )
+
+
+def test_parse_skip_default_owner(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    feed(monkeypatch, INPUT)
+    assert main(["parse", "--invalid=skip", "-d", "octocat"]) == 0
+    out, err = capsys.readouterr()
+    assert out == (
+        "jwodder/ghrepo\n"
+        "octocat/Hello-World\n"
+        "octocat/ghrepo\n"
+        "jwodder/daemail\n"
+    )
+    assert err == ""
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "csv"])
+@pytest.mark.parametrize("owner", ['a"b', "x,y", "a/b", ""])
+def test_parse_invalid_default_owner(
+    fmt: str,
+    owner: str,
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    feed(monkeypatch, "foo\n")
+    with pytest.raises(SystemExit) as excinfo:
+        main(["parse", "-F", fmt, "-d", owner])
+    assert excinfo.value.code == 2
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert f"invalid default owner: {owner!r}" in err
+
+
+def test_parse_url_only(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    feed(monkeypatch, INPUT)
+    assert main(["parse", "--url", "--invalid", "skip"]) == 0
+    out, err = capsys.readouterr()
+    assert out == "octocat/Hello-World\njwodder/daemail\n"
+    assert err == ""
+
+
+def test_parse_jsonl(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    feed(monkeypatch, INPUT)
+    assert main(["parse", "-F", "jsonl", "--invalid=skip"]) == 0
+    out, _ = capsys.readouterr()
+    assert out == (
+        '{"owner": "jwodder", "name": "ghrepo"}\n'
+        '{"owner": "octocat", "name": "Hello-World"}\n'
+        '{"owner": "jwodder", "name": "daemail"}\n'
+    )
+
+
+def test_parse_csv_files(
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "a.txt").write_text("jwodder/ghrepo\nbad spec\n")
+    (tmp_path / "b.txt").write_text("octocat/Hello-World\n")
+    feed(monkeypatch, "jwodder/daemail\n")
+    assert (
+        main(
+            [
+                "parse",
+                "--format=csv",
+                str(tmp_path / "a.txt"),
+                "-",
+                str(tmp_path / "b.txt"),
+            ]
+        )
+        == 1
+    )
+    out, err = capsys.readouterr()
+    assert out == (
+        "owner,name\njwodder/ghrepo\n".replace("/", ",")
+        + "jwodder,daemail\n"
+        + "octocat,Hello-World\n"
+    )
+    assert err == f"ghrepo: {tmp_path / 'a.txt'}:2: Invalid repository: 'bad spec'\n"
+
+
+def test_parse_chunked_line_numbers(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(__main__, "PARSE_CHUNK_SIZE", 2)
+    feed(monkeypatch, "a/b\nc/d\n???\n\ne/f\n!!!\n")
+    assert main(["parse"]) == 1
+    out, err = capsys.readouterr()
+    assert out == "a/b\nc/d\ne/f\n"
+    assert err == (
+        "ghrepo: <stdin>:3: Invalid repository: '???'\n"
+        "ghrepo: <stdin>:6: Invalid repository: '!!!'\n"
+    )
+
+
+@pytest.mark.parametrize("opts", [[], ["-j", "1"]])
+def test_parse_missing_file(
+    opts: list[str], capsys: pytest.CaptureFixture[str], tmp_path: Path
+) -> None:
+    good = tmp_path / "good.txt"
+    good.write_text("jwodder/ghrepo\n")
+    bad = tmp_path / "nonexistent.txt"
+    assert main(["parse", *opts, str(bad), str(good)]) == 1
+    out, err = capsys.readouterr()
+    assert out == "jwodder/ghrepo\n"
+    assert err == f"ghrepo: {bad}: No such file or directory\n"
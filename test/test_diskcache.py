@@ -0,0 +1,157 @@
+from __future__ import annotations
+from pathlib import Path
+import shutil
+import subprocess
+from conftest import git, make_repo
+import pytest
+from pytest_mock import MockerFixture
+from ghrepo import GHRepo, NoSuchRemoteError, diskcache
+from ghrepo.__main__ import main
+from ghrepo.diskcache import LocalRepoCache, default_cache_dir
+from ghrepo.gitdir import Unsupported
+
+pytestmark = [
+    pytest.mark.skipif(shutil.which("git") is None, reason="Git not installed"),
+    pytest.mark.usefixtures("isolated_git_env"),
+]
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(diskcache, "RACY_WINDOW", 0)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    return make_repo(tmp_path / "repo", {"origin": "https://github.com/jwodder/ghrepo"})
+
+
+def set_url(repo: Path, url: str) -> None:
+    git("remote", "set-url", "origin", url, cwd=repo)
+
+
+def test_default_cache_dir(tmp_path: Path) -> None:
+    assert default_cache_dir() == tmp_path / "cache" / "ghrepo"
+
+
+def test_cache_hit(repo: Path, tmp_path: Path, mocker: MockerFixture) -> None:
+    cache = LocalRepoCache()
+    assert cache.directory == tmp_path / "cache" / "ghrepo"
+    assert cache.get_local_repo(repo) == GHRepo("jwodder", "ghrepo")
+    assert len(list(cache.directory.iterdir())) == 1
+    spy = mocker.spy(subprocess, "run")
+    read_config = mocker.patch("ghrepo.diskcache.read_config")
+    assert cache.get_local_repo(repo / ".git") == GHRepo("jwodder", "ghrepo")
+    spy.assert_not_called()
+    read_config.assert_not_called()
+
+
+def test_cache_invalidated_by_config(repo: Path, tmp_path: Path) -> None:
+    cache = LocalRepoCache(tmp_path / "c")
+    assert cache.get_local_repo(repo) == GHRepo("jwodder", "ghrepo")
+    set_url(repo, "https://github.com/octocat/Hello-World")
+    assert cache.get_local_repo(repo) == GHRepo("octocat", "Hello-World")
+    assert cache.get_local_repo(repo) == GHRepo("octocat", "Hello-World")
+
+
+def test_cache_invalidated_by_new_global_config(
+    repo: Path, tmp_path: Path, isolated_git_env: Path
+) -> None:
+    cache = LocalRepoCache(tmp_path / "c")
+    set_url(repo, "gh:jwodder/ghrepo")
+    with pytest.raises(ValueError):
+        cache.get_local_repo(repo)
+    (isolated_git_env / ".gitconfig").write_text(
+        '[url "https://github.com/"]\n\tinsteadOf = gh:\n'
+    )
+    assert cache.get_local_repo(repo) == GHRepo("jwodder", "ghrepo")
+    (isolated_git_env / ".gitconfig").write_text(
+        '[url "https://github.com/octocat/"]\n\tinsteadOf = gh:jwodder/\n'
+    )
+    assert cache.get_local_repo(repo) == GHRepo("octocat", "ghrepo")
+
+
+def test_cache_racy(
+    repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(diskcache, "RACY_WINDOW", 60)
+    cache = LocalRepoCache(tmp_path / "c")
+    assert cache.get_local_repo(repo) == GHRepo("jwodder", "ghrepo")
+    assert not cache.directory.exists()
+
+
+def test_cache_per_remote(repo: Path, tmp_path: Path) -> None:
+    cache = LocalRepoCache(tmp_path / "c")
+    git("remote", "add", "upstream", "git@github.com:octocat/repo.git", cwd=repo)
+    assert cache.get_local_repo(repo) == GHRepo("jwodder", "ghrepo")
+    assert cache.get_local_repo(repo, "upstream") == GHRepo("octocat", "repo")
+    assert cache.get_local_repo(repo) == GHRepo("jwodder", "ghrepo")
+    with pytest.raises(NoSuchRemoteError):
+        cache.get_local_repo(repo, "downstream")
+    assert len(list(cache.directory.iterdir())) == 2
+
+
+def test_cache_fallback(
+    repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("GIT_WORK_TREE", str(repo))
+    cache = LocalRepoCache(tmp_path / "c")
+    assert cache.get_local_repo(repo) == GHRepo("jwodder", "ghrepo")
+    assert not cache.directory.exists()
+    with pytest.raises(subprocess.CalledProcessError):
+        cache.get_local_repo(tmp_path / "home")
+
+
+def test_cache_fallback_config(repo: Path, tmp_path: Path) -> None:
+    git("config", "includeIf.hasconfig:remote.*.url:x.path", "foo", cwd=repo)
+    cache = LocalRepoCache(tmp_path / "c")
+    assert cache.get_local_repo(repo) == GHRepo("jwodder", "ghrepo")
+    assert not cache.directory.exists()
+
+
+def test_cache_fallback_system_config(
+    repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+) -> None:
+    monkeypatch.delenv("GIT_CONFIG_NOSYSTEM")
+    mocker.patch.object(diskcache, "config_paths", side_effect=Unsupported("no system"))
+    cache = LocalRepoCache(tmp_path / "c")
+    assert cache.get_local_repo(repo) == GHRepo("jwodder", "ghrepo")
+    assert not cache.directory.exists()
+
+
+def test_cache_corrupt_entry(repo: Path, tmp_path: Path) -> None:
+    cache = LocalRepoCache(tmp_path / "c")
+    cache.get_local_repo(repo)
+    (entry,) = cache.directory.iterdir()
+    entry.write_text("{not json")
+    assert cache.get_local_repo(repo) == GHRepo("jwodder", "ghrepo")
+    entry.write_text('{"version": 0}')
+    assert cache.get_local_repo(repo) == GHRepo("jwodder", "ghrepo")
+    assert '"version": 1' in entry.read_text()
+
+
+def test_cache_clear(repo: Path, tmp_path: Path) -> None:
+    cache = LocalRepoCache(tmp_path / "c")
+    cache.clear()
+    cache.get_local_repo(repo)
+    assert len(list(cache.directory.iterdir())) == 1
+    cache.clear()
+    assert list(cache.directory.iterdir()) == []
+
+
+def test_cache_unwritable(repo: Path, tmp_path: Path) -> None:
+    (tmp_path / "file").touch()
+    cache = LocalRepoCache(tmp_path / "file" / "c")
+    assert cache.get_local_repo(repo) == GHRepo("jwodder", "ghrepo")
+
+
+def test_command_cache(
+    repo: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    for _ in range(2):
+        assert main(["--cache", str(repo)]) == 0
+        out, err = capsys.readouterr()
+        assert out == "jwodder/ghrepo\n"
+        assert err == ""
+    assert len(list((tmp_path / "cache" / "ghrepo").iterdir())) == 1
@@ -0,0 +1,221 @@
+from __future__ import annotations
+from io import StringIO
+from pathlib import Path
+import random
+import sys
+import pytest
+from ghrepo import GHRepo
+from ghrepo.__main__ import main
+from ghrepo.extract import (
+    URL_IN_TEXT_CRGX,
+    RepoMatch,
+    count_repos_in_file,
+    find_repos,
+    find_repos_in_file,
+    find_repos_in_stream,
+)
+
+
+def regex_matches(text: str) -> list[RepoMatch]:
+    """Find matches the slow way, by running the regex over all of ``text``"""
+    matches = []
+    for m in URL_IN_TEXT_CRGX.finditer(text):
+        group = m.lastgroup
+        assert group is not None
+        repo = GHRepo(m["owner" + group[4:]], m[group])
+        matches.append(RepoMatch(repo, m.start(), m.end()))
+    return matches
+
+
+@pytest.mark.parametrize(
+    "text,repos",
+    [
+        ("", []),
+        ("No URLs here, just jwodder/ghrepo.", []),
+        (
+            "See https://github.com/jwodder/ghrepo.",
+            [("jwodder", "ghrepo", 4, 37)],
+        ),
+        (
+            "Clone git@github.com:jwodder/ghrepo.git, then run it",
+            [("jwodder", "ghrepo", 6, 39)],
+        ),
+        (
+            "Issue: <https://github.com/jwodder/ghrepo/issues/1>",
+            [("jwodder", "ghrepo", 8, 41)],
+        ),
+        (
+            "[link](https://api.github.com/repos/octocat/Hello-World)",
+            [("octocat", "Hello-World", 7, 55)],
+        ),
+        (
+            "pip install git+https://github.com/jwodder/ghrepo.git@v0.7.0",
+            [("jwodder", "ghrepo", 16, 53)],
+        ),
+        (
+            '{"a":"https://github.com/a/b","c":"ssh://git@github.com/c/d"}',
+            [("a", "b", 6, 28), ("c", "d", 35, 59)],
+        ),
+        (
+            "https://github.com/a/b,github.com/c/d",
+            [("a", "b", 0, 22), ("c", "d", 23, 37)],
+        ),
+        (
+            "GITHUB.COM/Foo/Bar.js and www.GitHub.com/foo/bar.",
+            [
+                ("Foo", "Bar.js", 0, 21),
+                ("foo", "bar", 26, 48),
+            ],
+        ),
+        ("https://gitlab.com/a/b notgithub.com/a/b x@github.com/a/b", []),
+        ("https://github.com/none/repo https://github.com/a/b/", [("a", "b", 29, 52)]),
+        ("github.com/a/..", []),
+        ("github.com/a/b…", [("a", "b", 0, 14)]),
+        ("github.com/a/bé", []),
+    ],
+)
+def test_find_repos(text: str, repos: list[tuple[str, str, int, int]]) -> None:
+    expected = [RepoMatch(GHRepo(o, n), s, e) for o, n, s, e in repos]
+    assert list(find_repos(text)) == expected
+    assert regex_matches(text) == expected
+    for chunk_size in [1, 2, 5, 1024]:
+        assert list(find_repos_in_stream(StringIO(text), chunk_size)) == expected
+
+
+PIECES = [
+    "https://github.com/a/b",
+    "git@github.com:c/d.git",
+    "GitHub.com/e/f.",
+    "ssh://git@github.com/g/h",
+    "api.github.com/repos/i/j/issues",
+    "https://user:pw@www.github.com/k/l.git/",
+    "git://github.com/m/n.git",
+    "github.com/none/x",
+    " ",
+    "\n",
+    "x",
+    ".",
+    "/",
+    "@",
+    "-",
+    ",",
+    "(",
+    '"',
+    "é",
+    "İ",
+]
+
+
+def test_find_repos_random() -> None:
+    rng = random.Random(0)
+    for _ in range(500):
+        text = "".join(rng.choice(PIECES) for _ in range(rng.randrange(40)))
+        expected = regex_matches(text)
+        assert list(find_repos(text)) == expected
+        for chunk_size in [1, 3, 8]:
+            assert list(find_repos_in_stream(StringIO(text), chunk_size)) == expected
+
+
+def test_find_repos_in_file_random(tmp_path: Path) -> None:
+    # On ASCII text, byte offsets equal character offsets, so the results must
+    # be the same as for `find_repos()`.
+    path = tmp_path / "log.txt"
+    ascii_pieces = [p for p in PIECES if p.isascii()]
+    rng = random.Random(0)
+    for _ in range(300):
+        text = "".join(rng.choice(ascii_pieces) for _ in range(rng.randrange(40)))
+        path.write_text(text, encoding="ascii")
+        expected = list(find_repos(text))
+        for window_size in [1, 5, 1 << 20]:
+            assert list(find_repos_in_file(path, window_size)) == expected
+
+
+def test_find_repos_in_file_non_ascii(tmp_path: Path) -> None:
+    path = tmp_path / "log.txt"
+    path.write_text(
+        "é https://github.com/a/b…\ngithub.com/c/dé https://GitHub.com/e/f\n",
+        encoding="utf-8",
+    )
+    # Offsets are in bytes, and all non-ASCII characters (including "…") are
+    # treated as letters at URL boundaries.
+    assert list(find_repos_in_file(path)) == [RepoMatch(GHRepo("e", "f"), 46, 68)]
+
+
+def test_find_repos_in_file_empty(tmp_path: Path) -> None:
+    path = tmp_path / "empty.txt"
+    path.touch()
+    assert list(find_repos_in_file(path)) == []
+
+
+def test_count_repos_in_file(tmp_path: Path) -> None:
+    path = tmp_path / "log.txt"
+    path.write_text(
+        "https://github.com/a/b\n" * 2
+        + "git@github.com:c/d.git\n" * 3
+        + "https://github.com/a/b\n",
+        encoding="utf-8",
+    )
+    counts = count_repos_in_file(path, window_size=16)
+    assert list(counts.items()) == [(GHRepo("a", "b"), 3), (GHRepo("c", "d"), 3)]
+
+
+def test_extract_command(
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "a.log").write_text(
+        "x https://github.com/c/d y\nhttps://github.com/a/b\n", encoding="utf-8"
+    )
+    (tmp_path / "b.log").write_text("github.com/a/b\n", encoding="utf-8")
+    monkeypatch.setattr(sys, "stdin", StringIO("git@github.com:e/f.git\n"))
+    args = [str(tmp_path / "a.log"), "-", str(tmp_path / "b.log")]
+    assert main(["extract", *args]) == 0
+    out, err = capsys.readouterr()
+    assert out == "c/d\na/b\ne/f\n"
+    assert err == ""
+    monkeypatch.setattr(sys, "stdin", StringIO("git@github.com:e/f.git\n"))
+    assert main(["extract", "--count", *args]) == 0
+    out, err = capsys.readouterr()
+    assert out == "2\ta/b\n1\tc/d\n1\te/f\n"
+    assert err == ""
+
+
+def test_find_repos_in_stream_offsets() -> None:
+    line = "x https://github.com/jwodder/ghrepo y\n"
+    matches = list(find_repos_in_stream(StringIO(line * 1000), chunk_size=100))
+    assert len(matches) == 1000
+    for i, m in enumerate(matches):
+        assert m == RepoMatch(
+            GHRepo("jwodder", "ghrepo"), i * len(line) + 2, i * len(line) + 35
+        )
+
+
+def test_find_repos_in_stream_long_run() -> None:
+    # A URL in a long run of URL characters that spans many chunks
+    text = "-" * 5000 + ",https://github.com/a/b," + "-" * 5000
+    assert list(find_repos_in_stream(StringIO(text), chunk_size=10)) == [
+        RepoMatch(GHRepo("a", "b"), 5001, 5023)
+    ]
+
+
+def test_find_repos_in_stream_max_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Once `MAX_RUN` is exceeded, the buffer is flushed even without a
+    # delimiter.
+    monkeypatch.setattr("ghrepo.extract.MAX_RUN", 64)
+    text = "https://github.com/a/b," * 100
+    matches = list(find_repos_in_stream(StringIO(text), chunk_size=10))
+    assert 0 < len(matches) <= 100
+    assert all(text[m.start : m.end].startswith("https://github.com/") for m in matches)
+
+
+def test_extract_command_missing_file(
+    capsys: pytest.CaptureFixture[str], tmp_path: Path
+) -> None:
+    good = tmp_path / "good.txt"
+    good.write_text("See https://github.com/jwodder/ghrepo.\n")
+    bad = tmp_path / "nonexistent.txt"
+    assert main(["extract", str(bad), str(good)]) == 1
+    out, err = capsys.readouterr()
+    assert out == "jwodder/ghrepo\n"
+    assert err == f"ghrepo: {bad}: No such file or directory\n"
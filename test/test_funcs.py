@@ -1,14 +1,19 @@
 from pathlib import Path
 import shutil
-from conftest import TmpRepo
+import subprocess
+from conftest import TmpRepo, git, make_repo
 import pytest
+from pytest_mock import MockerFixture
 from ghrepo import (
     DetachedHeadError,
+    GHRepo,
     NoSuchRemoteError,
     NoUpstreamError,
+    RepoContext,
     get_branch_upstream,
     get_current_branch,
     get_local_repo,
+    get_repo_context,
     is_git_repo,
 )
 
@@ -39,6 +44,73 @@ def test_get_current_branch_detached(tmp_repo: TmpRepo) -> None:
     assert str(excinfo.value) == "Git repository is in a detached HEAD state"
 
 
+@pytest.fixture
+def branch_repo(tmp_path: Path) -> Path:
+    return make_repo(tmp_path / "repo", branch="feature/x")
+
+
+def test_get_current_branch_no_git(branch_repo: Path, mocker: MockerFixture) -> None:
+    spy = mocker.spy(subprocess, "run")
+    assert get_current_branch(branch_repo) == "feature/x"
+    assert get_current_branch(branch_repo / ".git") == "feature/x"
+    (branch_repo / ".git" / "HEAD").write_text(
+        "0123456789abcdef0123456789abcdef01234567\n"
+    )
+    with pytest.raises(DetachedHeadError):
+        get_current_branch(branch_repo)
+    spy.assert_not_called()
+
+
+def test_get_current_branch_gitfile(tmp_path: Path, mocker: MockerFixture) -> None:
+    # Submodules use a .git file pointing to a Git directory elsewhere
+    if shutil.which("git") is None:
+        pytest.skip("Git not installed")
+    (tmp_path / "modules").mkdir()
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "init.defaultBranch=trunk",
+            "init",
+            "-q",
+            "--separate-git-dir",
+            str(tmp_path / "modules" / "sub"),
+            str(tmp_path / "sub"),
+        ],
+        check=True,
+    )
+    assert (tmp_path / "sub" / ".git").is_file()
+    spy = mocker.spy(subprocess, "run")
+    assert get_current_branch(tmp_path / "sub") == "trunk"
+    spy.assert_not_called()
+
+
+def test_get_current_branch_worktree(
+    branch_repo: Path, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    git("commit", "-q", "--allow-empty", "-m", "Initial commit", cwd=branch_repo)
+    git("worktree", "add", "-q", "-b", "other", str(tmp_path / "wt"), cwd=branch_repo)
+    git(
+        "worktree", "add", "-q", "--detach", str(tmp_path / "detached"), cwd=branch_repo
+    )
+    spy = mocker.spy(subprocess, "run")
+    assert get_current_branch(tmp_path / "wt") == "other"
+    assert get_current_branch(branch_repo) == "feature/x"
+    with pytest.raises(DetachedHeadError):
+        get_current_branch(tmp_path / "detached")
+    spy.assert_not_called()
+
+
+def test_get_current_branch_unusual_head(
+    branch_repo: Path, mocker: MockerFixture
+) -> None:
+    # HEAD pointing outside of refs/heads/ is left to Git
+    (branch_repo / ".git" / "HEAD").write_text("ref: refs/remotes/origin/main\n")
+    spy = mocker.spy(subprocess, "run")
+    assert get_current_branch(branch_repo) == "origin/main"
+    assert spy.call_count == 1
+
+
 def test_get_local_repo(monkeypatch: pytest.MonkeyPatch, tmp_repo: TmpRepo) -> None:
     assert get_local_repo(tmp_repo.path) == tmp_repo.remotes["origin"]
     assert (
@@ -69,3 +141,79 @@ def test_get_branch_upstream_no_remote(tmp_repo: TmpRepo) -> None:
         get_branch_upstream("main", tmp_repo.path)
     assert excinfo.value.branch == "main"
     assert str(excinfo.value) == "No upstream remote configured for Git branch: 'main'"
+
+
+@pytest.fixture
+def ctx_repo(tmp_path: Path) -> Path:
+    make_repo(
+        tmp_path,
+        {
+            "origin": "git@github.com:octocat/repository.git",
+            "upstream": "https://github.com/foobar/repo.git",
+            "gitlab": "https://gitlab.com/foobar/repo.git",
+        },
+    )
+    git("config", "branch.main.remote", "upstream", cwd=tmp_path)
+    return tmp_path
+
+
+def test_get_repo_context(ctx_repo: Path, mocker: MockerFixture) -> None:
+    spy = mocker.spy(subprocess, "run")
+    ctx = get_repo_context(ctx_repo)
+    assert spy.call_count == 1
+    assert ctx == RepoContext(
+        branch="main",
+        upstream_remote="upstream",
+        remote_urls={
+            "origin": "git@github.com:octocat/repository.git",
+            "upstream": "https://github.com/foobar/repo.git",
+            "gitlab": "https://gitlab.com/foobar/repo.git",
+        },
+        remote_repos={
+            "origin": GHRepo("octocat", "repository"),
+            "upstream": GHRepo("foobar", "repo"),
+        },
+    )
+    assert ctx.upstream == GHRepo("foobar", "repo")
+    assert ctx.upstream == get_branch_upstream("main", ctx_repo)
+    assert ctx.branch == get_current_branch(ctx_repo)
+
+
+def test_get_repo_context_detached(
+    ctx_repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (ctx_repo / ".git" / "HEAD").write_text(
+        "0123456789abcdef0123456789abcdef01234567\n"
+    )
+    monkeypatch.chdir(ctx_repo)
+    ctx = get_repo_context()
+    assert ctx.branch is None
+    assert ctx.upstream_remote is None
+    assert ctx.upstream is None
+    assert ctx.remote_repos["origin"] == GHRepo("octocat", "repository")
+
+
+def test_get_repo_context_fallback(
+    ctx_repo: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+) -> None:
+    # GIT_WORK_TREE isn't supported by ghrepo.gitdir, forcing a `git
+    # symbolic-ref` call:
+    monkeypatch.setenv("GIT_WORK_TREE", str(ctx_repo))
+    spy = mocker.spy(subprocess, "run")
+    ctx = get_repo_context(ctx_repo)
+    assert spy.call_count == 2
+    assert ctx.branch == "main"
+    assert ctx.upstream_remote == "upstream"
+
+
+def test_get_repo_context_no_remotes(tmp_path: Path) -> None:
+    make_repo(tmp_path)
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/foo\n")
+    assert get_repo_context(tmp_path) == RepoContext("foo", None, {}, {})
+
+
+def test_get_repo_context_not_repo(tmp_path: Path) -> None:
+    if shutil.which("git") is None:
+        pytest.skip("Git not installed")
+    with pytest.raises(subprocess.CalledProcessError):
+        get_repo_context(tmp_path)
@@ -0,0 +1,314 @@
+from __future__ import annotations
+from pathlib import Path
+import shutil
+import subprocess
+from conftest import git, make_repo
+import pytest
+from pytest_mock import MockerFixture
+from ghrepo import GHRepo, NoSuchRemoteError
+from ghrepo.gitdir import (
+    SOURCE_CONFIG,
+    SOURCE_GIT,
+    GitDir,
+    ResolvedURL,
+    Unsupported,
+    config_paths,
+    find_git_dir,
+    get_local_repo,
+    get_remote_url,
+    parse_config,
+    read_config,
+    system_config_path,
+    wildmatch_regex,
+)
+
+pytestmark = [
+    pytest.mark.skipif(shutil.which("git") is None, reason="Git not installed"),
+    pytest.mark.usefixtures("isolated_git_env"),
+]
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    return make_repo(
+        tmp_path / "repo", {"origin": "git@github.com:octocat/repository.git"}
+    )
+
+
+CONFIG_TEXT = (
+    "; A comment\n"
+    "[core]\n"
+    "\tbare = false  # trailing comment\n"
+    "\tflag\n"
+    '[Remote "Up.Stream"]\n'
+    '\tURL = "  quoted  value ; not a comment"\n'
+    '\tpushurl = a\\tb\\\\c\\"d\n'
+    "\tfetch = +refs/heads/*:refs/remotes/upstream/* \\\n"
+    "continued\n"
+    "[section.SubSection] key = inline\n"
+    "[empty]\n"
+    "\tvalue =\n"
+    "\tspaced = internal   spaces   here   ;comment\n"
+)
+
+
+def test_parse_config_matches_git(tmp_path: Path) -> None:
+    cfgfile = tmp_path / "config"
+    cfgfile.write_text(CONFIG_TEXT)
+    listing = git("config", "--file", str(cfgfile), "--list", cwd=tmp_path)
+    expected: list[tuple[str, str | None]] = []
+    for line in listing.splitlines():
+        key, eq, value = line.partition("=")
+        expected.append((key, value if eq else None))
+    assert parse_config(CONFIG_TEXT) == expected
+    assert ("remote.Up.Stream.pushurl", 'a\tb\\c"d') in expected
+
+
+@pytest.mark.parametrize(
+    "pattern,path,icase,matches",
+    [
+        ("**/work/**", "/home/user/work/proj/.git", False, True),
+        ("**/work/**", "/home/user/Work/proj/.git", False, False),
+        ("**/work/**", "/home/user/Work/proj/.git", True, True),
+        ("/home/*/proj/.git", "/home/user/proj/.git", False, True),
+        ("/home/*/proj/.git", "/home/a/b/proj/.git", False, False),
+        ("/home/user/pro?/.git", "/home/user/proj/.git", False, True),
+        ("/home/user/[a-p]roj/.git", "/home/user/proj/.git", False, True),
+        ("/home/user/[!a-p]roj/.git", "/home/user/proj/.git", False, False),
+    ],
+)
+def test_wildmatch_regex(pattern: str, path: str, icase: bool, matches: bool) -> None:
+    assert bool(wildmatch_regex(pattern, icase).fullmatch(path)) is matches
+
+
+def test_find_git_dir(repo: Path) -> None:
+    sub = repo / "sub" / "dir"
+    sub.mkdir(parents=True)
+    assert find_git_dir(sub) == GitDir(repo / ".git", repo / ".git")
+    assert find_git_dir(repo) == GitDir(repo / ".git", repo / ".git")
+
+
+def test_find_git_dir_none(tmp_path: Path) -> None:
+    assert find_git_dir(tmp_path / "nonexistent") is None
+
+
+def test_find_git_dir_env(
+    repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("GIT_DIR", str(repo / ".git"))
+    assert find_git_dir(tmp_path) == GitDir(repo / ".git", repo / ".git")
+    monkeypatch.setenv("GIT_DIR", str(tmp_path))
+    assert find_git_dir(tmp_path) is None
+
+
+def test_get_remote_url_no_git(repo: Path, mocker: MockerFixture) -> None:
+    spy = mocker.spy(subprocess, "run")
+    assert get_remote_url(repo) == ResolvedURL(
+        "git@github.com:octocat/repository.git", SOURCE_CONFIG
+    )
+    assert get_local_repo(repo / ".git") == GHRepo("octocat", "repository")
+    with pytest.raises(NoSuchRemoteError) as excinfo:
+        get_remote_url(repo, "upstream")
+    assert excinfo.value.remote == "upstream"
+    spy.assert_not_called()
+
+
+def test_get_remote_url_insteadof(repo: Path, isolated_git_env: Path) -> None:
+    git("remote", "add", "upstream", "gh:jwodder/ghrepo", cwd=repo)
+    (isolated_git_env / ".gitconfig").write_text(
+        '[url "https://github.com/"]\n\tinsteadOf = gh:\n'
+        '[url "https://gitlab.com/"]\n\tinsteadOf = g\n'
+    )
+    r = get_remote_url(repo, "upstream")
+    assert r == ResolvedURL("https://github.com/jwodder/ghrepo", SOURCE_CONFIG)
+    assert r.url == git("remote", "get-url", "upstream", cwd=repo)
+
+
+def test_get_remote_url_includes(repo: Path, isolated_git_env: Path) -> None:
+    (isolated_git_env / "a.inc").write_text(
+        '[remote "a"]\n\turl = https://github.com/jwodder/a\n'
+    )
+    (isolated_git_env / "b.inc").write_text(
+        '[remote "b"]\n\turl = https://github.com/jwodder/b\n'
+    )
+    (isolated_git_env / "c.inc").write_text(
+        '[remote "c"]\n\turl = https://github.com/jwodder/c\n'
+    )
+    (isolated_git_env / ".gitconfig").write_text(
+        "[include]\n\tpath = a.inc\n"
+        f'[includeIf "gitdir:{repo}/"]\n\tpath = ~/b.inc\n'
+        '[includeIf "gitdir:/nowhere/"]\n\tpath = ~/c.inc\n'
+    )
+    for remote in ["a", "b", "c"]:
+        git(
+            "config",
+            f"remote.{remote}.fetch",
+            f"+refs/heads/*:refs/{remote}/*",
+            cwd=repo,
+        )
+    for remote in ["a", "b"]:
+        r = get_remote_url(repo, remote)
+        assert r == ResolvedURL(f"https://github.com/jwodder/{remote}", SOURCE_CONFIG)
+        assert r.url == git("remote", "get-url", remote, cwd=repo)
+    # Remote "c" is configured without a URL, so it falls back to Git:
+    assert get_remote_url(repo, "c") == ResolvedURL("c", SOURCE_GIT)
+    cfg = read_config(GitDir(repo / ".git", repo / ".git"))
+    assert cfg.files == [
+        isolated_git_env / ".gitconfig",
+        isolated_git_env / "a.inc",
+        isolated_git_env / "b.inc",
+        repo / ".git" / "config",
+    ]
+    assert cfg.missing_files == [isolated_git_env / ".config" / "git" / "config"]
+
+
+def test_get_remote_url_onbranch(repo: Path) -> None:
+    (repo / ".git" / "extra").write_text(
+        '[remote "extra"]\n\turl = https://github.com/jwodder/extra\n'
+    )
+    git("config", "includeIf.onbranch:ma*.path", "extra", cwd=repo)
+    assert get_remote_url(repo, "extra") == ResolvedURL(
+        "https://github.com/jwodder/extra", SOURCE_CONFIG
+    )
+
+
+def test_get_remote_url_worktree(repo: Path, tmp_path: Path) -> None:
+    git("commit", "-q", "--allow-empty", "-m", "Initial commit", cwd=repo)
+    wt = tmp_path / "wt"
+    git("worktree", "add", "-q", str(wt), cwd=repo)
+    gitdir = find_git_dir(wt)
+    assert gitdir is not None
+    assert gitdir.common_dir == repo / ".git"
+    assert gitdir.path.parent == repo / ".git" / "worktrees"
+    assert get_remote_url(wt) == ResolvedURL(
+        "git@github.com:octocat/repository.git", SOURCE_CONFIG
+    )
+
+
+def test_get_remote_url_global_only(repo: Path, isolated_git_env: Path) -> None:
+    (isolated_git_env / ".gitconfig").write_text(
+        '[remote "global"]\n\turl = https://github.com/jwodder/global\n'
+    )
+    with pytest.raises(NoSuchRemoteError):
+        get_remote_url(repo, "global")
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        git("remote", "get-url", "global", cwd=repo)
+    assert excinfo.value.returncode == 2
+
+
+@pytest.mark.parametrize(
+    "setup,remote",
+    [
+        (["config", "remote.nourl.prune", "true"], "nourl"),
+        (["config", "includeIf.hasconfig:remote.*.url:x.path", "foo"], "origin"),
+    ],
+)
+def test_get_remote_url_fallback(repo: Path, setup: list[str], remote: str) -> None:
+    git(*setup, cwd=repo)
+    r = get_remote_url(repo, remote)
+    assert r.source == SOURCE_GIT
+    assert r.url == git("remote", "get-url", remote, cwd=repo)
+
+
+def test_get_remote_url_fallback_env(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(
+        "GIT_CONFIG_PARAMETERS", "'url.https://github.com/.insteadof'='git@github.com:'"
+    )
+    assert get_remote_url(repo) == ResolvedURL(
+        "https://github.com/octocat/repository.git", SOURCE_GIT
+    )
+    with pytest.raises(NoSuchRemoteError):
+        get_local_repo(repo, "upstream")
+
+
+def test_get_remote_url_not_repo(tmp_path: Path) -> None:
+    with pytest.raises(subprocess.CalledProcessError):
+        get_remote_url(tmp_path)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "key = value\n",
+        "[]\n",
+        "[section\n",
+        '[section "sub\n',
+        '[section "sub" ]\n',
+        "[section sub]\n",
+        '[a.b "sub"]\n',
+        '[section]\nkey = "unterminated\n',
+        "[section]\nkey = bad\\escape\n",
+        "[section]\nkey = trailing\\",
+        "[section]\nkey value\n",
+        "[section]\n!key = value\n",
+    ],
+)
+def test_parse_config_invalid(text: str) -> None:
+    with pytest.raises(Unsupported):
+        parse_config(text)
+
+
+def test_parse_config_crlf_bom() -> None:
+    assert parse_config('\ufeff[Core]\r\n\tKey = "a b" c \\\r\nd\r\n\tflag\r\n') == [
+        ("core.key", "a b c d"),
+        ("core.flag", None),
+    ]
+
+
+def test_config_paths(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("HOME", "/home/user")
+    monkeypatch.delenv("GIT_CONFIG_NOSYSTEM")
+    monkeypatch.setenv("GIT_CONFIG_SYSTEM", "/opt/gitconfig")
+    monkeypatch.setenv("XDG_CONFIG_HOME", "/xdg")
+    gitdir = GitDir(tmp_path / "wt", tmp_path / ".git")
+    assert config_paths(gitdir) == [
+        (Path("/opt/gitconfig"), "system"),
+        (Path("/xdg/git/config"), "global"),
+        (Path("/home/user/.gitconfig"), "global"),
+        (tmp_path / ".git" / "config", "local"),
+    ]
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", "/etc/myconfig")
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "true")
+    assert config_paths(None) == [(Path("/etc/myconfig"), "global")]
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", "")
+    assert config_paths(None) == []
+
+
+def test_system_config_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GIT_CONFIG_NOSYSTEM")
+    monkeypatch.setenv("GIT_CONFIG_SYSTEM", "/opt/gitconfig")
+    system_config_path.cache_clear()
+    path = system_config_path()
+    assert path.is_absolute()
+    assert path != Path("/opt/gitconfig")
+    monkeypatch.delenv("GIT_CONFIG_SYSTEM")
+    assert config_paths(None)[0] == (path, "system")
+    assert system_config_path.cache_info().misses == 1
+    system_config_path.cache_clear()
+
+
+def test_system_config_path_unsupported(
+    monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+) -> None:
+    monkeypatch.delenv("GIT_CONFIG_NOSYSTEM")
+    system_config_path.cache_clear()
+    mocker.patch(
+        "subprocess.run",
+        side_effect=subprocess.CalledProcessError(128, ["git"]),
+    )
+    with pytest.raises(Unsupported):
+        config_paths(None)
+    system_config_path.cache_clear()
+
+
+def test_worktree_config(repo: Path) -> None:
+    git("config", "extensions.worktreeConfig", "true", cwd=repo)
+    git("config", "--worktree", "remote.wt.url", "https://github.com/a/wt", cwd=repo)
+    cfg = read_config(GitDir(repo / ".git", repo / ".git"))
+    assert cfg.get("remote.wt.url") == "https://github.com/a/wt"
+    assert cfg.entries[-1].scope == "worktree"
+    assert get_remote_url(repo, "wt") == ResolvedURL(
+        "https://github.com/a/wt", SOURCE_CONFIG
+    )
@@ -0,0 +1,85 @@
+from __future__ import annotations
+import subprocess
+from conftest import TmpRepo
+import pytest
+import ghrepo
+from ghrepo import GHRepo, NoSuchRemoteError
+from ghrepo.instrument import CallStats, Instrumentation
+
+
+def test_parse_stats() -> None:
+    with Instrumentation() as ins:
+        assert GHRepo.parse("jwodder/ghrepo") == GHRepo("jwodder", "ghrepo")
+        assert GHRepo.parse_url("git@github.com:jwodder/ghrepo.git") == GHRepo(
+            "jwodder", "ghrepo"
+        )
+        with pytest.raises(ValueError):
+            GHRepo.parse_url("https://gitlab.com/jwodder/ghrepo")
+        GHRepo.parse_many(["jwodder/ghrepo", "ghrepo"])
+        assert ghrepo.is_github_url("https://api.github.com/repos/jwodder/ghrepo")
+    assert not ins.installed
+    stats = ins.snapshot()
+    assert {name: (s.calls, s.failures) for name, s in stats.items()} == {
+        "GHRepo.parse": (1, 0),
+        "GHRepo.parse_url": (2, 1),
+        "GHRepo.parse_many": (1, 0),
+        "url_form/scp": (1, 0),
+        "url_form/none": (1, 1),
+        "url_form/api": (1, 0),
+    }
+    assert all(s.total_time > 0 for s in stats.values())
+    ins.reset()
+    assert ins.snapshot() == {}
+
+
+def test_uninstall_restores() -> None:
+    saved = (
+        dict(GHRepo.__dict__),
+        ghrepo._match_url,
+        ghrepo._readgit_hook,
+        ghrepo.is_git_repo,
+        ghrepo.get_repo_context,
+    )
+    ins = Instrumentation()
+    ins.install()
+    assert ins.installed
+    assert GHRepo.__dict__["parse"] is not saved[0]["parse"]
+    with pytest.raises(RuntimeError):
+        Instrumentation().install()
+    ins.uninstall()
+    ins.uninstall()
+    assert (
+        dict(GHRepo.__dict__),
+        ghrepo._match_url,
+        ghrepo._readgit_hook,
+        ghrepo.is_git_repo,
+        ghrepo.get_repo_context,
+    ) == saved
+    GHRepo.parse("jwodder/ghrepo")
+    assert ins.snapshot() == {}
+
+
+def test_callback() -> None:
+    events: list[tuple[str, float, bool]] = []
+    with Instrumentation(lambda *args: events.append(args)):
+        GHRepo.parse_url("ssh://git@github.com/jwodder/ghrepo")
+    assert [(name, ok) for name, _, ok in events] == [
+        ("url_form/ssh", True),
+        ("GHRepo.parse_url", True),
+    ]
+
+
+def test_git_stats(tmp_repo: TmpRepo) -> None:
+    with Instrumentation() as ins:
+        assert ghrepo.get_local_repo(tmp_repo.path) == tmp_repo.remotes["origin"]
+        with pytest.raises(NoSuchRemoteError):
+            ghrepo.get_local_repo(tmp_repo.path, remote="nonexistent")
+        with pytest.raises(subprocess.CalledProcessError):
+            ghrepo.readgit("nonexistent-subcommand", dirpath=tmp_repo.path)
+        assert ghrepo.is_git_repo(tmp_repo.path)
+    stats = ins.snapshot()
+    assert stats["git/remote"][:2] == (2, 1)
+    assert stats["git/nonexistent-subcommand"][:2] == (1, 1)
+    assert stats["is_git_repo"][:2] == (1, 0)
+    assert isinstance(stats["is_git_repo"], CallStats)
+    assert ghrepo._readgit_hook is None
@@ -0,0 +1,151 @@
+from __future__ import annotations
+import io
+from pathlib import Path
+import sys
+import pytest
+from ghrepo import GHRepo
+from ghrepo.__main__ import main
+from ghrepo.parallel import (
+    ParsedChunk,
+    parse_file_parallel,
+    parse_parallel,
+    shard_file,
+)
+
+SPECS = [
+    "jwodder/ghrepo",
+    "https://github.com/octocat/Hello-World.git",
+    "https://gitlab.com/jwodder/ghrepo",
+    "ghrepo",
+    "git@github.com:jwodder/daemail.git",
+    "",
+]
+
+
+def flatten(chunks: list[ParsedChunk]) -> tuple[list[GHRepo], list[tuple[int, str]]]:
+    repos: list[GHRepo] = []
+    failures: list[tuple[int, str]] = []
+    start = 0
+    for chunk in chunks:
+        repos.extend(chunk.repos())
+        failures.extend((start + i, spec) for i, spec in chunk.failures)
+        start += chunk.size
+    return repos, failures
+
+
+def test_parse_parallel() -> None:
+    specs = SPECS * 50
+    expected = GHRepo.parse_many(specs, default_owner="octocat")
+    chunks = list(
+        parse_parallel(specs, default_owner="octocat", max_workers=2, chunk_size=7)
+    )
+    assert [c.seq for c in chunks] == list(range(len(chunks)))
+    assert all(type(r) is GHRepo for c in chunks for r in c.repos())
+    assert flatten(chunks) == (expected.repos, expected.failures)
+
+
+def test_parse_parallel_unordered() -> None:
+    specs = SPECS * 50
+    expected = GHRepo.parse_url_many(specs)
+    chunks = list(
+        parse_parallel(specs, url_only=True, max_workers=2, ordered=False, chunk_size=7)
+    )
+    assert sorted(c.seq for c in chunks) == list(range(len(chunks)))
+    chunks.sort(key=lambda c: c.seq)
+    assert flatten(chunks) == (expected.repos, expected.failures)
+
+
+def test_parse_parallel_empty() -> None:
+    assert list(parse_parallel([], max_workers=1)) == []
+
+
+@pytest.mark.parametrize(
+    "kwargs,msg",
+    [
+        ({"default_owner": "a/b"}, "Invalid default owner: 'a/b'"),
+        ({"default_owner": ""}, "Invalid default owner: ''"),
+        ({"max_workers": 0}, "max_workers must be at least 1, not 0"),
+    ],
+)
+def test_parse_parallel_bad_args(kwargs: dict, msg: str, tmp_path: Path) -> None:
+    # The arguments are checked when the functions are called, not when
+    # iteration starts
+    with pytest.raises(ValueError) as excinfo:
+        parse_parallel(["foo"], **kwargs)
+    assert str(excinfo.value) == msg
+    with pytest.raises(ValueError) as excinfo:
+        parse_file_parallel(tmp_path / "nonexistent.txt", **kwargs)
+    assert str(excinfo.value) == msg
+
+
+def test_parse_file_parallel(tmp_path: Path) -> None:
+    path = tmp_path / "repos.txt"
+    lines = [f"  owner{i}/repo{i}\t" if i % 3 else f"bad/repo/{i}" for i in range(500)]
+    path.write_bytes(("\r\n".join(lines) + "\n\nlast/one").encode("utf-8"))
+    chunks = list(parse_file_parallel(path, max_workers=2, shard_size=100))
+    assert len(chunks) > 1
+    expected = GHRepo.parse_many([ln.strip() for ln in lines] + ["", "last/one"])
+    assert flatten(chunks) == (expected.repos, expected.failures)
+
+
+@pytest.mark.parametrize("size", [0, 1, 99, 100, 101, 1000])
+def test_shard_file(tmp_path: Path, size: int) -> None:
+    path = tmp_path / "data.txt"
+    data = b"".join(b"x" * (i % 13) + b"\n" for i in range(size))
+    path.write_bytes(data)
+    shards = list(shard_file(path, 64))
+    assert b"".join(data[start:end] for start, end in shards) == data
+    assert all(data[start:end].endswith(b"\n") for start, end in shards)
+    assert all(end - start >= 64 for start, end in shards[:-1])
+
+
+@pytest.mark.parametrize(
+    "fmt,output",
+    [
+        ("text", "jwodder/ghrepo\noctocat/Hello-World\njwodder/daemail\n"),
+        (
+            "jsonl",
+            '{"owner": "jwodder", "name": "ghrepo"}\n'
+            '{"owner": "octocat", "name": "Hello-World"}\n'
+            '{"owner": "jwodder", "name": "daemail"}\n',
+        ),
+        (
+            "csv",
+            "owner,name\njwodder,ghrepo\noctocat,Hello-World\njwodder,daemail\n",
+        ),
+    ],
+)
+@pytest.mark.parametrize("use_file", [False, True])
+def test_parse_command_jobs(
+    fmt: str,
+    output: str,
+    use_file: bool,
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    text = "\n".join(SPECS) + "\n"
+    if use_file:
+        path = tmp_path / "input.txt"
+        path.write_text(text, encoding="utf-8")
+        infile = str(path)
+    else:
+        monkeypatch.setattr(sys, "stdin", io.StringIO(text))
+        infile = "-"
+        path = Path("<stdin>")
+    assert main(["parse", "--jobs", "2", "-F", fmt, infile]) == 1
+    out, err = capsys.readouterr()
+    assert out == output
+    assert err == (
+        f"ghrepo: {path}:3: Invalid repository:"
+        " 'https://gitlab.com/jwodder/ghrepo'\n"
+        f"ghrepo: {path}:4: Invalid repository: 'ghrepo'\n"
+    )
+
+
+@pytest.mark.parametrize("jobs", ["0", "-1", "two"])
+def test_parse_command_bad_jobs(jobs: str, capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        main(["parse", "-j", jobs])
+    assert excinfo.value.code == 2
+    assert "argument -j/--jobs: invalid positive_int value" in capsys.readouterr().err
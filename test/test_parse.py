@@ -1,6 +1,14 @@
 from __future__ import annotations
+from collections.abc import Callable
+import time
 import pytest
-from ghrepo import GHRepo
+from ghrepo import (
+    GITHUB_URL_CREGEXEN,
+    BytesLike,
+    GHRepo,
+    ParseResults,
+    is_github_url,
+)
 
 REPO_URLS = [
     (
@@ -198,12 +206,89 @@ def test_parse_bad_spec(spec: str) -> None:
 @pytest.mark.parametrize("url,repo", REPO_URLS)
 def test_parse_url(url: str, repo: GHRepo) -> None:
     assert GHRepo.parse_url(url) == repo
+    assert is_github_url(url)
 
 
 @pytest.mark.parametrize("url", BAD_REPOS)
 def test_parse_bad_url(url: str) -> None:
     with pytest.raises(ValueError):
         GHRepo.parse_url(url)
+    assert not is_github_url(url)
+
+
+BYTES_TYPES: list[Callable[[bytes], BytesLike]] = [bytes, bytearray, memoryview]
+
+
+@pytest.mark.parametrize("convert", BYTES_TYPES)
+@pytest.mark.parametrize(
+    "spec,repo",
+    REPO_URLS
+    + [
+        ("jwodder/headerparser", GHRepo("jwodder", "headerparser")),
+        ("headerparser", GHRepo("jwodder", "headerparser")),
+        ("none", GHRepo("jwodder", "none")),
+    ],
+)
+def test_parse_bytes(
+    spec: str, repo: GHRepo, convert: Callable[[bytes], BytesLike]
+) -> None:
+    r = GHRepo.parse_bytes(convert(spec.encode("utf-8")), default_owner="jwodder")
+    assert r == repo
+    assert type(r.owner) is str
+    assert type(r.name) is str
+
+
+@pytest.mark.parametrize("convert", BYTES_TYPES)
+@pytest.mark.parametrize("spec", BAD_REPOS)
+def test_parse_bytes_bad_spec(spec: str, convert: Callable[[bytes], BytesLike]) -> None:
+    with pytest.raises(ValueError):
+        GHRepo.parse_bytes(convert(spec.encode("utf-8")))
+
+
+@pytest.mark.parametrize("convert", BYTES_TYPES)
+@pytest.mark.parametrize("url,repo", REPO_URLS)
+def test_parse_url_bytes(
+    url: str, repo: GHRepo, convert: Callable[[bytes], BytesLike]
+) -> None:
+    assert GHRepo.parse_url_bytes(convert(url.encode("utf-8"))) == repo
+
+
+@pytest.mark.parametrize("convert", BYTES_TYPES)
+@pytest.mark.parametrize("url", BAD_REPOS + ["jwodder/headerparser"])
+def test_parse_url_bytes_bad_url(
+    url: str, convert: Callable[[bytes], BytesLike]
+) -> None:
+    data = url.encode("utf-8")
+    with pytest.raises(ValueError) as excinfo:
+        GHRepo.parse_url_bytes(convert(data))
+    assert str(excinfo.value) == f"Invalid GitHub URL: {data!r}"
+
+
+def test_parse_bytes_memoryview_slice() -> None:
+    buf = memoryview(b"url=https://github.com/jwodder/ghrepo.git;")
+    assert GHRepo.parse_bytes(buf[4:-1]) == GHRepo("jwodder", "ghrepo")
+
+
+def test_parse_bytes_name_only_no_owner() -> None:
+    with pytest.raises(ValueError) as excinfo:
+        GHRepo.parse_bytes(b"headerparser")
+    assert str(excinfo.value) == "No owner given in b'headerparser'"
+
+
+def test_parse_bytes_non_ascii() -> None:
+    with pytest.raises(ValueError):
+        GHRepo.parse_bytes("jwodder/h\u00e9aderparser".encode("utf-8"))
+    with pytest.raises(ValueError):
+        GHRepo.parse_bytes("jwodder/h\u00e9aderparser".encode("latin-1"))
+
+
+def test_parse_url_bytes_too_long() -> None:
+    url = memoryview(b"https://github.com/jwodder/ghrepo" + b"/" * 2000)
+    with pytest.raises(ValueError) as excinfo:
+        GHRepo.parse_url_bytes(url)
+    assert str(excinfo.value) == (
+        f"Invalid GitHub URL: {bytes(url[:100])!r}... (2033 bytes)"
+    )
 
 
 def test_parse_name_only_no_owner() -> None:
@@ -230,3 +315,146 @@ def test_parse_owner_name_callable_default_owner() -> None:
 
     assert GHRepo.parse("octocat/Hello-World") == GHRepo("octocat", "Hello-World")
     assert calls == []
+
+
+@pytest.mark.parametrize(
+    "url",
+    [url for url, _ in REPO_URLS]
+    + BAD_REPOS
+    + ["", "h", "G", "git@", "www.", "ssh://", "xyzzy", "égithub.com/a/b"],
+)
+def test_url_dispatch_matches_linear_scan(url: str) -> None:
+    expected: GHRepo | None = None
+    for crgx in GITHUB_URL_CREGEXEN:
+        m = crgx.fullmatch(url)
+        if m:
+            expected = GHRepo(m["owner"], m["name"])
+            break
+    if expected is None:
+        with pytest.raises(ValueError) as excinfo:
+            GHRepo.parse_url(url)
+        assert str(excinfo.value) == f"Invalid GitHub URL: {url!r}"
+    else:
+        assert GHRepo.parse_url(url) == expected
+
+
+def test_parse_url_userinfo_limit() -> None:
+    url = "https://" + "%41" * 256 + "@github.com/jwodder/ghrepo"
+    assert GHRepo.parse_url(url) == GHRepo("jwodder", "ghrepo")
+    with pytest.raises(ValueError):
+        GHRepo.parse_url(url.replace("@", "x@"))
+
+
+def test_parse_url_too_long() -> None:
+    url = "https://github.com/jwodder/ghrepo" + "/" * 2000
+    with pytest.raises(ValueError) as excinfo:
+        GHRepo.parse_url(url)
+    assert str(excinfo.value) == (
+        f"Invalid GitHub URL: {url[:100]!r}... (2033 characters)"
+    )
+
+
+def test_parse_many_too_long() -> None:
+    long_name = "a" * 141
+    long_url = "https://github.com/jwodder/" + "a" * 1000
+    specs = ["jwodder/ghrepo", long_name, long_url]
+    assert GHRepo.parse_many(specs, default_owner="jwodder") == ParseResults(
+        [GHRepo("jwodder", "ghrepo")], [(1, long_name), (2, long_url)]
+    )
+    assert GHRepo.parse_url_many(specs) == ParseResults(
+        [], [(0, "jwodder/ghrepo"), (1, long_name), (2, long_url)]
+    )
+
+
+# Near-miss inputs of a given length that would make a regex engine backtrack
+# over the whole input if the patterns were unbounded
+PATHOLOGICAL: list[Callable[[int], str]] = [
+    lambda n: "a" * n + "!",
+    lambda n: "a-" * (n // 2) + "/repo",
+    lambda n: "owner/" + "a" * n + "!",
+    lambda n: "owner/" + ".git" * (n // 4),
+    lambda n: "owner/" + "." * n,
+    lambda n: "https://" + "%41" * (n // 3) + "@github.com/o/r!",
+    lambda n: "github.com/" + "a" * n + "/r",
+    lambda n: "git@github.com:o/" + "a" * n + ".git",
+]
+
+
+@pytest.mark.parametrize("make", PATHOLOGICAL)
+def test_parse_time_independent_of_length(make: Callable[[int], str]) -> None:
+    def worst_time(spec: str) -> float:
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(20):
+                with pytest.raises(ValueError):
+                    GHRepo.parse(spec)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    short = worst_time(make(1000))
+    long = worst_time(make(1_000_000))
+    # If matching were linear in the length of the input, the long input would
+    # take about 1000 times as long.
+    assert long < 10 * short
+
+
+def test_lazy_regexes() -> None:
+    import ghrepo
+
+    assert [crgx.pattern for crgx in ghrepo.GITHUB_URL_CREGEXEN] == (
+        ghrepo.GITHUB_URL_RGXEN
+    )
+    assert ghrepo.OWNER_REPO_CRGX.pattern == ghrepo.OWNER_REPO_RGX
+    assert ghrepo.OWNER_REPO_CRGX is ghrepo.OWNER_REPO_CRGX
+    with pytest.raises(AttributeError):
+        ghrepo.NONEXISTENT  # noqa: B018
+
+
+def test_parse_many() -> None:
+    specs = [spec for spec, _ in REPO_URLS] + BAD_REPOS + ["headerparser"]
+    results = GHRepo.parse_many(specs, default_owner="jwodder")
+    assert results == ParseResults(
+        repos=[repo for _, repo in REPO_URLS] + [GHRepo("jwodder", "headerparser")],
+        failures=[(len(REPO_URLS) + i, spec) for i, spec in enumerate(BAD_REPOS)],
+    )
+
+
+def test_parse_many_no_default_owner() -> None:
+    assert GHRepo.parse_many(
+        ["jwodder/headerparser", "headerparser", "octocat/Hello-World"]
+    ) == ParseResults(
+        repos=[GHRepo("jwodder", "headerparser"), GHRepo("octocat", "Hello-World")],
+        failures=[(1, "headerparser")],
+    )
+
+
+def test_parse_many_callable_default_owner() -> None:
+    calls: list[int] = []
+
+    def defowner() -> str:
+        calls.append(1)
+        return "jwodder"
+
+    results = GHRepo.parse_many(iter(["foo", "octocat/bar", "baz"]), defowner)
+    assert results.repos == [
+        GHRepo("jwodder", "foo"),
+        GHRepo("octocat", "bar"),
+        GHRepo("jwodder", "baz"),
+    ]
+    assert results.failures == []
+    assert calls == [1]
+
+
+def test_parse_many_empty() -> None:
+    assert GHRepo.parse_many([]) == ParseResults([], [])
+
+
+def test_parse_url_many() -> None:
+    urls = BAD_REPOS + [url for url, _ in REPO_URLS] + ["jwodder/headerparser"]
+    results = GHRepo.parse_url_many(urls)
+    assert results.repos == [repo for _, repo in REPO_URLS]
+    assert all(type(r) is GHRepo for r in results.repos)
+    assert results.failures == list(enumerate(BAD_REPOS)) + [
+        (len(urls) - 1, "jwodder/headerparser")
+    ]
@@ -1,6 +1,6 @@
 import re
 import pytest
-from ghrepo import GH_REPO_RGX, GH_USER_RGX
+from ghrepo import GH_REPO_RGX, GH_USER_RGX, is_valid_owner, is_valid_repo_name
 
 
 @pytest.mark.parametrize(
@@ -32,10 +32,12 @@ from ghrepo import GH_REPO_RGX, GH_USER_RGX
         "johan--",
         "pj_nitin",
         "up_the_irons",
+        "a" * 39,
     ],
 )
 def test_good_users(name: str) -> None:
     assert bool(re.fullmatch(GH_USER_RGX, name))
+    assert is_valid_owner(name)
 
 
 @pytest.mark.parametrize(
@@ -47,10 +49,12 @@ def test_good_users(name: str) -> None:
         "",
         "none",
         "NONE",
+        "a" * 40,
     ],
 )
 def test_bad_users(name: str) -> None:
     assert re.fullmatch(GH_USER_RGX, name) is None
+    assert not is_valid_owner(name)
 
 
 @pytest.mark.parametrize(
@@ -86,10 +90,15 @@ def test_bad_users(name: str) -> None:
         ".steven",
         "..steven",
         "...steven",
+        "a" * 100,
+        "." + "a" * 99,
+        ".." + "a" * 98,
+        "a" * 95 + ".gitt",
     ],
 )
 def test_good_repos(repo: str) -> None:
     assert bool(re.fullmatch(GH_REPO_RGX, repo))
+    assert is_valid_repo_name(repo)
 
 
 @pytest.mark.parametrize(
@@ -105,7 +114,12 @@ def test_good_repos(repo: str) -> None:
         "steven.git",
         "steven.GIT",
         "steven.Git",
+        "a" * 101,
+        "." + "a" * 100,
+        ".." + "a" * 99,
+        "a" * 96 + ".gitt",
     ],
 )
 def test_bad_repos(repo: str) -> None:
     assert re.fullmatch(GH_REPO_RGX, repo) is None
+    assert not is_valid_repo_name(repo)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+from collections.abc import Container
+import pytest
+from ghrepo import GHRepo
+from ghrepo.reposet import GHRepoIndex, GHRepoSet
+
+REPOS = [
+    GHRepo("jwodder", "ghrepo"),
+    GHRepo("octocat", "Hello-World"),
+    GHRepo("jwodder", "headerparser"),
+    GHRepo("octocat", "ghrepo"),
+    GHRepo("jwodder", "ghrepo"),
+    GHRepo("JWodder", "ghrepo"),
+]
+
+
+def test_reposet() -> None:
+    s = GHRepoSet(REPOS)
+    assert len(s) == 5
+    assert list(s) == [
+        GHRepo("jwodder", "ghrepo"),
+        GHRepo("octocat", "Hello-World"),
+        GHRepo("jwodder", "headerparser"),
+        GHRepo("octocat", "ghrepo"),
+        GHRepo("JWodder", "ghrepo"),
+    ]
+    assert all(type(r) is GHRepo for r in s)
+    for r in REPOS:
+        assert r in s
+    assert ("jwodder", "ghrepo") in s
+    assert GHRepo("jwodder", "Hello-World") not in s
+    assert GHRepo("nobody", "ghrepo") not in s
+    assert GHRepo("jwodder", "nothing") not in s
+    assert "jwodder/ghrepo" not in s  # type: ignore[comparison-overlap]
+    assert None not in s  # type: ignore[comparison-overlap]
+
+
+def test_reposet_empty() -> None:
+    s = GHRepoSet()
+    assert len(s) == 0
+    assert not s
+    assert list(s) == []
+    assert GHRepo("jwodder", "ghrepo") not in s
+    assert s.names_by_owner() == {}
+    assert repr(s) == "GHRepoSet([])"
+
+
+def test_reposet_add() -> None:
+    s = GHRepoSet()
+    s.add(GHRepo("jwodder", "ghrepo"))
+    s.add(GHRepo("jwodder", "ghrepo"))
+    assert len(s) == 1
+    assert repr(s) == "GHRepoSet([GHRepo(owner='jwodder', name='ghrepo')])"
+
+
+def test_reposet_many() -> None:
+    repos = [GHRepo(f"owner{i % 97}", f"repo{i % 1009}") for i in range(20_000)]
+    s = GHRepoSet(repos)
+    expected = list(dict.fromkeys(repos))
+    assert len(s) == len(expected)
+    assert list(s) == expected
+    assert all(r in s for r in expected)
+    assert GHRepo("owner0", "repo1") not in s
+    assert set(s) == set(expected)
+
+
+def test_reposet_names_by_owner() -> None:
+    s = GHRepoSet(REPOS)
+    assert s.owners() == ["jwodder", "octocat", "JWodder"]
+    assert s.names_by_owner() == {
+        "jwodder": ["ghrepo", "headerparser"],
+        "octocat": ["Hello-World", "ghrepo"],
+        "JWodder": ["ghrepo"],
+    }
+
+
+def test_reposet_set_operations() -> None:
+    s = GHRepoSet(REPOS[:3])
+    t = GHRepoSet(REPOS[2:])
+    both = s & t
+    assert isinstance(both, GHRepoSet)
+    assert set(both) == {
+        GHRepo("jwodder", "ghrepo"),
+        GHRepo("jwodder", "headerparser"),
+    }
+    assert len(s | t) == 5
+    assert GHRepoSet(REPOS[:2]) <= s
+
+
+def test_reposet_footprint() -> None:
+    repos = [GHRepo(f"owner{i % 10}", f"repo{i}") for i in range(1000)]
+    fp = GHRepoSet(repos).footprint()
+    assert 0 < fp.nbytes < fp.list_nbytes
+
+
+@pytest.mark.parametrize("cls", [GHRepoSet, GHRepoIndex])
+def test_contains_tuples(cls: type[GHRepoSet] | type[GHRepoIndex]) -> None:
+    # Typed as a container of anything so that the type checker doesn't
+    # reject probing it with values that aren't `GHRepo`s
+    s: Container[object] = cls(REPOS)
+    assert GHRepo("octocat", "Hello-World") in s
+    assert ("octocat", "Hello-World") in s
+    assert ("octocat",) not in s
+    assert ("octocat", "Hello-World", "extra") not in s
+    assert ("octocat", None) not in s
+    assert (["octocat"], "Hello-World") not in s
+    assert ["octocat", "Hello-World"] not in s
+
+
+def test_casefold_key() -> None:
+    assert GHRepo("JWodder", "GHRepo").casefold_key == "jwodder/ghrepo"
+    assert GHRepo("jwodder", "ghrepo").casefold_key == "jwodder/ghrepo"
+    assert GHRepo("a-b", "c.d_e").casefold_key == "a-b/c.d_e"
+
+
+def test_repoindex() -> None:
+    ix = GHRepoIndex(REPOS)
+    assert len(ix) == 4
+    assert list(ix) == [
+        GHRepo("jwodder", "ghrepo"),
+        GHRepo("octocat", "Hello-World"),
+        GHRepo("jwodder", "headerparser"),
+        GHRepo("octocat", "ghrepo"),
+    ]
+    assert GHRepo("JWODDER", "GHREPO") in ix
+    assert GHRepo("octocat", "hello-world") in ix
+    assert GHRepo("octocat", "nothing") not in ix
+    assert ("jwodder", "ghrepo") in ix
+    assert ("JWodder", "GHRepo") in ix
+    assert ("jwodder", "nothing") not in ix
+    assert ix.get(GHRepo("OctoCat", "HELLO-world")) == GHRepo("octocat", "Hello-World")
+    assert ix.get(GHRepo("octocat", "nothing")) is None
+    assert ix.add(GHRepo("OCTOCAT", "GHREPO")) == GHRepo("octocat", "ghrepo")
+    assert ix.add(GHRepo("OctoCat", "Spoon-Knife")) == GHRepo("OctoCat", "Spoon-Knife")
+    assert len(ix) == 5
+
+
+def test_repoindex_join() -> None:
+    ours = GHRepoIndex([GHRepo("JWodder", "GHRepo"), GHRepo("octocat", "Hello-World")])
+    theirs = [GHRepo("jwodder", "ghrepo"), GHRepo("torvalds", "linux")]
+    assert [r for r in theirs if r in ours] == [GHRepo("jwodder", "ghrepo")]
+    assert set(ours & GHRepoIndex(theirs)) == {GHRepo("jwodder", "ghrepo")}
+    assert repr(GHRepoIndex(theirs[:1])) == (
+        "GHRepoIndex([GHRepo(owner='jwodder', name='ghrepo')])"
+    )
@@ -0,0 +1,143 @@
+from __future__ import annotations
+import json
+from pathlib import Path
+import shutil
+import subprocess
+from conftest import make_repo
+import pytest
+from pytest_mock import MockerFixture
+from ghrepo import GHRepo, NoSuchRemoteError
+from ghrepo.__main__ import main
+from ghrepo.diskcache import LocalRepoCache
+from ghrepo.scan import ScanResult, find_git_repos, resolve_repos, scan_repos
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="Git not installed")
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    make_repo(tmp_path / "a", {"origin": "https://github.com/jwodder/a.git"})
+    make_repo(
+        tmp_path / "a" / "nested", {"origin": "git@github.com:jwodder/nested.git"}
+    )
+    make_repo(tmp_path / "b" / "c")
+    make_repo(tmp_path / "d", {"origin": "https://gitlab.com/jwodder/d.git"})
+    (tmp_path / "e" / "f").mkdir(parents=True)
+    return tmp_path
+
+
+def test_find_git_repos(tree: Path) -> None:
+    assert list(find_git_repos(tree)) == [tree / "a", tree / "b" / "c", tree / "d"]
+    assert list(find_git_repos(tree, nested=True)) == [
+        tree / "a",
+        tree / "a" / "nested",
+        tree / "b" / "c",
+        tree / "d",
+    ]
+    assert list(find_git_repos(tree / "e")) == []
+    assert list(find_git_repos(tree / "nonexistent")) == []
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"max_workers": 1},
+        {"use_git": True},
+        {"use_processes": True, "max_workers": 2},
+    ],
+)
+def test_scan_repos(tree: Path, kwargs: dict) -> None:
+    results = sorted(scan_repos(tree, nested=True, **kwargs))
+    assert [r.path for r in results] == [
+        tree / "a",
+        tree / "a" / "nested",
+        tree / "b" / "c",
+        tree / "d",
+    ]
+    assert results[0] == ScanResult(tree / "a", GHRepo("jwodder", "a"), None)
+    assert results[1] == ScanResult(
+        tree / "a" / "nested", GHRepo("jwodder", "nested"), None
+    )
+    assert results[2].repo is None
+    assert isinstance(results[2].error, NoSuchRemoteError)
+    assert results[3].repo is None
+    assert isinstance(results[3].error, ValueError)
+    assert str(results[3].error) == (
+        "Invalid GitHub URL: 'https://gitlab.com/jwodder/d.git'"
+    )
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"max_workers": 1}, {"use_git": True}])
+def test_resolve_repos(tree: Path, kwargs: dict) -> None:
+    paths = [tree / "d", tree / "a", tree / "e", tree / "a" / "nested"] * 3
+    results = list(resolve_repos(map(str, paths), **kwargs))
+    assert [r.path for r in results] == paths
+    assert [r.repo for r in results] == [
+        None,
+        GHRepo("jwodder", "a"),
+        None,
+        GHRepo("jwodder", "nested"),
+    ] * 3
+    assert isinstance(results[0].error, ValueError)
+    assert isinstance(results[2].error, subprocess.CalledProcessError)
+
+
+def test_resolve_repos_cache(
+    tree: Path, tmp_path_factory: pytest.TempPathFactory, mocker: MockerFixture
+) -> None:
+    cache = LocalRepoCache(tmp_path_factory.mktemp("cache"))
+    spy = mocker.spy(cache, "get_local_repo")
+    results = list(resolve_repos([tree / "a", tree / "b" / "c"], cache=cache))
+    assert results[0] == ScanResult(tree / "a", GHRepo("jwodder", "a"), None)
+    assert isinstance(results[1].error, NoSuchRemoteError)
+    assert spy.call_count == 2
+
+
+def test_scan_command(tree: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["scan", "-j", "1", str(tree)]) == 1
+    out, err = capsys.readouterr()
+    assert sorted(out.splitlines()) == [f"{tree / 'a'}\tjwodder/a"]
+    assert sorted(err.splitlines()) == [
+        f"ghrepo: {tree / 'b' / 'c'}: Remote not found in Git repository: 'origin'",
+        f"ghrepo: {tree / 'd'}: Invalid GitHub URL:"
+        " 'https://gitlab.com/jwodder/d.git'",
+    ]
+
+
+def test_scan_command_json(tree: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    shutil.rmtree(tree / "b")
+    shutil.rmtree(tree / "d")
+    assert main(["scan", "--json", "--nested", str(tree)]) == 0
+    out, err = capsys.readouterr()
+    assert sorted(map(json.loads, out.splitlines()), key=lambda r: r["path"]) == [
+        {"path": str(tree / "a"), "owner": "jwodder", "name": "a", "error": None},
+        {
+            "path": str(tree / "a" / "nested"),
+            "owner": "jwodder",
+            "name": "nested",
+            "error": None,
+        },
+    ]
+    assert err == ""
+
+
+def test_scan_command_json_error(
+    tree: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    assert main(["scan", "--json", str(tree / "d")]) == 1
+    out, err = capsys.readouterr()
+    assert json.loads(out) == {
+        "path": str(tree / "d"),
+        "owner": None,
+        "name": None,
+        "error": "Invalid GitHub URL: 'https://gitlab.com/jwodder/d.git'",
+    }
+    assert err == ""
+
+
+def test_scan_command_bad_jobs(capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        main(["scan", "-j", "0"])
+    assert excinfo.value.code == 2
+    assert "argument -j/--jobs: invalid positive_int value" in capsys.readouterr().err